@@ -1,14 +1,429 @@
-import yaml
+"""
+CONFIG LOADER
+-------------
+Versioned, hot-reloadable enforcement configuration.
+
+- Paths resolve relative to this package (never the working directory)
+- Every config version is an immutable ConfigSnapshot: deep-frozen
+  documents, their content hash and the objects derived from them
+  (e.g. the evaluator set), all built BEFORE the snapshot is published
+- The request path reads CONFIG.snapshot: ONE reference load, no lock,
+  no I/O. A request sees exactly one config version from start to end
+- A watcher thread polls file signatures (mtime / size / inode, one
+  stat() per file); a change is parsed, validated and swapped in off
+  the request path. An invalid version is rejected: the previous
+  snapshot stays active
+- Every activated snapshot is archived by hash, so replay can evaluate
+  a trace against the config it was enforced under
+- config_hash covers the POLICY only (enforcement.yaml + the runtime
+  kill_switch): tuning an operational knob publishes a new snapshot
+  with the same hash
+
+ENFORCEMENT_CONFIG / RUNTIME_CONFIG are the boot snapshot's documents.
+Structural settings read from them at import (trace log layout, cache
+sizing, gateway limits) still take effect on restart only.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+import yaml
+
+BASE_DIR = Path(__file__).resolve().parent
+CONFIG_DIR = BASE_DIR / "config"
+ARCHIVE_DIR = BASE_DIR / "logs" / "config_snapshots"
+
+ENFORCEMENT_FILE = "enforcement.yaml"
+RUNTIME_FILE = "runtime.yaml"
+
+DEFAULT_RELOAD_INTERVAL_MS = 1000
 
-CONFIG_DIR = Path("config")
+# runtime.yaml keys that affect decisions (and so config_hash)
+POLICY_RUNTIME_KEYS = ("kill_switch",)
 
-def load_yaml(name: str):
-    path = CONFIG_DIR / name
+
+class ConfigError(ValueError):
+    """
+    A config version failed to parse or validate.
+    """
+
+
+def load_yaml(name: str, config_dir: Path = CONFIG_DIR):
+    path = Path(config_dir) / name
     if not path.exists():
         raise FileNotFoundError(f"Missing config: {name}")
     with path.open("r", encoding="utf-8") as f:
         return yaml.safe_load(f)
 
-ENFORCEMENT_CONFIG = load_yaml("enforcement.yaml")
-RUNTIME_CONFIG = load_yaml("runtime.yaml")
+
+# -------------------------------------------------
+# IMMUTABLE DOCUMENTS
+# -------------------------------------------------
+
+class FrozenDict(dict):
+    """
+    Read-only dict. Still a dict for .get(), iteration and json;
+    deepcopy() returns a plain, mutable dict.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Config snapshots are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __deepcopy__(self, memo):
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+def freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def config_hash(enforcement: Mapping, runtime: Mapping) -> str:
+    """
+    Content hash of one POLICY version (canonical JSON, sha256).
+
+    Scope: everything in enforcement.yaml, plus the runtime.yaml keys in
+    POLICY_RUNTIME_KEYS. Operational knobs (cache, trace writer,
+    instrumentation, gateway, ...) cannot change a verdict, so tuning
+    them neither invalidates cached verdicts nor breaks replay.
+    """
+    raw = json.dumps(
+        {
+            "enforcement": enforcement,
+            "runtime": {key: runtime[key] for key in POLICY_RUNTIME_KEYS if key in runtime},
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=True,
+        default=str,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    One config version. Never mutated after publication.
+    """
+
+    enforcement: FrozenDict
+    runtime: FrozenDict
+    config_hash: str                                   # policy scope, see config_hash()
+    kill_switch: bool                                  # static runtime.yaml switch
+    derived: FrozenDict = field(default_factory=FrozenDict)
+    source: Optional[Tuple] = None                     # file signatures it was read from
+
+
+# -------------------------------------------------
+# VALIDATION (OFF THE REQUEST PATH)
+# -------------------------------------------------
+
+def validate_evaluators(evaluators: Any, source: str = ENFORCEMENT_FILE) -> None:
+    """
+    Checks for one policy (the enforcement.yaml `evaluators` section).
+    Raises ConfigError.
+    """
+    evaluators = evaluators or {}
+    if not isinstance(evaluators, Mapping):
+        raise ConfigError(f"{source}: evaluators must be a mapping")
+    for name, settings in evaluators.items():
+        if settings is not None and not isinstance(settings, Mapping):
+            raise ConfigError(f"{source}: evaluators.{name} must be a mapping")
+
+    threshold = (evaluators.get("dependency_tone") or {}).get("threshold")
+    if threshold is not None and (
+        isinstance(threshold, bool)
+        or not isinstance(threshold, (int, float))
+        or not 0.0 <= threshold <= 1.0
+    ):
+        raise ConfigError(f"{source}: dependency_tone.threshold must be in [0, 1]")
+
+    regions = (evaluators.get("region_restriction") or {}).get("restricted_regions")
+    if regions is not None and (
+        not isinstance(regions, (list, tuple))
+        or not all(isinstance(r, str) for r in regions)
+    ):
+        raise ConfigError(
+            f"{source}: region_restriction.restricted_regions must be a list of strings"
+        )
+
+
+def validate(enforcement: Any, runtime: Any) -> None:
+    """
+    Structural checks for one config version. Raises ConfigError.
+    """
+    if not isinstance(enforcement, Mapping):
+        raise ConfigError(f"{ENFORCEMENT_FILE}: expected a mapping")
+    if not isinstance(runtime, Mapping):
+        raise ConfigError(f"{RUNTIME_FILE}: expected a mapping")
+
+    validate_evaluators(enforcement.get("evaluators"))
+
+    if not isinstance(runtime.get("kill_switch", False), bool):
+        raise ConfigError(f"{RUNTIME_FILE}: kill_switch must be true or false")
+
+
+# -------------------------------------------------
+# MANAGER
+# -------------------------------------------------
+
+class ConfigManager:
+    """
+    Owns the active ConfigSnapshot and publishes new versions.
+    """
+
+    def __init__(
+        self,
+        config_dir: Path = CONFIG_DIR,
+        *,
+        archive_dir: Optional[Path] = ARCHIVE_DIR,
+    ):
+        self.config_dir = Path(config_dir)
+        self.archive_dir = Path(archive_dir) if archive_dir is not None else None
+        self.reloads = 0
+        self.reload_failures = 0
+        self.last_error: Optional[str] = None
+
+        self._derivers: Dict[str, Callable[[ConfigSnapshot], Any]] = {}
+        self._archived: Dict[str, ConfigSnapshot] = {}
+        self._reload_lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        # Boot: an invalid config is fatal (nothing to fall back to)
+        self.snapshot: ConfigSnapshot = self._load()
+        self._archive(self.snapshot)
+
+    # -------------------------------
+    # REQUEST PATH
+    # -------------------------------
+
+    def current(self) -> ConfigSnapshot:
+        return self.snapshot
+
+    # -------------------------------
+    # CONTROL PATH
+    # -------------------------------
+
+    def register_derived(self, name: str, build: Callable[[ConfigSnapshot], Any]) -> None:
+        """
+        Build an object from every config version at publication time
+        (snapshot.derived[name]). Applied to the active snapshot now.
+        """
+        with self._reload_lock:
+            self._derivers[name] = build
+            snapshot = self.snapshot
+            self.snapshot = replace(
+                snapshot,
+                derived=FrozenDict({**snapshot.derived, name: build(snapshot)}),
+            )
+
+    def check(self) -> bool:
+        """
+        Reload if a config file changed on disk. True if a new
+        version was published.
+        """
+        if self._signature() == self.snapshot.source:
+            return False
+        return self.reload()
+
+    def reload(self) -> bool:
+        """
+        Parse, validate and publish the on-disk config. On failure the
+        active snapshot is kept and the error recorded. MUST NEVER throw.
+        """
+        with self._reload_lock:
+            try:
+                candidate = self._load()
+            except Exception as exc:
+                self.reload_failures += 1
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                # Do not retry the same broken files on every poll
+                self.snapshot = replace(self.snapshot, source=self._signature())
+                return False
+
+            self.last_error = None
+            active = self.snapshot
+            if (
+                candidate.enforcement == active.enforcement
+                and candidate.runtime == active.runtime
+            ):
+                self.snapshot = replace(active, source=candidate.source)
+                return False
+
+            # An operational-only change keeps config_hash: published,
+            # but cached verdicts and the archive entry stay valid
+            self.snapshot = candidate      # atomic publication
+            self.reloads += 1
+
+        self._archive(candidate)
+        return True
+
+    def build(
+        self,
+        enforcement: Any,
+        runtime: Any,
+        *,
+        source: Optional[Tuple] = None,
+    ) -> ConfigSnapshot:
+        """
+        Validated snapshot of these documents, derived objects built.
+        NOT published. Raises ConfigError / deriver errors.
+        """
+        validate(enforcement, runtime)
+        enforcement = freeze(enforcement)
+        runtime = freeze(runtime)
+        snapshot = ConfigSnapshot(
+            enforcement=enforcement,
+            runtime=runtime,
+            config_hash=config_hash(enforcement, runtime),
+            kill_switch=runtime.get("kill_switch") is True,
+            source=source,
+        )
+        if not self._derivers:
+            return snapshot
+        # A deriver that fails rejects the whole version
+        return replace(
+            snapshot,
+            derived=FrozenDict({name: build(snapshot) for name, build in self._derivers.items()}),
+        )
+
+    def archived(self, config_hash: str) -> Optional[ConfigSnapshot]:
+        """
+        The archived snapshot with this hash (derived objects rebuilt),
+        or None if it was never archived here.
+        """
+        if config_hash == self.snapshot.config_hash:
+            return self.snapshot
+        cached = self._archived.get(config_hash)
+        if cached is not None or self.archive_dir is None:
+            return cached
+
+        path = self.archive_dir / f"{config_hash}.json"
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                stored = json.load(f)
+            snapshot = self.build(stored["enforcement"], stored["runtime"], source=None)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if snapshot.config_hash != config_hash:
+            return None
+
+        self._archived[config_hash] = snapshot
+        return snapshot
+
+    def start_watching(self, interval_ms: Optional[float] = None) -> None:
+        """
+        Poll the config files from a daemon thread (idempotent).
+        """
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        if interval_ms is None:
+            settings = self.snapshot.runtime.get("config_reload") or {}
+            interval_ms = settings.get("interval_ms", DEFAULT_RELOAD_INTERVAL_MS)
+
+        self._stop.clear()
+        self._watcher = threading.Thread(
+            target=self._watch,
+            args=(max(float(interval_ms), 1.0) / 1000.0,),
+            name="config-watcher",
+            daemon=True,
+        )
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=5)
+            self._watcher = None
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "config_hash": self.snapshot.config_hash,
+            "config_dir": str(self.config_dir),
+            "reloads": self.reloads,
+            "reload_failures": self.reload_failures,
+            "last_error": self.last_error,
+            "watching": self._watcher is not None and self._watcher.is_alive(),
+        }
+
+    # -------------------------------
+    # INTERNAL
+    # -------------------------------
+
+    def _watch(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.check()
+            except Exception:
+                # THE WATCHER MUST NEVER DIE
+                pass
+
+    def _signature(self) -> Tuple:
+        signature = []
+        for name in (ENFORCEMENT_FILE, RUNTIME_FILE):
+            try:
+                st = os.stat(self.config_dir / name)
+                signature.append((st.st_mtime_ns, st.st_size, st.st_ino))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _load(self) -> ConfigSnapshot:
+        # Signature BEFORE reading: a write racing the read leaves a
+        # stale signature, so the next check() reloads again.
+        source = self._signature()
+        try:
+            enforcement = load_yaml(ENFORCEMENT_FILE, self.config_dir)
+            runtime = load_yaml(RUNTIME_FILE, self.config_dir)
+        except yaml.YAMLError as exc:
+            raise ConfigError(str(exc)) from exc
+        return self.build(enforcement, runtime, source=source)
+
+    def _archive(self, snapshot: ConfigSnapshot) -> None:
+        if self.archive_dir is None:
+            return
+        try:
+            path = self.archive_dir / f"{snapshot.config_hash}.json"
+            if path.exists():
+                return
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp.write_text(
+                json.dumps(
+                    {
+                        "config_hash": snapshot.config_hash,
+                        "enforcement": snapshot.enforcement,
+                        "runtime": snapshot.runtime,
+                    },
+                    indent=2,
+                    sort_keys=True,
+                    default=str,
+                ),
+                encoding="utf-8",
+            )
+            os.replace(tmp, path)
+        except Exception:
+            # ARCHIVING MUST NEVER BLOCK ENFORCEMENT
+            pass
+
+
+CONFIG = ConfigManager()
+
+ENFORCEMENT_CONFIG = CONFIG.snapshot.enforcement
+RUNTIME_CONFIG = CONFIG.snapshot.runtime
@@ -7,24 +7,138 @@ FINAL AUTHORITY.
 Returns ONLY EnforcementVerdict.
 """
 
-from evaluator_modules import ALL_EVALUATORS
-from logs.bucket_logger import log_enforcement
-from config_loader import RUNTIME_CONFIG
-from utils.deterministic_trace import generate_trace_id
-from validators.akanksha.enforcement_adapter import EnforcementAdapter
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import List, Optional, Sequence, Tuple
+
+from evaluator_modules import build_evaluators
+from logs.bucket_logger import (
+    NullSink,
+    log_enforcement,
+    log_enforcement_async,
+    log_enforcement_many,
+    use_log_sink,
+)
+from config_loader import CONFIG, RUNTIME_CONFIG, ConfigSnapshot
+from utils.deadline import Deadline, DeadlineExceeded
+from utils.deterministic_trace import CanonicalSnapshot, generate_trace_id
+from utils.kill_switch import from_config as kill_switch_from_config
+from utils.metrics import LabeledCounter, StageMetrics, StageTimer
+from utils.single_flight import SingleFlight
+from utils.verdict_cache import VerdictCache
+from validators.akanksha.validator_manager import ValidatorManager
 
 from enforcement_verdict import EnforcementVerdict
 
 # STRICT PRIORITY — DO NOT CHANGE
 DECISION_PRIORITY = ["BLOCK", "REWRITE", "EXECUTE"]
 
+BASE_DIR = Path(__file__).resolve().parent
+
+# Every config version carries its own evaluator set, built when the
+# version is published (never on the request path).
+CONFIG.register_derived(
+    "evaluators",
+    lambda snapshot: tuple(build_evaluators(snapshot.enforcement.get("evaluators"))),
+)
+
+# Global kill switch: the static config switch (read from the active
+# snapshot, so a config reload can set or clear it) OR the shared flag
+# file, which any process can toggle (tools/kill_switch.py).
+KILL_SWITCH = kill_switch_from_config(RUNTIME_CONFIG, BASE_DIR, static=False)
+
+# Akanksha: built, warmed and self-tested ONCE per process; shared by
+# every request and replaced atomically (AKANKSHA.install).
+AKANKSHA = ValidatorManager()
+
+# In-process verdict cache (None when disabled in runtime.yaml)
+_CACHE_CONFIG = RUNTIME_CONFIG.get("verdict_cache") or {}
+VERDICT_CACHE = (
+    VerdictCache(
+        max_entries=_CACHE_CONFIG.get("max_entries", 10000),
+        ttl_seconds=_CACHE_CONFIG.get("ttl_seconds", 300),
+    )
+    if _CACHE_CONFIG.get("enabled", False)
+    else None
+)
+
+# Sampled per-stage latency histograms (observational only)
+_INSTRUMENTATION_CONFIG = RUNTIME_CONFIG.get("instrumentation") or {}
+STAGE_METRICS = StageMetrics(
+    sample_rate=(
+        _INSTRUMENTATION_CONFIG.get("sample_rate", 0.01)
+        if _INSTRUMENTATION_CONFIG.get("enabled", False)
+        else 0
+    ),
+    attach_to_trace=_INSTRUMENTATION_CONFIG.get("attach_to_trace", False),
+)
+
+# Audited verdicts by (decision, reason_code); exported on /metrics
+VERDICT_COUNTER = LabeledCounter()
 
-def _canonical_trace_payload(input_payload) -> dict:
+# Replay runs bypass the cache (every stage is re-evaluated) and the
+# shared kill-switch flag (live runtime state, not part of any config
+# version: a replay must not depend on it).
+_REPLAYING: ContextVar = ContextVar("enforcement_replaying", default=False)
+
+# Replay against an archived config version instead of the active one.
+_REPLAY_CONFIG: ContextVar = ContextVar("enforcement_replay_config", default=None)
+
+
+@contextmanager
+def replay_mode(sink=None, config: Optional[ConfigSnapshot] = None):
+    """
+    Side-effect-free enforcement context.
+
+    Runs the full deterministic pipeline (no verdict cache, no shared
+    kill-switch flag) while every audit record goes to sink (default:
+    discarded) instead of the log.
+    config: evaluate under this snapshot (e.g. CONFIG.archived(hash))
+    instead of the active one.
+    """
+    token = _REPLAYING.set(True)
+    config_token = _REPLAY_CONFIG.set(config)
+    try:
+        with use_log_sink(sink if sink is not None else NullSink()):
+            yield
+    finally:
+        _REPLAY_CONFIG.reset(config_token)
+        _REPLAYING.reset(token)
+
+
+def replay_config(config_hash: Optional[str]) -> Tuple[Optional[ConfigSnapshot], bool]:
+    """
+    (config, available) for replaying a record written under
+    config_hash; pass config to replay_mode().
+
+    Legacy records (no hash) replay under the active config. A hash
+    that is no longer archived here is NOT available: the replay runs
+    under the active config and its decision is not comparable.
+    """
+    if config_hash is None:
+        return None, True
+    config = CONFIG.archived(config_hash)
+    return config, config is not None
+
+
+def _active_config() -> ConfigSnapshot:
+    # One reference load; read ONCE per request / batch.
+    return _REPLAY_CONFIG.get() or CONFIG.snapshot
+
+
+def _canonical_trace_payload(input_payload) -> CanonicalSnapshot:
     """
     SINGLE SOURCE OF TRUTH for trace hashing & replay.
     MUST be identical during live run and replay.
+
+    Encoded once here; the trace ID, verdict-cache key and audit
+    record line all reuse that encoding.
     """
-    return {
+    return CanonicalSnapshot({
         "intent": input_payload.intent,
         "emotional_output": input_payload.emotional_output,
         "age_gate_status": input_payload.age_gate_status,
@@ -32,24 +146,160 @@ def _canonical_trace_payload(input_payload) -> dict:
         "platform_policy": input_payload.platform_policy,
         "karma_score": input_payload.karma_score,
         "risk_flags": input_payload.risk_flags,
-    }
+    })
 
 
-def enforce(input_payload) -> EnforcementVerdict:
+@dataclass(frozen=True)
+class EnforcementOutcome:
+    """
+    Verdict plus the evidence its audit record is built from.
+    Produced by evaluate() (pure); recorded by record_outcome().
+    """
+
+    verdict: EnforcementVerdict
+    trace_payload: CanonicalSnapshot
+    akanksha_verdict: Optional[dict]
+    evaluator_results: List
+    config_hash: Optional[str] = None    # config version it was evaluated under
+
+
+def enforce(
+    input_payload,
+    *,
+    single_flight: Optional[SingleFlight] = None,
+    deadline: Optional[Deadline] = None,
+) -> EnforcementVerdict:
     """
     Sole enforcement entrypoint.
     ALWAYS returns EnforcementVerdict.
+
+    single_flight: concurrent calls with an identical canonical
+    payload share ONE evaluation; each caller is still audited.
+    deadline: time budget; on expiry the verdict is TERMINATE
+    (DEADLINE_EXCEEDED). Coalesced callers share the leader's budget.
     """
 
+    outcome, timer, coalesced = _evaluate_for_caller(input_payload, single_flight, deadline)
+
     # -------------------------------------------------
-    # STEP 0 — CANONICAL INPUT SNAPSHOT (LOCKED)
+    # STEP 7 — AUDIT LOG (REPLAYABLE, CACHE HITS INCLUDED)
+    # -------------------------------------------------
+    record_outcome(outcome, timer=timer, coalesced=coalesced)
+
+    if timer is not None:
+        timer.mark("audit_log")
+        STAGE_METRICS.record(timer)
+
+    # -------------------------------------------------
+    # STEP 8 — RETURN FINAL VERDICT
+    # -------------------------------------------------
+    return outcome.verdict
+
+
+async def enforce_async(
+    input_payload,
+    *,
+    single_flight: Optional[SingleFlight] = None,
+    deadline: Optional[Deadline] = None,
+) -> EnforcementVerdict:
+    """
+    Event-loop form of enforce(). Identical verdict, trace ID and
+    audit record.
+
+    STEPS 0–6 run in the default executor (caller's context: replay
+    mode, log sink), never on the loop: the loop keeps serving while
+    a request evaluates, and a coalesced caller waits for its leader
+    on a worker thread. The audit log (STEP 7) is awaited: handed to
+    the background writer, or to the executor when that would block.
+    """
+
+    context = copy_context()
+    outcome, timer, coalesced = await asyncio.get_running_loop().run_in_executor(
+        None,
+        context.run,
+        _evaluate_for_caller,
+        input_payload,
+        single_flight,
+        deadline,
+    )
+
+    # -------------------------------------------------
+    # STEP 7 — AUDIT LOG (AWAITED, NEVER BLOCKS THE LOOP)
+    # -------------------------------------------------
+    await record_outcome_async(outcome, timer=timer, coalesced=coalesced)
+
+    if timer is not None:
+        timer.mark("audit_log")
+        STAGE_METRICS.record(timer)
+
+    # -------------------------------------------------
+    # STEP 8 — RETURN FINAL VERDICT
     # -------------------------------------------------
+    return outcome.verdict
+
+
+def _evaluate_for_caller(input_payload, single_flight, deadline):
+    """
+    (outcome, timer, coalesced) for one enforce() / enforce_async() call.
+    """
+
+    # Unsampled requests pay one C-level call here.
+    timer = StageTimer() if STAGE_METRICS.sample_next() else None
+
+    if single_flight is None:
+        return evaluate(input_payload, timer=timer, deadline=deadline), timer, False
+
     trace_payload = _canonical_trace_payload(input_payload)
+    outcome, coalesced = single_flight.do(
+        trace_payload.canonical,
+        lambda: evaluate(
+            input_payload,
+            timer=timer,
+            trace_payload=trace_payload,
+            deadline=deadline,
+        ),
+    )
+    # A coalesced caller has no stages of its own to time.
+    return outcome, (None if coalesced else timer), coalesced
+
+
+def evaluate(
+    input_payload,
+    *,
+    timer: Optional[StageTimer] = None,
+    trace_payload: Optional[CanonicalSnapshot] = None,
+    deadline: Optional[Deadline] = None,
+) -> EnforcementOutcome:
+    """
+    Deterministic evaluation (STEPS 0–6).
+    NO logging. Identical inputs under an identical config
+    are served from VERDICT_CACHE.
+
+    timer (sampled requests only) records per-stage latency.
+    trace_payload: the input's snapshot, if the caller already built it.
+    deadline: checked before STEPS 2 and 3 and inside Akanksha's
+    pattern scan; expiry → TERMINATE (DEADLINE_EXCEEDED), not cached.
+    """
+
+    # The whole evaluation runs under ONE config version.
+    config = _active_config()
+
+    # -------------------------------------------------
+    # STEP 0 — CANONICAL INPUT SNAPSHOT (LOCKED)
+    # -------------------------------------------------
+    if trace_payload is None:
+        trace_payload = _canonical_trace_payload(input_payload)
+    if timer is not None:
+        timer.mark("canonical_snapshot")
 
     # -------------------------------------------------
     # STEP 1 — GLOBAL KILL SWITCH (ABSOLUTE)
     # -------------------------------------------------
-    if RUNTIME_CONFIG.get("kill_switch") is True:
+    kill_switch = _kill_switch_engaged(config)
+    if timer is not None:
+        timer.mark("kill_switch")
+
+    if kill_switch:
         trace_id = generate_trace_id(
             input_payload=trace_payload,
             enforcement_category="TERMINATE",
@@ -62,28 +312,76 @@ def enforce(input_payload) -> EnforcementVerdict:
             reason_code="GLOBAL_KILL_SWITCH",
         )
 
-        log_enforcement(
-            trace_id=trace_id,
-            input_snapshot=trace_payload,
+        return EnforcementOutcome(
+            verdict=verdict,
+            trace_payload=trace_payload,
             akanksha_verdict=None,
             evaluator_results=[],
-            final_decision=verdict.decision,
+            config_hash=config.config_hash,
         )
-        return verdict
+
+    # -------------------------------------------------
+    # STEP 1b — VERDICT CACHE (PURE FUNCTION OF INPUT + CONFIG)
+    # -------------------------------------------------
+    use_cache = VERDICT_CACHE is not None and not _REPLAYING.get()
+    if use_cache:
+        cache_key = trace_payload.canonical
+        # A new config version or Akanksha validator invalidates the
+        # cache wholesale. The generation is read BEFORE the adapter
+        # (STEP 3) and install() publishes the adapter first, so an
+        # outcome is never cached under a newer generation than the
+        # validator that produced it.
+        fingerprint = (config.config_hash, AKANKSHA.generation)
+        cached = VERDICT_CACHE.get(cache_key, fingerprint)
+        if timer is not None:
+            timer.mark("cache_lookup")
+        if cached is not None:
+            return cached
 
     # -------------------------------------------------
     # STEP 2 — RUN RAJ EVALUATORS
     # -------------------------------------------------
-    evaluator_results = [e.evaluate(input_payload) for e in ALL_EVALUATORS]
+    if deadline is not None and deadline.expired():
+        return _terminate_outcome(trace_payload, [], config, "DEADLINE_EXCEEDED")
+
+    evaluators = config.derived["evaluators"]
+    try:
+        if timer is None:
+            evaluator_results = [e.evaluate(input_payload) for e in evaluators]
+        else:
+            evaluator_results = []
+            for e in evaluators:
+                started = perf_counter()
+                evaluator_results.append(e.evaluate(input_payload))
+                timer.evaluator(e.name, perf_counter() - started)
+    except Exception:
+        # 🔒 FAIL-CLOSED — an evaluator raised on this input; the
+        # record keeps the results that did complete.
+        completed = [_evaluate_or_none(e, input_payload) for e in evaluators]
+        return _terminate_outcome(
+            trace_payload,
+            [r for r in completed if r is not None],
+            config,
+            "EVALUATOR_FAILED",
+        )
     raj_decision = _resolve_raj_decision(evaluator_results)
+    if timer is not None:
+        timer.mark("raj_evaluators")
 
     # -------------------------------------------------
     # STEP 3 — RUN AKANKSHA (MANDATORY, FAIL-CLOSED)
     # -------------------------------------------------
+    if deadline is not None and deadline.expired():
+        return _terminate_outcome(trace_payload, evaluator_results, config, "DEADLINE_EXCEEDED")
+
     try:
-        adapter = EnforcementAdapter()
-        akanksha_result = adapter.validate(input_payload)
+        adapter = AKANKSHA.current()
+        akanksha_result = adapter.validate(input_payload, deadline=deadline)
         ak_decision = akanksha_result["decision"]
+        if timer is not None:
+            timer.mark("akanksha")
+    except DeadlineExceeded:
+        return _terminate_outcome(trace_payload, evaluator_results, config, "DEADLINE_EXCEEDED")
     except Exception:
         trace_id = generate_trace_id(
             input_payload=trace_payload,
@@ -97,14 +395,14 @@ def enforce(input_payload) -> EnforcementVerdict:
             reason_code="AKANKSHA_VALIDATION_FAILED",
         )
 
-        log_enforcement(
-            trace_id=trace_id,
-            input_snapshot=trace_payload,
+        # Failures are never cached.
+        return EnforcementOutcome(
+            verdict=verdict,
+            trace_payload=trace_payload,
             akanksha_verdict=None,
             evaluator_results=evaluator_results,
-            final_decision=verdict.decision,
+            config_hash=config.config_hash,
         )
-        return verdict
 
     # -------------------------------------------------
     # STEP 4 — FINAL DECISION RESOLUTION
@@ -113,6 +411,8 @@ def enforce(input_payload) -> EnforcementVerdict:
         raj_decision=raj_decision,
         ak_decision=ak_decision,
     )
+    if timer is not None:
+        timer.mark("resolution")
 
     # -------------------------------------------------
     # STEP 5 — TRACE ID (BEFORE VERDICT — IMMUTABLE)
@@ -125,68 +425,354 @@ def enforce(input_payload) -> EnforcementVerdict:
         input_payload=trace_payload,
         enforcement_category=public_decision,
     )
+    if timer is not None:
+        timer.mark("trace_id")
 
     # -------------------------------------------------
     # STEP 6 — CONSTRUCT FINAL VERDICT (NO MUTATION)
     # -------------------------------------------------
-    if final_decision == "EXECUTE":
-        verdict = EnforcementVerdict(
-            decision="ALLOW",
-            scope="both",
-            trace_id=trace_id,
-            reason_code="CONTENT_AND_ACTION_ALLOWED",
-        )
+    outcome = EnforcementOutcome(
+        verdict=_build_verdict(final_decision, trace_id),
+        trace_payload=trace_payload,
+        akanksha_verdict={
+            "decision": ak_decision,
+            "risk_category": akanksha_result.get("risk_category"),
+            "confidence": akanksha_result.get("confidence"),
+        },
+        evaluator_results=evaluator_results,
+        config_hash=config.config_hash,
+    )
 
-    elif final_decision == "REWRITE":
-        verdict = EnforcementVerdict(
-            decision="REWRITE",
-            scope="response",
-            trace_id=trace_id,
-            reason_code="SAFE_REWRITE_REQUIRED",
-            rewrite_class="DETERMINISTIC_REWRITE",
+    if use_cache:
+        VERDICT_CACHE.put(cache_key, fingerprint, outcome)
+    if timer is not None:
+        timer.mark("verdict")
+
+    return outcome
+
+
+def record_outcome(
+    outcome: EnforcementOutcome,
+    *,
+    timer: Optional[StageTimer] = None,
+    coalesced: bool = False,
+) -> None:
+    """
+    Emit the replayable audit record for an outcome.
+    MUST NEVER throw (log_enforcement guarantees this).
+
+    Sampled requests carry their stage timings (STEPS 0–6)
+    when instrumentation.attach_to_trace is set; coalesced callers
+    are marked as such.
+    """
+
+    log_enforcement(**_audit_entry(outcome, timer, coalesced))
+
+
+async def record_outcome_async(
+    outcome: EnforcementOutcome,
+    *,
+    timer: Optional[StageTimer] = None,
+    coalesced: bool = False,
+) -> None:
+    """
+    record_outcome() for event-loop callers (same record).
+    """
+
+    await log_enforcement_async(**_audit_entry(outcome, timer, coalesced))
+
+
+def _audit_entry(outcome: EnforcementOutcome, timer, coalesced: bool) -> dict:
+    verdict = outcome.verdict
+    VERDICT_COUNTER.inc((verdict.decision, verdict.reason_code))
+
+    entry = {
+        "trace_id": verdict.trace_id,
+        "input_snapshot": outcome.trace_payload,
+        "akanksha_verdict": outcome.akanksha_verdict,
+        "evaluator_results": outcome.evaluator_results,
+        "final_decision": verdict.decision,
+        "config_hash": outcome.config_hash,
+    }
+    if timer is not None and STAGE_METRICS.attach_to_trace:
+        entry["stage_timings"] = timer.as_trace_field()
+    if coalesced:
+        entry["coalesced"] = True
+    if verdict.reason_code == "DEADLINE_EXCEEDED":
+        entry["deadline_exceeded"] = True
+    if verdict.reason_code == "GLOBAL_KILL_SWITCH":
+        entry["kill_switch"] = True
+    return entry
+
+
+def stage_metrics_snapshot() -> dict:
+    """
+    Merged per-stage / per-evaluator latency histograms.
+    """
+    return STAGE_METRICS.snapshot()
+
+
+def reset_stage_metrics() -> None:
+    STAGE_METRICS.reset()
+
+
+def enforce_many(
+    input_payloads: Sequence,
+    *,
+    deadline: Optional[Deadline] = None,
+) -> List[EnforcementVerdict]:
+    """
+    Batch enforcement entrypoint.
+
+    Evaluates the whole batch column by column and commits the
+    audit log ONCE. Element i is identical (decision, reason,
+    trace_id) to enforce(input_payloads[i]); an evaluator that
+    raises on one element fails only that element (TERMINATE,
+    EVALUATOR_FAILED).
+
+    deadline: ONE budget for the batch, checked before STEPS 2 and 3;
+    expiry → every element TERMINATE (DEADLINE_EXCEEDED).
+    """
+
+    inputs = list(input_payloads)
+    if not inputs:
+        return []
+
+    # The whole batch runs under ONE config version.
+    config = _active_config()
+
+    # -------------------------------------------------
+    # STEP 0 — CANONICAL INPUT SNAPSHOTS (LOCKED)
+    # -------------------------------------------------
+    trace_payloads = [_canonical_trace_payload(p) for p in inputs]
+
+    # -------------------------------------------------
+    # STEP 1 — GLOBAL KILL SWITCH (ABSOLUTE)
+    # -------------------------------------------------
+    if _kill_switch_engaged(config):
+        return _terminate_many(
+            trace_payloads,
+            [[] for _ in inputs],
+            config,
+            "GLOBAL_KILL_SWITCH",
         )
 
-    elif final_decision == "BLOCK":
-        verdict = EnforcementVerdict(
-            decision="BLOCK",
-            scope="both",
-            trace_id=trace_id,
-            reason_code="POLICY_VIOLATION",
+    # -------------------------------------------------
+    # STEP 2 — RUN RAJ EVALUATORS (COLUMNAR)
+    # -------------------------------------------------
+    if deadline is not None and deadline.expired():
+        return _terminate_many(
+            trace_payloads,
+            [[] for _ in inputs],
+            config,
+            "DEADLINE_EXCEEDED",
         )
 
-    else:  # TERMINATE
-        verdict = EnforcementVerdict(
-            decision="TERMINATE",
-            scope="both",
-            trace_id=trace_id,
-            reason_code="SYSTEM_TERMINATION",
+    evaluator_rows, evaluator_failed = _evaluator_rows(config.derived["evaluators"], inputs)
+
+    # -------------------------------------------------
+    # STEP 3 — RUN AKANKSHA OVER THE BATCH (FAIL-CLOSED)
+    # -------------------------------------------------
+    if deadline is not None and deadline.expired():
+        return _terminate_many(
+            trace_payloads,
+            evaluator_rows,
+            config,
+            "DEADLINE_EXCEEDED",
         )
 
+    try:
+        akanksha_results = AKANKSHA.current().validate_many(inputs)
+    except Exception:
+        akanksha_results = [None] * len(inputs)
+
     # -------------------------------------------------
-    # STEP 7 — AUDIT LOG (REPLAYABLE)
+    # STEP 4..6 — RESOLUTION, TRACE ID, VERDICT
     # -------------------------------------------------
-    log_enforcement(
-        trace_id=trace_id,
-        input_snapshot=trace_payload,
-        akanksha_verdict={
-            "decision": ak_decision,
-            "risk_category": akanksha_result.get("risk_category"),
-            "confidence": akanksha_result.get("confidence"),
-        },
-        evaluator_results=evaluator_results,
-        final_decision=verdict.decision,
-    )
+    verdicts = []
+    log_entries = []
+    for trace_payload, evaluator_results, failed, akanksha_result in zip(
+        trace_payloads, evaluator_rows, evaluator_failed, akanksha_results
+    ):
+        if failed:
+            # 🔒 FAIL-CLOSED for this element only (as enforce())
+            trace_id = generate_trace_id(
+                input_payload=trace_payload,
+                enforcement_category="TERMINATE",
+            )
+            verdict = EnforcementVerdict(
+                decision="TERMINATE",
+                scope="both",
+                trace_id=trace_id,
+                reason_code="EVALUATOR_FAILED",
+            )
+            akanksha_verdict = None
+        elif akanksha_result is None:
+            trace_id = generate_trace_id(
+                input_payload=trace_payload,
+                enforcement_category="TERMINATE",
+            )
+            verdict = EnforcementVerdict(
+                decision="TERMINATE",
+                scope="both",
+                trace_id=trace_id,
+                reason_code="AKANKSHA_VALIDATION_FAILED",
+            )
+            akanksha_verdict = None
+        else:
+            ak_decision = akanksha_result["decision"]
+            final_decision = _resolve_final_decision(
+                raj_decision=_resolve_raj_decision(evaluator_results),
+                ak_decision=ak_decision,
+            )
+            public_decision = (
+                "ALLOW" if final_decision == "EXECUTE" else final_decision
+            )
+            trace_id = generate_trace_id(
+                input_payload=trace_payload,
+                enforcement_category=public_decision,
+            )
+            verdict = _build_verdict(final_decision, trace_id)
+            akanksha_verdict = {
+                "decision": ak_decision,
+                "risk_category": akanksha_result.get("risk_category"),
+                "confidence": akanksha_result.get("confidence"),
+            }
+
+        verdicts.append(verdict)
+        log_entries.append({
+            "trace_id": trace_id,
+            "input_snapshot": trace_payload,
+            "akanksha_verdict": akanksha_verdict,
+            "evaluator_results": evaluator_results,
+            "final_decision": verdict.decision,
+            "config_hash": config.config_hash,
+        })
 
     # -------------------------------------------------
-    # STEP 8 — RETURN FINAL VERDICT
+    # STEP 7 — AUDIT LOG (ONE COMMIT PER BATCH)
     # -------------------------------------------------
-    return verdict
+    log_enforcement_many(log_entries)
+    _count_verdicts(verdicts)
+
+    return verdicts
 
 
 # -------------------------------------------------
 # INTERNAL HELPERS
 # -------------------------------------------------
 
+def _terminate_outcome(
+    trace_payload: CanonicalSnapshot,
+    evaluator_results,
+    config: ConfigSnapshot,
+    reason_code: str,
+) -> EnforcementOutcome:
+    """
+    Time budget exhausted or an evaluator raised: FAIL CLOSED.
+    Never cached.
+    """
+    verdict = EnforcementVerdict(
+        decision="TERMINATE",
+        scope="both",
+        trace_id=generate_trace_id(
+            input_payload=trace_payload,
+            enforcement_category="TERMINATE",
+        ),
+        reason_code=reason_code,
+    )
+    return EnforcementOutcome(
+        verdict=verdict,
+        trace_payload=trace_payload,
+        akanksha_verdict=None,
+        evaluator_results=evaluator_results,
+        config_hash=config.config_hash,
+    )
+
+
+def _terminate_many(
+    trace_payloads,
+    evaluator_rows,
+    config: ConfigSnapshot,
+    reason_code: str,
+) -> List[EnforcementVerdict]:
+    """
+    enforce_many() short-circuit: every element TERMINATE with one
+    reason (kill switch, deadline), audited in ONE commit. Flags
+    match _audit_entry().
+    """
+    verdicts = []
+    log_entries = []
+    for trace_payload, evaluator_results in zip(trace_payloads, evaluator_rows):
+        trace_id = generate_trace_id(
+            input_payload=trace_payload,
+            enforcement_category="TERMINATE",
+        )
+        verdict = EnforcementVerdict(
+            decision="TERMINATE",
+            scope="both",
+            trace_id=trace_id,
+            reason_code=reason_code,
+        )
+        verdicts.append(verdict)
+        entry = {
+            "trace_id": trace_id,
+            "input_snapshot": trace_payload,
+            "akanksha_verdict": None,
+            "evaluator_results": evaluator_results,
+            "final_decision": verdict.decision,
+            "config_hash": config.config_hash,
+        }
+        if reason_code == "DEADLINE_EXCEEDED":
+            entry["deadline_exceeded"] = True
+        if reason_code == "GLOBAL_KILL_SWITCH":
+            entry["kill_switch"] = True
+        log_entries.append(entry)
+
+    log_enforcement_many(log_entries)
+    _count_verdicts(verdicts)
+    return verdicts
+
+
+def _evaluator_rows(evaluators, inputs):
+    """
+    STEP 2 over a batch, column by column: (rows, failed).
+
+    A column whose evaluate_many() raises is re-run item by item, so
+    a bad input fails only itself: failed[i] is True when an evaluator
+    raised on inputs[i], and rows[i] keeps the results that completed.
+    """
+    rows = [[] for _ in inputs]
+    failed = [False] * len(inputs)
+    for evaluator in evaluators:
+        try:
+            column = evaluator.evaluate_many(inputs)
+        except Exception:
+            column = [_evaluate_or_none(evaluator, p) for p in inputs]
+        for position, result in enumerate(column):
+            if result is None:
+                failed[position] = True
+            else:
+                rows[position].append(result)
+    return rows, failed
+
+
+def _evaluate_or_none(evaluator, input_payload):
+    try:
+        return evaluator.evaluate(input_payload)
+    except Exception:
+        return None
+
+
+def _kill_switch_engaged(config: ConfigSnapshot) -> bool:
+    return config.kill_switch or (not _REPLAYING.get() and KILL_SWITCH.engaged())
+
+
+def _count_verdicts(verdicts) -> None:
+    for verdict in verdicts:
+        VERDICT_COUNTER.inc((verdict.decision, verdict.reason_code))
+
+
 def _resolve_raj_decision(evaluator_results):
     for decision in DECISION_PRIORITY:
         for result in evaluator_results:
@@ -200,3 +786,38 @@ def _resolve_final_decision(*, raj_decision: str, ak_decision: str) -> str:
         if decision == raj_decision or decision == ak_decision:
             return decision
     return "EXECUTE"
+
+
+def _build_verdict(final_decision: str, trace_id: str) -> EnforcementVerdict:
+    if final_decision == "EXECUTE":
+        return EnforcementVerdict(
+            decision="ALLOW",
+            scope="both",
+            trace_id=trace_id,
+            reason_code="CONTENT_AND_ACTION_ALLOWED",
+        )
+
+    if final_decision == "REWRITE":
+        return EnforcementVerdict(
+            decision="REWRITE",
+            scope="response",
+            trace_id=trace_id,
+            reason_code="SAFE_REWRITE_REQUIRED",
+            rewrite_class="DETERMINISTIC_REWRITE",
+        )
+
+    if final_decision == "BLOCK":
+        return EnforcementVerdict(
+            decision="BLOCK",
+            scope="both",
+            trace_id=trace_id,
+            reason_code="POLICY_VIOLATION",
+        )
+
+    # TERMINATE
+    return EnforcementVerdict(
+        decision="TERMINATE",
+        scope="both",
+        trace_id=trace_id,
+        reason_code="SYSTEM_TERMINATION",
+    )
@@ -7,13 +7,30 @@ Consumes ONLY EnforcementVerdict.
 NON-BYPASSABLE. FAIL-CLOSED. DETERMINISTIC.
 """
 
-from fastapi import FastAPI
+import json
+from time import perf_counter
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 from typing import Dict, Any, List, Optional
 
-from enforcement_engine import enforce
+import enforcement_engine
+from config_loader import CONFIG, RUNTIME_CONFIG
+from enforcement_engine import enforce, enforce_async, enforce_many
+from logs.bucket_logger import flush_trace_log, lookup_trace, trace_log_stats
 from models.enforcement_input import EnforcementInput
+from utils.admission import (
+    SHED_QUEUE_FULL,
+    SHED_QUEUE_TIMEOUT,
+    AdmissionController,
+    Overloaded,
+)
+from utils.deadline import Deadline
 from utils.deterministic_trace import generate_trace_id
+from utils.metrics import EXPOSITION_CONTENT_TYPE, Exposition, Histogram, LabeledCounter
+from utils.single_flight import SingleFlight
 
 from enforcement.intelligence_input_validator import (
     validate_intelligence_payload,
@@ -27,11 +44,60 @@ from enforcement_verdict import EnforcementVerdict
 # APP
 # -------------------------------------------------
 
+_CONFIG_RELOAD = (RUNTIME_CONFIG.get("config_reload") or {}).get("enabled", False)
+
 app = FastAPI(
     title="AI Being — Enforcement Gateway",
     version="3.1.0-DETERMINISTIC-LOCK",
+    # Hot config reload: validated new versions are swapped in off
+    # the request path (config_loader.CONFIG)
+    on_startup=[CONFIG.start_watching] if _CONFIG_RELOAD else [],
+    on_shutdown=(
+        [CONFIG.stop_watching] if _CONFIG_RELOAD else []
+    ) + [flush_trace_log],           # drain + fsync the trace writer
+)
+
+# -------------------------------------------------
+# GATEWAY METRICS (PER-THREAD SHARDS, MERGED ON SCRAPE)
+# -------------------------------------------------
+
+GATEWAY_REQUESTS = LabeledCounter()      # by response decision
+GATEWAY_REJECTIONS = LabeledCounter()    # intelligence_contract | engine_error | invalid_request
+GATEWAY_LATENCY = Histogram()            # end-to-end, every request
+
+_GATEWAY_CONFIG = RUNTIME_CONFIG.get("gateway") or {}
+
+# -------------------------------------------------
+# REQUEST COALESCING (SINGLE-FLIGHT ON THE CANONICAL PAYLOAD)
+# -------------------------------------------------
+# Concurrent /enforce calls with byte-identical payloads share one
+# evaluation and receive the same verdict and trace ID. Every caller
+# still gets its own audit record.
+
+IN_FLIGHT = SingleFlight() if _GATEWAY_CONFIG.get("coalesce", True) else None
+
+# -------------------------------------------------
+# ADMISSION CONTROL (FAIL-CLOSED LOAD SHEDDING)
+# -------------------------------------------------
+# Bounded concurrency + bounded, time-limited queue in front of the
+# enforcement path. Excess load gets an immediate BLOCK (OVERLOAD_SHED)
+# instead of an unbounded wait.
+
+_ADMISSION_CONFIG = _GATEWAY_CONFIG.get("admission") or {}
+ADMISSION = (
+    AdmissionController(
+        max_concurrent=_ADMISSION_CONFIG.get("max_concurrent", 32),
+        max_queue=_ADMISSION_CONFIG.get("max_queue", 256),
+        queue_timeout_ms=_ADMISSION_CONFIG.get("queue_timeout_ms", 50),
+    )
+    if _ADMISSION_CONFIG.get("enabled", False)
+    else None
 )
 
+# Per-request time budget, from arrival (queue wait included).
+# Expiry inside the engine → TERMINATE (DEADLINE_EXCEEDED) → BLOCK.
+REQUEST_DEADLINE_MS = _GATEWAY_CONFIG.get("deadline_ms")
+
 # -------------------------------------------------
 # REQUEST / RESPONSE MODELS
 # -------------------------------------------------
@@ -58,6 +124,7 @@ class EnforcementResponse(BaseModel):
     decision: str          # EXECUTE | REWRITE | BLOCK
     trace_id: str
     rewrite_class: Optional[str] = None
+    reason_code: Optional[str] = None    # set on OVERLOAD_SHED only
 
 
 # -------------------------------------------------
@@ -65,67 +132,339 @@ class EnforcementResponse(BaseModel):
 # -------------------------------------------------
 
 @app.post("/enforce", response_model=EnforcementResponse)
-def enforcement_gateway(payload: EnforcementRequest):
+async def enforcement_gateway(payload: EnforcementRequest):
     """
     Final runtime authority.
     Nothing executes beyond this point.
     """
+    started = perf_counter()
+    deadline = Deadline.after_ms(REQUEST_DEADLINE_MS)
+    if ADMISSION is None:
+        response = await _gate(payload, deadline)
+    else:
+        try:
+            async with ADMISSION.slot():
+                response = await _gate(payload, deadline)
+        except Overloaded:
+            response = _overload_response(payload)
+    GATEWAY_LATENCY.observe(perf_counter() - started)
+    GATEWAY_REQUESTS.inc(response.decision)
+    return response
+
+
+async def _gate(payload: EnforcementRequest, deadline: Optional[Deadline] = None) -> EnforcementResponse:
+    # Validation runs on the loop; evaluation (enforce_async) runs in
+    # a worker thread while this request holds its admission slot.
 
     # -------------------------------------------------
     # STEP 0 — INTELLIGENCE CONTRACT VALIDATION
     # -------------------------------------------------
+    intelligence, rejection = _validate_intelligence(payload)
+    if rejection is not None:
+        return rejection
+
+    # -------------------------------------------------
+    # STEP 1 — BUILD ENFORCEMENT INPUT
+    # -------------------------------------------------
+    enforcement_input = _build_input(intelligence, payload.context)
+
+    # -------------------------------------------------
+    # STEP 2 — ENFORCEMENT (SOLE AUTHORITY)
+    # -------------------------------------------------
     try:
-        intelligence = validate_intelligence_payload(
-            payload.intelligence.data
+        verdict: EnforcementVerdict = await enforce_async(
+            enforcement_input,
+            single_flight=IN_FLIGHT,
+            deadline=deadline,
         )
+    except Exception:
+        return _engine_error_response(intelligence, payload.context)
+
+    # -------------------------------------------------
+    # STEP 3 — VERDICT → RUNTIME DECISION
+    # -------------------------------------------------
+    return _verdict_response(verdict)
+
+
+# -------------------------------------------------
+# BATCH GATE (NDJSON STREAMING)
+# -------------------------------------------------
+
+BATCH_CHUNK_SIZE = max(int(_GATEWAY_CONFIG.get("batch_chunk_size", 256)), 1)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+@app.post("/enforce/batch")
+async def enforcement_gateway_batch(request: Request) -> StreamingResponse:
+    """
+    Batch form of /enforce.
+
+    Body: a JSON array of EnforcementRequest, or NDJSON (one per line).
+    Response: NDJSON, one EnforcementResponse per item, in input order.
+    Every item fails closed on its own (BLOCK); the rest proceed.
+
+    Each chunk of BATCH_CHUNK_SIZE items is admitted like one /enforce
+    request: it holds an ADMISSION slot and its own REQUEST_DEADLINE_MS
+    budget, or is shed (every item BLOCK, OVERLOAD_SHED).
+    """
+    # Chunks are gated while the body is read (the ASGI receive
+    # channel belongs to the response once it is streaming). NDJSON
+    # is gated as the upload arrives: one chunk of requests is held
+    # at a time, plus the compact response lines.
+    if _is_ndjson(request):
+        chunks = _ndjson_chunks(request)
+    else:
+        try:
+            items = json.loads(await request.body())
+        except ValueError:
+            items = None
+        if not isinstance(items, list):
+            raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+        chunks = _array_chunks(items)
+
+    lines = []
+    async for chunk in chunks:
+        responses = await _admit_many(chunk)
+        lines.append("".join(_ndjson_line(response) for response in responses))
+
+    return StreamingResponse(iter(lines), media_type=NDJSON_MEDIA_TYPE)
+
+
+async def _admit_many(items: List[Any]) -> List[EnforcementResponse]:
+    # Same admission and budget as one /enforce request; the chunk is
+    # gated in a worker thread while it holds its slot.
+    deadline = Deadline.after_ms(REQUEST_DEADLINE_MS)
+    if ADMISSION is None:
+        return await run_in_threadpool(_gate_many, items, deadline)
+    try:
+        async with ADMISSION.slot():
+            return await run_in_threadpool(_gate_many, items, deadline)
+    except Overloaded:
+        return _shed_many(items)
+
+
+def _gate_many(items: List[Any], deadline: Optional[Deadline] = None) -> List[EnforcementResponse]:
+    """
+    Gate one chunk: per-item validation, ONE enforce_many() call
+    (one audit-log commit) for every item that reached the engine.
+    If that call raises, the chunk is retried item by item.
+    """
+    responses: List[Optional[EnforcementResponse]] = [None] * len(items)
+    pending = []    # (index, intelligence, context)
+
+    for index, item in enumerate(items):
+        payload = _parse_item(item)
+        if isinstance(payload, EnforcementResponse):
+            responses[index] = payload
+            continue
+        intelligence, rejection = _validate_intelligence(payload)
+        if rejection is not None:
+            responses[index] = rejection
+            continue
+        pending.append((index, intelligence, payload.context))
+
+    if pending:
+        inputs = [_build_input(intelligence, context) for _, intelligence, context in pending]
+        try:
+            verdicts = enforce_many(inputs, deadline=deadline)
+        except Exception:
+            # One bad item must not fail the chunk: enforce_many() logs
+            # nothing before it raises, so retry item by item exactly
+            # as /enforce would (only the failing items BLOCK).
+            verdicts = [
+                _enforce_or_none(enforcement_input, deadline)
+                for enforcement_input in inputs
+            ]
+
+        for position, (index, intelligence, context) in enumerate(pending):
+            verdict = verdicts[position]
+            responses[index] = (
+                _engine_error_response(intelligence, context)
+                if verdict is None
+                else _verdict_response(verdict)
+            )
+
+    for response in responses:
+        GATEWAY_REQUESTS.inc(response.decision)
+    return responses
+
+
+def _shed_many(items: List[Any]) -> List[EnforcementResponse]:
+    """
+    A chunk that was not admitted: nothing reaches the engine or the
+    trace log. Malformed items still get their INVALID_REQUEST BLOCK.
+    """
+    responses = []
+    for item in items:
+        payload = _parse_item(item)
+        if not isinstance(payload, EnforcementResponse):
+            payload = _overload_response(payload)
+        responses.append(payload)
+        GATEWAY_REQUESTS.inc(payload.decision)
+    return responses
+
+
+def _enforce_or_none(
+    enforcement_input: EnforcementInput,
+    deadline: Optional[Deadline] = None,
+) -> Optional[EnforcementVerdict]:
+    try:
+        return enforce(enforcement_input, deadline=deadline)
+    except Exception:
+        return None
+
+
+def _ndjson_line(response: EnforcementResponse) -> str:
+    return json.dumps({
+        "decision": response.decision,
+        "trace_id": response.trace_id,
+        "rewrite_class": response.rewrite_class,
+        "reason_code": response.reason_code,
+    }) + "\n"
+
+
+def _parse_item(item: Any):
+    """
+    EnforcementRequest, or a fail-closed BLOCK for a malformed item.
+    """
+    if isinstance(item, _MalformedLine):
+        return _invalid_request_response({"raw": item.text})
+    try:
+        return EnforcementRequest(**item)
+    except Exception:
+        return _invalid_request_response(item if isinstance(item, dict) else {"raw": item})
+
+
+class _MalformedLine:
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+def _is_ndjson(request: Request) -> bool:
+    content_type = request.headers.get("content-type", "")
+    return "ndjson" in content_type or "jsonl" in content_type
+
+
+async def _array_chunks(items: List[Any]):
+    for start in range(0, len(items), BATCH_CHUNK_SIZE):
+        yield items[start:start + BATCH_CHUNK_SIZE]
+
+
+async def _ndjson_chunks(request: Request):
+    chunk = []
+    async for item in _ndjson_items(request):
+        chunk.append(item)
+        if len(chunk) == BATCH_CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _ndjson_items(request: Request):
+    # Lines are parsed as the upload arrives; raw bytes are not kept.
+    pending = b""
+    async for data in request.stream():
+        pending += data
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield _decode_line(line)
+    if pending.strip():
+        yield _decode_line(pending)
+
+
+def _decode_line(line: bytes):
+    try:
+        return json.loads(line)
+    except ValueError:
+        return _MalformedLine(line.decode("utf-8", "replace"))
+
+
+# -------------------------------------------------
+# SHARED GATE STEPS
+# -------------------------------------------------
+
+def _validate_intelligence(payload: EnforcementRequest):
+    """
+    (intelligence, None) or (None, fail-closed BLOCK response).
+    """
+    try:
+        return validate_intelligence_payload(payload.intelligence.data), None
     except IntelligenceContractViolation:
+        GATEWAY_REJECTIONS.inc("intelligence_contract")
         trace_id = generate_trace_id(
             input_payload=payload.intelligence.data,
             enforcement_category="INTELLIGENCE_REJECTED",
         )
-        return EnforcementResponse(
+        return None, EnforcementResponse(
             decision="BLOCK",
             trace_id=trace_id,
             rewrite_class=None,
         )
 
-    # -------------------------------------------------
-    # STEP 1 — DETERMINISTIC TRACE ID
-    # -------------------------------------------------
+
+def _build_input(intelligence: Dict[str, Any], context: EnforcementContext) -> EnforcementInput:
+    # The engine encodes the canonical snapshot once and derives the
+    # trace ID from it; the gateway does not serialize the request.
+    return EnforcementInput(
+        intent=intelligence["intent"],
+        emotional_output=context.emotional_output,
+        age_gate_status=context.age_gate_status,
+        region_policy=context.region_policy,
+        platform_policy=context.platform_policy,
+        karma_score=context.karma_score or 0.0,
+        risk_flags=context.risk_flags,
+    )
+
+
+def _engine_error_response(
+    intelligence: Dict[str, Any],
+    context: EnforcementContext,
+) -> EnforcementResponse:
+    GATEWAY_REJECTIONS.inc("engine_error")
+    # Deterministic gateway trace ID (fail-closed path only)
     trace_id = generate_trace_id(
-        input_payload={**intelligence, **payload.context.dict()},
+        input_payload={**intelligence, **context.dict()},
         enforcement_category="RUNTIME_GATEWAY",
     )
-
-    # -------------------------------------------------
-    # STEP 2 — BUILD ENFORCEMENT INPUT
-    # -------------------------------------------------
-    enforcement_input = EnforcementInput(
+    return EnforcementResponse(
+        decision="BLOCK",
         trace_id=trace_id,
-        intent=intelligence["intent"],
-        emotional_output=payload.context.emotional_output,
-        age_gate_status=payload.context.age_gate_status,
-        region_policy=payload.context.region_policy,
-        platform_policy=payload.context.platform_policy,
-        karma_score=payload.context.karma_score or 0.0,
-        risk_flags=payload.context.risk_flags,
+        rewrite_class=None,
     )
 
-    # -------------------------------------------------
-    # STEP 3 — ENFORCEMENT (SOLE AUTHORITY)
-    # -------------------------------------------------
-    try:
-        verdict: EnforcementVerdict = enforce(enforcement_input)
-    except Exception:
-        return EnforcementResponse(
-            decision="BLOCK",
-            trace_id=trace_id,
-            rewrite_class=None,
-        )
 
-    # -------------------------------------------------
-    # STEP 4 — VERDICT → RUNTIME DECISION
-    # -------------------------------------------------
+def _overload_response(payload: EnforcementRequest) -> EnforcementResponse:
+    # Deterministic: same request, same shed trace ID. Nothing ran,
+    # so nothing is written to the trace log.
+    return EnforcementResponse(
+        decision="BLOCK",
+        trace_id=generate_trace_id(
+            input_payload={**payload.intelligence.data, **payload.context.dict()},
+            enforcement_category="OVERLOAD_SHED",
+        ),
+        rewrite_class=None,
+        reason_code="OVERLOAD_SHED",
+    )
+
+
+def _invalid_request_response(item: Dict[str, Any]) -> EnforcementResponse:
+    GATEWAY_REJECTIONS.inc("invalid_request")
+    return EnforcementResponse(
+        decision="BLOCK",
+        trace_id=generate_trace_id(
+            input_payload=item,
+            enforcement_category="INVALID_REQUEST",
+        ),
+        rewrite_class=None,
+    )
+
+
+def _verdict_response(verdict: EnforcementVerdict) -> EnforcementResponse:
     if verdict.decision == "ALLOW":
         return EnforcementResponse(
             decision="EXECUTE",
@@ -146,3 +485,253 @@ def enforcement_gateway(payload: EnforcementRequest):
         trace_id=verdict.trace_id,
         rewrite_class=None,
     )
+
+
+# -------------------------------------------------
+# TRACE LOOKUP (READ-ONLY)
+# -------------------------------------------------
+
+@app.get("/trace/{trace_id}")
+def trace_lookup(trace_id: str) -> Dict[str, Any]:
+    """
+    Indexed lookup of one logged enforcement record.
+    """
+    record = lookup_trace(trace_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Trace ID not found")
+    return record
+
+
+# -------------------------------------------------
+# METRICS (PROMETHEUS TEXT FORMAT, READ-ONLY)
+# -------------------------------------------------
+
+@app.get("/metrics")
+def metrics() -> Response:
+    return Response(content=render_metrics(), media_type=EXPOSITION_CONTENT_TYPE)
+
+
+def render_metrics() -> str:
+    out = Exposition()
+
+    # Gateway
+    out.counter(
+        "enforcement_gateway_requests_total",
+        "Gateway responses by runtime decision.",
+        (({"decision": d}, n) for d, n in sorted(GATEWAY_REQUESTS.values().items())),
+    )
+    out.counter(
+        "enforcement_intelligence_rejections_total",
+        "Requests rejected by the intelligence input contract.",
+        [({}, GATEWAY_REJECTIONS.value("intelligence_contract"))],
+    )
+    out.counter(
+        "enforcement_gateway_engine_errors_total",
+        "Requests failed closed because enforce() raised.",
+        [({}, GATEWAY_REJECTIONS.value("engine_error"))],
+    )
+    out.counter(
+        "enforcement_gateway_invalid_batch_items_total",
+        "Malformed /enforce/batch items blocked.",
+        [({}, GATEWAY_REJECTIONS.value("invalid_request"))],
+    )
+    out.counter(
+        "enforcement_gateway_coalesced_total",
+        "Requests served by an identical in-flight evaluation.",
+        [({}, IN_FLIGHT.coalesced if IN_FLIGHT is not None else 0)],
+    )
+    out.gauge(
+        "enforcement_gateway_in_flight_evaluations",
+        "Distinct payloads currently being evaluated.",
+        [({}, IN_FLIGHT.in_flight() if IN_FLIGHT is not None else 0)],
+    )
+    out.counter(
+        "enforcement_gateway_shed_total",
+        "Requests shed by admission control (BLOCK / OVERLOAD_SHED).",
+        (
+            ({"reason": reason}, ADMISSION.shed.value(reason) if ADMISSION is not None else 0)
+            for reason in (SHED_QUEUE_FULL, SHED_QUEUE_TIMEOUT)
+        ),
+    )
+    out.gauge(
+        "enforcement_gateway_active_requests",
+        "Requests holding an admission slot.",
+        [({}, ADMISSION.active() if ADMISSION is not None else 0)],
+    )
+    out.gauge(
+        "enforcement_gateway_queued_requests",
+        "Requests waiting for an admission slot.",
+        [({}, ADMISSION.queued() if ADMISSION is not None else 0)],
+    )
+    out.histogram(
+        "enforcement_gateway_queue_wait_seconds",
+        "Time admitted requests waited for a slot.",
+        [({}, (ADMISSION.queue_wait if ADMISSION is not None else Histogram()).snapshot())],
+    )
+    out.histogram(
+        "enforcement_gateway_latency_seconds",
+        "End-to-end /enforce handler latency.",
+        [({}, GATEWAY_LATENCY.snapshot())],
+    )
+
+    # Engine
+    verdicts = enforcement_engine.VERDICT_COUNTER.values()
+    out.counter(
+        "enforcement_verdicts_total",
+        "Audited engine verdicts by decision and reason code.",
+        (
+            ({"decision": decision, "reason": reason}, n)
+            for (decision, reason), n in sorted(verdicts.items())
+        ),
+    )
+    out.counter(
+        "enforcement_akanksha_failures_total",
+        "Fail-closed TERMINATE verdicts caused by Akanksha validation failures.",
+        [({}, sum(n for (_, r), n in verdicts.items() if r == "AKANKSHA_VALIDATION_FAILED"))],
+    )
+    out.gauge(
+        "enforcement_akanksha_validator_ready",
+        "1 while a warmed Akanksha validator is installed.",
+        [({}, enforcement_engine.AKANKSHA.ready())],
+    )
+    out.counter(
+        "enforcement_akanksha_validator_install_failures_total",
+        "Akanksha validator builds rejected (previous instance kept).",
+        [({}, enforcement_engine.AKANKSHA.failures)],
+    )
+    telemetry = enforcement_engine.AKANKSHA.telemetry()
+    patterns = telemetry.snapshot() if telemetry is not None else {"patterns": []}
+    out.counter(
+        "enforcement_akanksha_scans_total",
+        "Akanksha single-pass scans.",
+        [({}, patterns.get("scans", 0))],
+    )
+    out.counter(
+        "enforcement_akanksha_scan_seconds_total",
+        "Time spent in Akanksha scans.",
+        [({}, patterns.get("scan_seconds", 0.0))],
+    )
+    out.counter(
+        "enforcement_akanksha_finder_seconds_total",
+        "Time spent in the shared Akanksha finder pass (not in any pattern's confirm time).",
+        [({}, patterns.get("finder_seconds", 0.0))],
+    )
+    out.counter(
+        "enforcement_akanksha_pattern_hits_total",
+        "Texts each Akanksha pattern matched (0: dead pattern).",
+        (
+            ({"category": p["category"], "label": p["label"]}, p["hits"])
+            for p in patterns["patterns"]
+        ),
+    )
+    out.counter(
+        "enforcement_akanksha_pattern_confirm_seconds_total",
+        "Time spent confirming each Akanksha pattern at candidate positions.",
+        (
+            ({"category": p["category"], "label": p["label"]}, p["confirm_seconds"])
+            for p in patterns["patterns"]
+        ),
+    )
+    out.counter(
+        "enforcement_kill_switch_hits_total",
+        "Requests terminated by the global kill switch.",
+        [({}, sum(n for (_, r), n in verdicts.items() if r == "GLOBAL_KILL_SWITCH"))],
+    )
+    out.gauge(
+        "enforcement_kill_switch_engaged",
+        "1 while the global kill switch (static or shared flag) is engaged.",
+        [({}, enforcement_engine.KILL_SWITCH.engaged())],
+    )
+    out.gauge(
+        "enforcement_config_info",
+        "Active config version (label: content hash).",
+        [({"config_hash": CONFIG.snapshot.config_hash}, 1)],
+    )
+    out.counter(
+        "enforcement_config_reloads_total",
+        "New config versions published without a restart.",
+        [({}, CONFIG.reloads)],
+    )
+    out.counter(
+        "enforcement_config_reload_failures_total",
+        "Config versions rejected (previous version kept).",
+        [({}, CONFIG.reload_failures)],
+    )
+    out.counter(
+        "enforcement_deadline_exceeded_total",
+        "Fail-closed TERMINATE verdicts caused by an exhausted time budget.",
+        [({}, sum(n for (_, r), n in verdicts.items() if r == "DEADLINE_EXCEEDED"))],
+    )
+
+    stages = enforcement_engine.STAGE_METRICS.snapshot()
+    out.counter(
+        "enforcement_stage_sampled_requests_total",
+        "enforce() calls timed per stage (sampled).",
+        [({}, stages["sampled_requests"])],
+    )
+    out.histogram(
+        "enforcement_stage_latency_seconds",
+        "enforce() latency per pipeline stage (sampled).",
+        (({"stage": name}, snap) for name, snap in stages["stages"].items()),
+    )
+    out.histogram(
+        "enforcement_evaluator_latency_seconds",
+        "Raj evaluator latency (sampled).",
+        (({"evaluator": name}, snap) for name, snap in stages["evaluators"].items()),
+    )
+
+    # Verdict cache
+    cache = enforcement_engine.VERDICT_CACHE
+    if cache is not None:
+        stats = cache.stats()
+        for key in ("hits", "misses", "evictions", "expirations", "invalidations"):
+            out.counter(
+                f"enforcement_verdict_cache_{key}_total",
+                f"Verdict cache {key}.",
+                [({}, stats[key])],
+            )
+        out.gauge(
+            "enforcement_verdict_cache_entries",
+            "Verdict cache size.",
+            [({}, stats["size"])],
+        )
+        out.gauge(
+            "enforcement_verdict_cache_hit_ratio",
+            "Verdict cache hit ratio.",
+            [({}, stats["hit_rate"])],
+        )
+
+    # Trace log writer
+    writer = trace_log_stats()
+    out.gauge(
+        "enforcement_trace_writer_queue_depth",
+        "Queued trace record batches.",
+        [({}, writer.get("queue_depth", 0))],
+    )
+    out.gauge(
+        "enforcement_trace_writer_queue_max",
+        "Trace writer queue capacity.",
+        [({}, writer.get("queue_max", 0))],
+    )
+    for key in (
+        "records_committed",
+        "records_dropped",
+        "records_failed",
+        "records_inline",
+        "fsyncs",
+        "write_errors",
+    ):
+        if key in writer:
+            out.counter(
+                f"enforcement_trace_writer_{key}_total",
+                f"Trace writer {key.replace('_', ' ')}.",
+                [({}, writer[key])],
+            )
+    if "commit_latency_ms_avg" in writer:
+        out.gauge(
+            "enforcement_trace_writer_commit_latency_seconds_avg",
+            "Average group-commit latency.",
+            [({}, writer["commit_latency_ms_avg"] / 1000.0)],
+        )
+
+    return out.render()
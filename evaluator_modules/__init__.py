@@ -1,3 +1,4 @@
+from config_loader import ENFORCEMENT_CONFIG
 from evaluator_modules.age_compliance import AgeComplianceEvaluator
 from evaluator_modules.region_restriction import RegionRestrictionEvaluator
 from evaluator_modules.platform_policy import PlatformPolicyEvaluator
@@ -6,12 +7,32 @@ from evaluator_modules.dependency_tone import DependencyToneEvaluator
 from evaluator_modules.sexual_escalation import SexualEscalationEvaluator
 from evaluator_modules.emotional_manipulation import EmotionalManipulationEvaluator
 
-ALL_EVALUATORS = [
-    AgeComplianceEvaluator(),
-    RegionRestrictionEvaluator(),
-    PlatformPolicyEvaluator(),
-    SafetyRiskEvaluator(),
-    DependencyToneEvaluator(),
-    SexualEscalationEvaluator(),
-    EmotionalManipulationEvaluator(),
-]
+
+def build_evaluators(settings=None):
+    """
+    Evaluator set for one policy (enforcement.yaml `evaluators` section).
+    Order is fixed; only thresholds and region lists are tunable.
+    """
+    settings = settings or {}
+    dependency_tone = settings.get("dependency_tone") or {}
+    region_restriction = settings.get("region_restriction") or {}
+
+    return [
+        AgeComplianceEvaluator(),
+        RegionRestrictionEvaluator(
+            region_restriction.get(
+                "restricted_regions",
+                RegionRestrictionEvaluator.DEFAULT_RESTRICTED_REGIONS,
+            )
+        ),
+        PlatformPolicyEvaluator(),
+        SafetyRiskEvaluator(),
+        DependencyToneEvaluator(
+            dependency_tone.get("threshold", DependencyToneEvaluator.DEFAULT_THRESHOLD)
+        ),
+        SexualEscalationEvaluator(),
+        EmotionalManipulationEvaluator(),
+    ]
+
+
+ALL_EVALUATORS = build_evaluators(ENFORCEMENT_CONFIG.get("evaluators"))
@@ -4,11 +4,24 @@ class AgeComplianceEvaluator:
     name = "age_compliance"
 
     def evaluate(self, input_data):
-        if input_data.age_gate_status != "ALLOWED":
+        return self._result(self._triggered(input_data))
+
+    def evaluate_many(self, inputs):
+        """
+        Columnar pass over a batch (age-gate column).
+        """
+        mask = [self._triggered(i) for i in inputs]
+        return [self._result(hit) for hit in mask]
+
+    def _triggered(self, input_data):
+        return input_data.age_gate_status != "ALLOWED"
+
+    def _result(self, hit):
+        if hit:
             return EvaluatorResult(
-                name=self.name,
-                triggered=True,
-                action="BLOCK",
-                code="AGE_RESTRICTION_VIOLATION"
+                self.name,
+                True,
+                "BLOCK",
+                "AGE_RESTRICTION_VIOLATION"
             )
         return EvaluatorResult(self.name, False, "EXECUTE", "")
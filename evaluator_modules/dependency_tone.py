@@ -2,9 +2,26 @@ from models.evaluator_result import EvaluatorResult
 
 class DependencyToneEvaluator:
     name = "dependency_tone"
+    DEFAULT_THRESHOLD = 0.7
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
 
     def evaluate(self, input_data):
-        if input_data.emotional_output.get("dependency_score", 0) > 0.7:
+        return self._result(self._triggered(input_data))
+
+    def evaluate_many(self, inputs):
+        """
+        Columnar pass over a batch (dependency-score column + threshold mask).
+        """
+        mask = [self._triggered(i) for i in inputs]
+        return [self._result(hit) for hit in mask]
+
+    def _triggered(self, input_data):
+        return input_data.emotional_output.get("dependency_score", 0) > self.threshold
+
+    def _result(self, hit):
+        if hit:
             return EvaluatorResult(
                 self.name,
                 True,
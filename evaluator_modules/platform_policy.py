@@ -4,7 +4,20 @@ class PlatformPolicyEvaluator:
     name = "platform_policy"
 
     def evaluate(self, input_data):
-        if "PLATFORM_VIOLATION" in input_data.risk_flags:
+        return self._result(self._triggered(input_data))
+
+    def evaluate_many(self, inputs):
+        """
+        Columnar pass over a batch (risk-flag mask).
+        """
+        mask = [self._triggered(i) for i in inputs]
+        return [self._result(hit) for hit in mask]
+
+    def _triggered(self, input_data):
+        return "PLATFORM_VIOLATION" in input_data.risk_flags
+
+    def _result(self, hit):
+        if hit:
             return EvaluatorResult(
                 self.name,
                 True,
@@ -2,9 +2,26 @@ from models.evaluator_result import EvaluatorResult
 
 class RegionRestrictionEvaluator:
     name = "region_restriction"
+    DEFAULT_RESTRICTED_REGIONS = ("RESTRICTED",)
+
+    def __init__(self, restricted_regions=DEFAULT_RESTRICTED_REGIONS):
+        self.restricted_regions = frozenset(restricted_regions)
 
     def evaluate(self, input_data):
-        if input_data.region_policy in ["RESTRICTED"]:
+        return self._result(self._triggered(input_data))
+
+    def evaluate_many(self, inputs):
+        """
+        Columnar pass over a batch (region column + restriction mask).
+        """
+        mask = [self._triggered(i) for i in inputs]
+        return [self._result(hit) for hit in mask]
+
+    def _triggered(self, input_data):
+        return input_data.region_policy in self.restricted_regions
+
+    def _result(self, hit):
+        if hit:
             return EvaluatorResult(
                 self.name,
                 True,
@@ -4,15 +4,27 @@ class SafetyRiskEvaluator:
     name = "safety_risk"
 
     def evaluate(self, input_data):
-        if (
-    "HIGH_RISK" in input_data.risk_flags
-    or "SELF_HARM" in input_data.risk_flags
-):
-            return EvaluatorResult(
-            name=self.name,
-            triggered=True,
-            action="BLOCK",
-            code="SELF_HARM_RISK"
+        return self._result(self._triggered(input_data))
+
+    def evaluate_many(self, inputs):
+        """
+        Columnar pass over a batch (risk-flag mask).
+        """
+        mask = [self._triggered(i) for i in inputs]
+        return [self._result(hit) for hit in mask]
+
+    def _triggered(self, input_data):
+        return (
+            "HIGH_RISK" in input_data.risk_flags
+            or "SELF_HARM" in input_data.risk_flags
         )
 
+    def _result(self, hit):
+        if hit:
+            return EvaluatorResult(
+                self.name,
+                True,
+                "BLOCK",
+                "SELF_HARM_RISK"
+            )
         return EvaluatorResult(self.name, False, "EXECUTE", "")
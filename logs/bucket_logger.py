@@ -4,18 +4,42 @@ BUCKET LOGGER
 Canonical, deterministic enforcement logging.
 
 Properties:
-- JSON ARRAY ONLY (no JSONL)
+- Append-only segmented log: one compact canonical record per line
+- Fixed-size segments (SEGMENT_MAX_RECORDS), O(1) appends, rollover
+- Multi-process safe: every live worker process appends to its OWN
+  segment stream, a stable worker slot reused across restarts (no
+  shared file, no write lock); readers merge the streams in a
+  deterministic order
+- Exports to the canonical JSON ARRAY (replay tools / proofs)
 - Replay-safe
 - Deterministic serialization
-- Append-with-rewrite (single-node safe)
 - NEVER breaks enforcement
+- Event-loop friendly: log_enforcement_async() never blocks the loop
+
+logs/replayable_traces.json is the LEGACY (pre-segment) log, kept
+read-only: it is imported once (streamed, by one process) into the
+"legacy" segment stream on first read. JSON array exports go
+elsewhere (export_json_array() / tools/export_traces.py, default
+logs/exports/).
 """
 
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
 from pathlib import Path
+import asyncio
+import atexit
+import fcntl
 import json
-from typing import List, Any, Dict
+import os
+import threading
+from typing import List, Any, Dict, Iterator, Optional, Tuple
 
 from __version__ import ENGINE_VERSION
+from config_loader import RUNTIME_CONFIG
+from logs.trace_index import TraceIndex, segment_stream as _segment_stream
+from logs.trace_reader import iter_traces
+from logs.trace_writer import AsyncTraceWriter
+from utils.deterministic_trace import CanonicalSnapshot, encode_canonical
 
 # -------------------------------------------------
 # PATH RESOLUTION (ABSOLUTE, STABLE)
@@ -23,6 +47,23 @@ from __version__ import ENGINE_VERSION
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 LOG_FILE = BASE_DIR / "logs" / "replayable_traces.json"
+SEGMENT_DIR = BASE_DIR / "logs" / "segments"
+INDEX_FILE = SEGMENT_DIR / "trace_index.sqlite3"
+
+SEGMENT_PREFIX = "traces-"
+SEGMENT_SUFFIX = ".jsonl"
+
+# Stream holding the records of the legacy JSON array log
+LEGACY_STREAM = "legacy"
+
+# Worker slot lock files (.slot-w0.lock, ...): one per per-process stream
+SLOT_PREFIX = ".slot-"
+
+_TRACE_LOG_CONFIG = RUNTIME_CONFIG.get("trace_log") or {}
+_WRITER_CONFIG = dict(_TRACE_LOG_CONFIG.get("writer") or {})
+
+SEGMENT_MAX_RECORDS = _TRACE_LOG_CONFIG.get("segment_max_records", 10000)
+PER_PROCESS_SEGMENTS = _TRACE_LOG_CONFIG.get("per_process_segments", True)
 
 
 # -------------------------------------------------
@@ -33,6 +74,10 @@ def _normalize_input_snapshot(input_snapshot: Any) -> Dict[str, Any]:
     """
     Convert EnforcementInput (or dict) into a deterministic dict.
     """
+    if isinstance(input_snapshot, CanonicalSnapshot):
+        # Already canonical; keeps its precomputed encoding.
+        return input_snapshot
+
     if isinstance(input_snapshot, dict):
         return {
             "intent": input_snapshot.get("intent"),
@@ -56,6 +101,640 @@ def _normalize_input_snapshot(input_snapshot: Any) -> Dict[str, Any]:
     }
 
 
+def _build_record(
+    *,
+    trace_id: str,
+    input_snapshot,
+    akanksha_verdict: dict,
+    evaluator_results: List,
+    final_decision: str,
+    stage_timings: Optional[Dict[str, int]] = None,
+    coalesced: bool = False,
+    deadline_exceeded: bool = False,
+    config_hash: Optional[str] = None,
+    kill_switch: bool = False,
+) -> Dict[str, Any]:
+    # Fail-closed paths (kill switch, Akanksha failure, deadline)
+    # have no Akanksha verdict: recorded with null fields.
+    akanksha_verdict = akanksha_verdict or {}
+
+    record = {
+        "trace_id": trace_id,
+        "engine_version": ENGINE_VERSION,
+        "input_snapshot": _normalize_input_snapshot(input_snapshot),
+        "akanksha_verdict": {
+            "decision": akanksha_verdict.get("decision"),
+            "risk_category": akanksha_verdict.get("risk_category"),
+            "confidence": akanksha_verdict.get("confidence"),
+        },
+        "raj_evaluators": sorted(
+            [
+                {
+                    "name": r.name,
+                    "action": r.action,
+                    "triggered": r.triggered,
+                }
+                for r in evaluator_results
+            ],
+            key=lambda x: x["name"],
+        ),
+        "final_decision": final_decision,
+    }
+
+    # Sampled requests only; observational, never hashed or replayed.
+    if stage_timings is not None:
+        record["stage_timings_us"] = stage_timings
+
+    # Served by another caller's in-flight evaluation (same verdict).
+    if coalesced:
+        record["coalesced"] = True
+
+    # Time budget ran out (TERMINATE): replay cannot reproduce it.
+    if deadline_exceeded:
+        record["deadline_exceeded"] = True
+
+    # Global kill switch (TERMINATE): runtime state, replay cannot
+    # reproduce it from the input and config alone.
+    if kill_switch:
+        record["kill_switch"] = True
+
+    # Config version the verdict was reached under; replay evaluates
+    # against the archived snapshot with this hash. Never hashed.
+    if config_hash is not None:
+        record["config_hash"] = config_hash
+
+    return record
+
+
+def canonical_record_line(record: Dict[str, Any]) -> str:
+    """
+    Compact canonical encoding of one record (no trailing newline).
+
+    Byte-identical to json.dumps(record, sort_keys=True, compact,
+    ensure_ascii); a CanonicalSnapshot input is spliced in from its
+    precomputed encoding instead of being re-serialized.
+    """
+    snapshot = record.get("input_snapshot")
+    if not isinstance(snapshot, CanonicalSnapshot):
+        return encode_canonical(record)
+
+    return "{" + ",".join(
+        encode_canonical(key) + ":" + (
+            snapshot.canonical if key == "input_snapshot" else encode_canonical(value)
+        )
+        for key, value in sorted(record.items())
+    ) + "}"
+
+
+# -------------------------------------------------
+# SEGMENTED, APPEND-ONLY STORE
+# -------------------------------------------------
+
+class SegmentedTraceLog:
+    """
+    Append-only trace log split into fixed-size segment files.
+
+    traces-00000001.jsonl, traces-00000002.jsonl, ...
+    Each line is one canonical record. A segment is closed once it
+    holds max_records lines and is never written again.
+
+    per_process=True gives every process its own stream, named by a
+    WORKER SLOT: traces-w<slot>-00000001.jsonl, ... A process claims
+    the lowest free slot (an flock on .slot-w<slot>.lock, held until
+    close() or exit) on first use. Only the slot's holder ever writes
+    the stream, so appends never interleave and byte offsets stay
+    exact; a restarted worker continues its predecessor's stream, so
+    the number of streams is bounded by the peak number of live
+    writers, not by how many ever ran. A forked child claims its own
+    slot on its first append.
+
+    Readers MERGE all streams deterministically: segments in name
+    order (stream, then sequence), records in append order within a
+    segment. The merge depends only on the files, never on timing.
+
+    With an index attached, every appended record is indexed by
+    trace_id → (segment, byte offset) as part of the same append.
+
+    legacy_source: a JSON array trace file (the pre-segment log),
+    imported ONCE into its own stream (traces-legacy-*) before the
+    log is first read (never on the append path). Never modified.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_records: int = SEGMENT_MAX_RECORDS,
+        index: Optional[TraceIndex] = None,
+        per_process: bool = False,
+        legacy_source: Optional[Path] = None,
+    ):
+        self.directory = Path(directory)
+        self.max_records = max(int(max_records), 1)
+        self.index = index
+        self.per_process = per_process
+        self.legacy_source = Path(legacy_source) if legacy_source is not None else None
+        self._legacy_checked = legacy_source is None
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._handle = None
+        self._segment_no = 0
+        self._segment_count = 0
+        self._segment_bytes = 0
+        self._slot_lock = threading.Lock()
+        self._slot: Optional[Tuple[str, int]] = None     # (stream, lock fd)
+
+    @property
+    def stream(self) -> str:
+        """
+        This writer's stream name ("" for the single shared stream).
+        Claims a worker slot on first use.
+        """
+        if not self.per_process:
+            return ""
+        if self._pid != os.getpid():
+            self._after_fork()
+        with self._slot_lock:
+            if self._slot is None:
+                self._slot = _claim_worker_slot(self.directory)
+            return self._slot[0]
+
+    # -------------------------------
+    # WRITE PATH
+    # -------------------------------
+
+    def append(self, records: List[Dict[str, Any]]) -> None:
+        lines = [
+            (r.get("trace_id"), (canonical_record_line(r) + "\n").encode("ascii"))
+            for r in records
+        ]
+        placed: Dict[str, list] = {}
+        ends: Dict[str, int] = {}
+
+        if self._pid != os.getpid():
+            self._after_fork()
+
+        with self._lock:
+            if self._handle is None:
+                self._open_tail()
+
+            for trace_id, line in lines:
+                if self._segment_count >= self.max_records:
+                    self._roll()
+                segment = self._segment_path(self._segment_no).name
+                self._handle.write(line)
+                placed.setdefault(segment, []).append((trace_id, self._segment_bytes))
+                self._segment_count += 1
+                self._segment_bytes += len(line)
+                ends[segment] = self._segment_bytes
+
+            self._handle.flush()
+
+        if self.index is not None:
+            for segment, entries in placed.items():
+                self.index.add(segment, entries, ends[segment])
+
+    def sync(self) -> None:
+        """
+        fsync the open segment.
+        """
+        with self._lock:
+            if self._handle is not None:
+                self._handle.flush()
+                os.fsync(self._handle.fileno())
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+            with self._slot_lock:
+                if self._slot is not None:
+                    os.close(self._slot[1])       # releases the slot
+                    self._slot = None
+
+    # -------------------------------
+    # READ PATH
+    # -------------------------------
+
+    def segments(self) -> List[Path]:
+        if not self.directory.exists():
+            return []
+        return sorted(
+            self.directory.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}")
+        )
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        self._import_legacy_once()
+        for _, _, record in self._iter_located(self.segments()):
+            yield record
+
+    def read_at(self, segment: str, offset: int) -> Dict[str, Any]:
+        with (self.directory / segment).open("rb") as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def lookup(self, trace_id: str) -> Optional[Dict[str, Any]]:
+        """
+        O(1)-ish trace lookup through the index (None if unknown).
+        """
+        if self.index is None:
+            return None
+        self._import_legacy_once()
+        location = self.index.lookup(trace_id)
+        if location is None:
+            return None
+        return self.read_at(*location)
+
+    def rebuild_index(self) -> int:
+        """
+        Rebuild the index from the segments alone.
+        Returns the number of records scanned.
+        """
+        if self.index is None:
+            raise RuntimeError("No trace index attached")
+        self._import_legacy_once()
+        self.index.clear()
+        return self.catch_up_index()
+
+    def catch_up_index(self, stream: Optional[str] = None) -> int:
+        """
+        Index whatever the segments hold beyond each segment's
+        high-water mark (e.g. after a crash between write and index).
+        stream: only that stream's segments (None: all streams).
+        """
+        if self.index is None:
+            return 0
+
+        segments = self.segments()
+        if stream is not None:
+            segments = [p for p in segments if _segment_stream(p.name) == stream]
+
+        scanned = 0
+        for segment in segments:
+            start = self.index.indexed_bytes(segment.name)
+            if segment.stat().st_size <= start:
+                continue
+            entries = []
+            end = start
+            for offset, line_end, record in self._iter_located([segment], start):
+                entries.append((record.get("trace_id"), offset))
+                end = line_end
+            if entries:
+                self.index.add(segment.name, entries, end)
+            scanned += len(entries)
+        return scanned
+
+    def export_json_array(self, destination: Path) -> int:
+        """
+        Stream every record into the canonical JSON ARRAY format
+        (indent=2, sort_keys=True), byte-identical to json.dump().
+        Returns the number of records written.
+        """
+        count = 0
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+
+        with destination.open("w", encoding="utf-8") as out:
+            for record in self.iter_records():
+                body = json.dumps(
+                    record,
+                    indent=2,
+                    sort_keys=True,
+                    ensure_ascii=True,
+                ).replace("\n", "\n  ")
+                out.write(("[\n  " if count == 0 else ",\n  ") + body)
+                count += 1
+            out.write("\n]" if count else "[]")
+
+        return count
+
+    def import_json_array(self, source: Path, stream: str = LEGACY_STREAM) -> int:
+        """
+        One-time import of a JSON array trace file into its own
+        stream. Idempotent: if the stream is already complete,
+        nothing is written. Returns the number of records imported.
+
+        The source is parsed incrementally (memory bounded by one
+        segment, never by the file). Only one process imports: the
+        others wait on the stream's import lock, then find it done.
+        Segments are staged aside and renamed into place last-first,
+        so the stream counts as complete only once its FIRST segment
+        exists; an interrupted import is redone from scratch.
+        """
+        first = self.directory / _segment_name(stream, 1)
+        if first.exists():
+            return 0
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        lock_fd = os.open(self.directory / f".import-{stream}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            if first.exists():
+                return 0
+
+            staged: List[Tuple[Path, Path]] = []
+            count = 0
+            f = None
+            try:
+                for record in iter_traces(source):
+                    if count % self.max_records == 0:
+                        if f is not None:
+                            _seal(f)
+                        path = self.directory / _segment_name(stream, len(staged) + 1)
+                        staging = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+                        staged.append((staging, path))
+                        f = staging.open("wb")
+                    f.write((canonical_record_line(record) + "\n").encode("ascii"))
+                    count += 1
+                if f is not None:
+                    _seal(f)
+            except BaseException:
+                if f is not None:
+                    f.close()
+                for staging, _ in staged:
+                    staging.unlink(missing_ok=True)
+                raise
+
+            for staging, path in reversed(staged):
+                os.replace(staging, path)
+        finally:
+            os.close(lock_fd)         # releases the lock
+
+        self.catch_up_index(stream)
+        return count
+
+    # -------------------------------
+    # INTERNAL
+    # -------------------------------
+
+    def _import_legacy_once(self) -> None:
+        if self._legacy_checked:
+            return
+        self._legacy_checked = True
+        if self.legacy_source.exists():
+            self.import_json_array(self.legacy_source)
+
+    def _after_fork(self) -> None:
+        # The parent's handle, lock and slot are not ours: start over
+        # (the parent's handle is left for the parent to close; our
+        # copy of its slot fd is closed, the parent still holds it).
+        self._lock = threading.Lock()
+        self._slot_lock = threading.Lock()
+        self._pid = os.getpid()
+        self._handle = None
+        if self._slot is not None:
+            os.close(self._slot[1])
+            self._slot = None
+
+    def _stream_segments(self) -> List[Path]:
+        stream = self.stream
+        return [
+            path for path in self.segments()
+            if _segment_stream(path.name) == stream
+        ]
+
+    @staticmethod
+    def _iter_located(segments: List[Path], start: int = 0):
+        """
+        Yield (offset, end_offset, record) for every complete line.
+        """
+        for segment in segments:
+            with segment.open("rb") as f:
+                f.seek(start)
+                offset = start
+                for line in f:
+                    end = offset + len(line)
+                    # A line without its newline is a torn write: skip it.
+                    if line.endswith(b"\n") and line.strip():
+                        yield offset, end, json.loads(line)
+                    offset = end
+
+    # Caller holds the lock below this point.
+
+    def _open_tail(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Own stream only: every index file keeps a single writer
+        self.catch_up_index(self.stream)
+        existing = self._stream_segments()
+
+        if existing:
+            tail = existing[-1]
+            self._segment_no = _segment_number(tail.name)
+            with tail.open("rb") as f:
+                lines = f.readlines()
+            self._segment_count = len(lines)
+            self._segment_bytes = sum(len(line) for line in lines)
+
+            # Never append after a torn line: continue in a new segment.
+            if lines and not lines[-1].endswith(b"\n"):
+                self._segment_no += 1
+                self._segment_count = 0
+                self._segment_bytes = 0
+        else:
+            self._segment_no = 1
+            self._segment_count = 0
+            self._segment_bytes = 0
+
+        self._handle = self._segment_path(self._segment_no).open("ab")
+
+    def _roll(self) -> None:
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self._handle.close()
+        self._segment_no += 1
+        self._segment_count = 0
+        self._segment_bytes = 0
+        self._handle = self._segment_path(self._segment_no).open("ab")
+
+    def _segment_path(self, number: int) -> Path:
+        return self.directory / _segment_name(self.stream, number)
+
+
+def _claim_worker_slot(directory: Path) -> Tuple[str, int]:
+    """
+    Lowest free worker slot in directory: (stream name, lock fd).
+    Held until the fd is closed or the process exits.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    slot = 0
+    while True:
+        stream = f"w{slot}"
+        fd = os.open(directory / f"{SLOT_PREFIX}{stream}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            slot += 1
+            continue
+        return stream, fd
+
+
+def _seal(f) -> None:
+    f.flush()
+    os.fsync(f.fileno())
+    f.close()
+
+
+def _segment_name(stream: str, number: int) -> str:
+    middle = f"{stream}-{number:08d}" if stream else f"{number:08d}"
+    return f"{SEGMENT_PREFIX}{middle}{SEGMENT_SUFFIX}"
+
+
+def _segment_number(name: str) -> int:
+    middle = name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]
+    return int(middle.rpartition("-")[2])
+
+
+TRACE_LOG = SegmentedTraceLog(
+    SEGMENT_DIR,
+    index=TraceIndex(INDEX_FILE),
+    per_process=PER_PROCESS_SEGMENTS,
+    legacy_source=LOG_FILE,
+)
+
+# Background group-commit writer (None → synchronous appends)
+_WRITER_MODE = _WRITER_CONFIG.pop("mode", "sync")
+_SYNC_DURABILITY = _WRITER_CONFIG.get("durability", "os_buffered")
+TRACE_WRITER = (
+    AsyncTraceWriter(TRACE_LOG, **_WRITER_CONFIG)
+    if _WRITER_MODE == "async"
+    else None
+)
+
+
+# -------------------------------------------------
+# LOG SINKS (SIDE-EFFECT-FREE RUNS)
+# -------------------------------------------------
+
+class NullSink:
+    """
+    Discards records. Used by replay: the audit log stays untouched.
+    """
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        pass
+
+
+class MemorySink:
+    """
+    Keeps records in memory (inspection, tests, dry runs).
+    """
+
+    def __init__(self):
+        self.records: List[Dict[str, Any]] = []
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        self.records.extend(records)
+
+
+_ACTIVE_SINK: ContextVar = ContextVar("trace_log_sink", default=None)
+
+
+@contextmanager
+def use_log_sink(sink):
+    """
+    Route every record logged in this context (thread / task)
+    to sink instead of the trace log.
+    """
+    token = _ACTIVE_SINK.set(sink)
+    try:
+        yield sink
+    finally:
+        _ACTIVE_SINK.reset(token)
+
+
+def _append_records(records: List[Dict[str, Any]]) -> bool:
+    """
+    False if the records were dropped or not persisted at the
+    configured durability; raises only on a synchronous write error.
+    """
+    sink = _ACTIVE_SINK.get()
+    if sink is not None:
+        sink.write(records)
+        return True
+
+    if TRACE_WRITER is not None:
+        return TRACE_WRITER.submit(records)
+
+    TRACE_LOG.append(records)
+    if _SYNC_DURABILITY != "os_buffered":
+        TRACE_LOG.sync()
+    return True
+
+
+def _try_append_records_nowait(records: List[Dict[str, Any]]) -> bool:
+    """
+    _append_records() if it cannot block the caller; False otherwise.
+    """
+    sink = _ACTIVE_SINK.get()
+    if sink is not None:
+        # Sinks are in-memory
+        sink.write(records)
+        return True
+
+    if TRACE_WRITER is not None:
+        return TRACE_WRITER.try_submit(records)
+
+    return False
+
+
+def flush_trace_log(timeout: float = 5.0) -> bool:
+    """
+    Make every record logged so far durable (writer drained + fsync).
+    """
+    if TRACE_WRITER is not None:
+        return TRACE_WRITER.flush(timeout)
+    TRACE_LOG.sync()
+    return True
+
+
+def lookup_trace(trace_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetch one logged record by trace_id via the index (None if unknown).
+    Records still queued in the writer are not visible yet.
+    """
+    return TRACE_LOG.lookup(trace_id)
+
+
+def rebuild_trace_index() -> int:
+    """
+    Rebuild trace_id → (segment, offset) from the segments.
+    """
+    flush_trace_log()
+    return TRACE_LOG.rebuild_index()
+
+
+def trace_log_stats() -> Dict[str, Any]:
+    """
+    Writer queue depth, commit latency and counters.
+    """
+    if TRACE_WRITER is not None:
+        return TRACE_WRITER.stats()
+    return {"durability": _SYNC_DURABILITY, "queue_depth": 0, "queue_max": 0}
+
+
+def _shutdown():
+    if TRACE_WRITER is not None:
+        TRACE_WRITER.close()
+    TRACE_LOG.close()
+    if TRACE_LOG.index is not None:
+        TRACE_LOG.index.close()
+
+
+atexit.register(_shutdown)
+
+
+def export_json_array(destination: Path) -> int:
+    """
+    Export the segmented log to the canonical JSON ARRAY format
+    consumed by tools/replay_tool.py. Refuses to overwrite the
+    legacy log (LOG_FILE).
+    """
+    if Path(destination).resolve() == LOG_FILE:
+        raise ValueError(f"Refusing to overwrite the legacy trace log {LOG_FILE}")
+    return TRACE_LOG.export_json_array(destination)
+
+
 # -------------------------------------------------
 # PUBLIC LOGGER
 # -------------------------------------------------
@@ -67,74 +746,90 @@ def log_enforcement(
     akanksha_verdict: dict,
     evaluator_results: List,
     final_decision: str,
-):
+    stage_timings: Optional[Dict[str, int]] = None,
+    coalesced: bool = False,
+    deadline_exceeded: bool = False,
+    config_hash: Optional[str] = None,
+    kill_switch: bool = False,
+) -> bool:
     """
     Append a deterministic enforcement record.
+    Returns False if the record was dropped or could not be persisted.
 
     ABSOLUTE RULE:
     - MUST NEVER throw
     """
 
     try:
-        record = {
-            "trace_id": trace_id,
-            "engine_version": ENGINE_VERSION,
-            "input_snapshot": _normalize_input_snapshot(input_snapshot),
-            "akanksha_verdict": {
-                "decision": akanksha_verdict.get("decision"),
-                "risk_category": akanksha_verdict.get("risk_category"),
-                "confidence": akanksha_verdict.get("confidence"),
-            },
-            "raj_evaluators": sorted(
-                [
-                    {
-                        "name": r.name,
-                        "action": r.action,
-                        "triggered": r.triggered,
-                    }
-                    for r in evaluator_results
-                ],
-                key=lambda x: x["name"],
-            ),
-            "final_decision": final_decision,
-        }
+        record = _build_record(
+            trace_id=trace_id,
+            input_snapshot=input_snapshot,
+            akanksha_verdict=akanksha_verdict,
+            evaluator_results=evaluator_results,
+            final_decision=final_decision,
+            stage_timings=stage_timings,
+            coalesced=coalesced,
+            deadline_exceeded=deadline_exceeded,
+            config_hash=config_hash,
+            kill_switch=kill_switch,
+        )
+        return _append_records([record])
 
-        # -------------------------------
-        # ENSURE DIRECTORY EXISTS
-        # -------------------------------
-        LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    except Exception:
+        # LOGGING MUST NEVER BLOCK ENFORCEMENT
+        return False
+
+
+async def log_enforcement_async(**entry) -> bool:
+    """
+    Awaitable log_enforcement() (same keyword arguments and result).
 
-        # -------------------------------
-        # LOAD EXISTING LOG (ARRAY)
-        # -------------------------------
-        if LOG_FILE.exists():
+    Never blocks the event loop on disk: the record goes straight to
+    the background writer when it has room, otherwise the blocking
+    append runs in the default executor (same log sink context).
+
+    ABSOLUTE RULE:
+    - MUST NEVER throw
+    """
+
+    try:
+        records = [_build_record(**entry)]
+        if _try_append_records_nowait(records):
+            return True
+        context = copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            None, context.run, _append_records, records
+        )
+
+    except Exception:
+        # LOGGING MUST NEVER BLOCK ENFORCEMENT
+        return False
+
+
+def log_enforcement_many(entries: List[Dict[str, Any]]) -> bool:
+    """
+    Append a batch of enforcement records in ONE commit.
+
+    Each entry holds the keyword arguments of log_enforcement().
+    An entry that cannot be recorded is skipped exactly as
+    log_enforcement() would skip it. Returns False if any entry
+    was skipped, dropped or not persisted.
+
+    ABSOLUTE RULE:
+    - MUST NEVER throw
+    """
+
+    try:
+        records = []
+        for entry in entries:
             try:
-                with LOG_FILE.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-                if not isinstance(data, list):
-                    data = []
+                records.append(_build_record(**entry))
             except Exception:
-                data = []
-        else:
-            data = []
-
-        # -------------------------------
-        # APPEND RECORD
-        # -------------------------------
-        data.append(record)
-
-        # -------------------------------
-        # WRITE BACK CANONICAL JSON
-        # -------------------------------
-        with LOG_FILE.open("w", encoding="utf-8") as f:
-            json.dump(
-                data,
-                f,
-                indent=2,
-                sort_keys=True,
-                ensure_ascii=True,
-            )
+                continue
+
+        appended = _append_records(records) if records else True
+        return appended and len(records) == len(entries)
 
     except Exception:
         # LOGGING MUST NEVER BLOCK ENFORCEMENT
-        pass
+        return False
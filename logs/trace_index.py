@@ -0,0 +1,220 @@
+"""
+TRACE INDEX
+-----------
+Persistent trace_id → (segment, byte offset) index for the
+segmented trace log.
+
+Properties:
+- B-tree lookup (SQLite, stdlib): same cost at 100 or 100M records
+- Maintained incrementally by the writer, off the request path
+- Per-segment high-water marks: a restart indexes only what is missing
+- Fully rebuildable from the segments alone
+- First occurrence wins (identical inputs share a trace_id)
+- ONE index file PER SEGMENT STREAM: trace_index.sqlite3 for the
+  single shared stream, trace_index.<stream>.sqlite3 otherwise
+  (trace_index.w<slot>.sqlite3, trace_index.legacy.sqlite3). A worker
+  process writes only its own stream's file (its catch-up on open
+  covers only its own stream), so processes never contend for a
+  database write lock. rebuild_index() is the exception: an offline
+  maintenance operation that rewrites every file
+- Streams are worker SLOTS reused across restarts, so the number of
+  files is bounded by the peak number of live writers
+- Lookups MERGE at read time: stream files are queried in the log's
+  merge order (stream name), the first hit wins. The stream list is
+  re-read only when the directory changes; connections unused for
+  idle_seconds are closed
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS trace_index (
+        trace_id TEXT PRIMARY KEY,
+        segment  TEXT NOT NULL,
+        offset   INTEGER NOT NULL
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS indexed_segments (
+        segment       TEXT PRIMARY KEY,
+        indexed_bytes INTEGER NOT NULL
+    ) WITHOUT ROWID
+    """,
+)
+
+
+def segment_stream(segment: str) -> str:
+    """
+    Stream of a segment file name: <prefix>-[<stream>-]<number><suffix>
+    ("" for the single shared stream).
+    """
+    stem = segment.rsplit(".", 1)[0]
+    return stem.rpartition("-")[0].partition("-")[2]
+
+
+class TraceIndex:
+
+    def __init__(self, path: Path, idle_seconds: float = 60.0):
+        self.path = Path(path)
+        self.idle_seconds = float(idle_seconds)
+        self._lock = threading.Lock()
+        self._conns: Dict[str, sqlite3.Connection] = {}    # by stream
+        self._last_used: Dict[str, float] = {}
+        self._last_sweep = time.monotonic()
+        self._known: Optional[Tuple[int, List[str]]] = None  # (dir mtime, streams)
+        self._pid = os.getpid()
+
+    # -------------------------------
+    # WRITE PATH
+    # -------------------------------
+
+    def add(
+        self,
+        segment: str,
+        entries: Iterable[Tuple[str, int]],
+        indexed_bytes: int,
+    ) -> None:
+        """
+        Record (trace_id, offset) pairs for one segment and advance
+        its high-water mark, atomically (in the segment's stream file).
+        """
+        with self._lock:
+            conn = self._connect(segment_stream(segment), create=True)
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO trace_index (trace_id, segment, offset) "
+                    "VALUES (?, ?, ?)",
+                    ((trace_id, segment, offset) for trace_id, offset in entries),
+                )
+                conn.execute(
+                    "INSERT INTO indexed_segments (segment, indexed_bytes) VALUES (?, ?) "
+                    "ON CONFLICT(segment) DO UPDATE SET indexed_bytes = "
+                    "MAX(indexed_bytes, excluded.indexed_bytes)",
+                    (segment, indexed_bytes),
+                )
+
+    def clear(self) -> None:
+        with self._lock:
+            for stream in self._streams():
+                conn = self._connect(stream)
+                with conn:
+                    conn.execute("DELETE FROM trace_index")
+                    conn.execute("DELETE FROM indexed_segments")
+
+    # -------------------------------
+    # READ PATH
+    # -------------------------------
+
+    def lookup(self, trace_id: str) -> Optional[Tuple[str, int]]:
+        with self._lock:
+            queried = self._streams()
+            row = self._lookup_in(queried, trace_id)
+            if row is None:
+                # mtime granularity can hide a just-created file: a
+                # miss re-reads the directory once
+                self._known = None
+                row = self._lookup_in(
+                    [s for s in self._streams() if s not in queried], trace_id
+                )
+        return row
+
+    def indexed_bytes(self, segment: str) -> int:
+        stream = segment_stream(segment)
+        with self._lock:
+            if not self.stream_path(stream).exists():
+                return 0
+            row = self._connect(stream).execute(
+                "SELECT indexed_bytes FROM indexed_segments WHERE segment = ?",
+                (segment,),
+            ).fetchone()
+        return row[0] if row else 0
+
+    def stream_path(self, stream: str) -> Path:
+        if not stream:
+            return self.path
+        return self.path.with_name(f"{self.path.stem}.{stream}{self.path.suffix}")
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._conns.values():
+                conn.close()
+            self._conns.clear()
+            self._last_used.clear()
+
+    # -------------------------------
+    # INTERNAL (CALLER HOLDS LOCK)
+    # -------------------------------
+
+    def _streams(self) -> List[str]:
+        """
+        Streams with an index file, in merge order. Cached until the
+        directory changes (a new file changes its mtime).
+        """
+        try:
+            mtime = os.stat(self.path.parent).st_mtime_ns
+        except OSError:
+            return []
+        if self._known is not None and self._known[0] == mtime:
+            return self._known[1]
+
+        streams = []
+        for path in self.path.parent.glob(f"{self.path.stem}*{self.path.suffix}"):
+            if path == self.path:
+                streams.append("")
+            elif path.name.startswith(self.path.stem + "."):
+                streams.append(path.name[len(self.path.stem) + 1:-len(self.path.suffix)])
+        streams.sort()
+        self._known = (mtime, streams)
+        return streams
+
+    def _lookup_in(self, streams: List[str], trace_id: str) -> Optional[Tuple[str, int]]:
+        for stream in streams:
+            row = self._connect(stream).execute(
+                "SELECT segment, offset FROM trace_index WHERE trace_id = ?",
+                (trace_id,),
+            ).fetchone()
+            if row:
+                return row[0], row[1]
+        return None
+
+    def _close_idle(self, now: float) -> None:
+        if now - self._last_sweep < self.idle_seconds:
+            return
+        self._last_sweep = now
+        for stream, used in list(self._last_used.items()):
+            if now - used >= self.idle_seconds:
+                self._conns.pop(stream).close()
+                del self._last_used[stream]
+
+    def _connect(self, stream: str, create: bool = False) -> sqlite3.Connection:
+        if self._pid != os.getpid():
+            # Forked: the parent's connections must not be used (or closed) here.
+            self._conns = {}
+            self._last_used = {}
+            self._pid = os.getpid()
+        now = time.monotonic()
+        self._close_idle(now)
+        self._last_used[stream] = now
+        conn = self._conns.get(stream)
+        if conn is None:
+            path = self.stream_path(stream)
+            if create:
+                path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(path),
+                timeout=30.0,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+            self._conns[stream] = conn
+        return conn
@@ -0,0 +1,94 @@
+"""
+TRACE READER
+------------
+Incremental parsing of trace archives: a JSON array (the legacy log,
+exports), line-delimited JSON (segments, .jsonl) or a segment
+directory.
+
+- One record at a time: memory is bounded by read_size plus the
+  largest record, never by archive size
+- Shared by the legacy import (bucket_logger) and the replay tools
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+READ_SIZE = 1 << 20
+
+
+# -------------------------------------------------
+# INCREMENTAL PARSING
+# -------------------------------------------------
+
+def iter_traces(path, read_size: int = READ_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Yield trace records one at a time from a file or segment directory.
+    """
+    path = Path(path)
+    if path.is_dir():
+        for segment in sorted(path.glob("*.jsonl")):
+            yield from iter_traces(segment, read_size)
+        return
+
+    with path.open("r", encoding="utf-8-sig") as f:
+        head = f.read(read_size)
+        stripped = head.lstrip()
+        if stripped.startswith("["):
+            yield from _iter_json_array(f, stripped[1:], read_size)
+        else:
+            yield from _iter_json_lines(f, head, read_size)
+
+
+def _iter_json_lines(f, head: str, read_size: int) -> Iterator[Dict[str, Any]]:
+    pending = ""
+    chunk = head
+    while chunk:
+        pending += chunk
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
+        chunk = f.read(read_size)
+    if pending.strip():
+        yield json.loads(pending)
+
+
+def _iter_json_array(f, buf: str, read_size: int) -> Iterator[Dict[str, Any]]:
+    decoder = json.JSONDecoder()
+    pos = 0
+    eof = False
+
+    while True:
+        # Skip separators between elements
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos < len(buf) or eof:
+                break
+            buf, pos = buf[pos:] + f.read(read_size), 0
+            eof = eof or pos == len(buf)
+
+        if pos >= len(buf):
+            raise ValueError("Unterminated JSON array")
+        if buf[pos] == "]":
+            return
+
+        try:
+            record, end = decoder.raw_decode(buf, pos)
+            complete = end < len(buf) or eof
+        except ValueError:
+            if eof:
+                raise
+            complete = False
+
+        if not complete:
+            more = f.read(read_size)
+            eof = not more
+            buf, pos = buf[pos:] + more, 0
+            continue
+
+        yield record
+        pos = end
+        if pos > read_size:
+            buf, pos = buf[pos:], 0
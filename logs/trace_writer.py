@@ -0,0 +1,346 @@
+"""
+TRACE WRITER
+------------
+Background group-commit writer for the segmented trace log.
+
+enforce() hands records to a bounded queue; one writer thread drains
+it and commits everything queued as ONE write (+ fsync if required).
+
+Durability levels:
+- fsync_always   : every record is fsynced before its caller returns
+                   (callers wait; concurrent callers share one fsync)
+- fsync_interval : fsync at most every fsync_interval_ms or every
+                   fsync_interval_records records, whichever comes first
+- os_buffered    : write + flush only, the OS decides when to persist
+                   (flush() / close() still fsync)
+
+Backpressure (queue full):
+- block  : wait up to block_timeout_ms for room, then write inline
+- inline : write inline immediately (caller pays the disk latency)
+- drop   : drop the records, count them, and return False
+
+Failures are reported, never hidden: submit() returns False when its
+records were dropped or (fsync_always / inline) not persisted, and
+flush() returns False when a commit failed since the previous
+barrier. Lost records are counted (records_dropped / records_failed).
+
+NEVER throws into enforcement.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+DURABILITY_LEVELS = ("fsync_always", "fsync_interval", "os_buffered")
+BACKPRESSURE_POLICIES = ("block", "inline", "drop")
+
+_STOP = object()
+
+
+class _Barrier:
+    """
+    Queue marker: signalled once everything ahead of it has been
+    committed and fsynced (ok) or a commit since the previous barrier
+    failed (not ok).
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.ok = False
+
+
+class AsyncTraceWriter:
+
+    def __init__(
+        self,
+        log,
+        *,
+        durability: str = "fsync_interval",
+        fsync_interval_ms: float = 50,
+        fsync_interval_records: int = 256,
+        queue_max: int = 10000,
+        backpressure: str = "block",
+        block_timeout_ms: float = 100,
+        max_batch: int = 1024,
+    ):
+        if durability not in DURABILITY_LEVELS:
+            raise ValueError(f"Unknown durability level: {durability}")
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {backpressure}")
+
+        self.log = log
+        self.durability = durability
+        self.fsync_interval = float(fsync_interval_ms) / 1000.0
+        self.fsync_interval_records = max(int(fsync_interval_records), 1)
+        self.backpressure = backpressure
+        self.block_timeout = float(block_timeout_ms) / 1000.0
+        self.max_batch = max(int(max_batch), 1)
+        self.queue_max = max(int(queue_max), 1)
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=self.queue_max)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._closed = False
+
+        self._unsynced_records = 0
+        self._last_sync = time.monotonic()
+        self._failed_since_barrier = False      # writer thread only; cleared by a barrier
+
+        self.records_committed = 0
+        self.records_dropped = 0
+        self.records_failed = 0
+        self.records_inline = 0
+        self.commits = 0
+        self.fsyncs = 0
+        self.write_errors = 0
+        self._commit_seconds_total = 0.0
+        self._commit_seconds_max = 0.0
+        self._commit_seconds_last = 0.0
+
+    # -------------------------------------------------
+    # PRODUCER SIDE (REQUEST PATH)
+    # -------------------------------------------------
+
+    def submit(self, records: List[Dict[str, Any]]) -> bool:
+        """
+        Hand records to the writer. Returns False if they were dropped,
+        or if a write the caller waited for (fsync_always, inline)
+        failed.
+        """
+        if not records:
+            return True
+
+        if self._closed:
+            return self._write_inline(records)
+
+        self._ensure_started()
+
+        barrier = _Barrier() if self.durability == "fsync_always" else None
+
+        try:
+            self._queue.put_nowait(records)
+        except queue.Full:
+            if self.backpressure == "drop":
+                with self._stats_lock:
+                    self.records_dropped += len(records)
+                return False
+
+            if self.backpressure == "block":
+                try:
+                    self._queue.put(records, timeout=self.block_timeout)
+                except queue.Full:
+                    return self._write_inline(records)
+            else:
+                return self._write_inline(records)
+
+        if barrier is not None:
+            self._queue.put(barrier)
+            barrier.done.wait()
+            return barrier.ok
+
+        return True
+
+    def try_submit(self, records: List[Dict[str, Any]]) -> bool:
+        """
+        Non-blocking submit() for event-loop callers.
+
+        Returns False, without queuing anything, whenever submit()
+        could block: queue full, writer closed, or fsync_always
+        (the caller would wait for the fsync). The caller then runs
+        submit() off the loop.
+        """
+        if not records:
+            return True
+        if self._closed or self.durability == "fsync_always":
+            return False
+
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(records)
+        except queue.Full:
+            return False
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until everything submitted so far is written AND fsynced.
+        False on timeout or if a commit failed since the last barrier.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            try:
+                self._sync()
+            except Exception:
+                with self._stats_lock:
+                    self.write_errors += 1
+                return False
+            return True
+
+        barrier = _Barrier()
+        self._queue.put(barrier)
+        return barrier.done.wait(timeout) and barrier.ok
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Flush-on-shutdown hook: drain, fsync, stop the writer thread.
+        """
+        if self._closed:
+            return
+        self.flush(timeout)
+        self._closed = True
+
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            commits = self.commits
+            return {
+                "durability": self.durability,
+                "backpressure": self.backpressure,
+                "queue_depth": self._queue.qsize(),
+                "queue_max": self.queue_max,
+                "records_committed": self.records_committed,
+                "records_dropped": self.records_dropped,
+                "records_failed": self.records_failed,
+                "records_inline": self.records_inline,
+                "commits": commits,
+                "fsyncs": self.fsyncs,
+                "write_errors": self.write_errors,
+                "commit_latency_ms_avg": (
+                    self._commit_seconds_total / commits * 1000.0 if commits else 0.0
+                ),
+                "commit_latency_ms_max": self._commit_seconds_max * 1000.0,
+                "commit_latency_ms_last": self._commit_seconds_last * 1000.0,
+            }
+
+    # -------------------------------------------------
+    # WRITER THREAD
+    # -------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="trace-writer",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=self._idle_timeout())
+            except queue.Empty:
+                try:
+                    self._maybe_sync()
+                except Exception:
+                    with self._stats_lock:
+                        self.write_errors += 1
+                    self._failed_since_barrier = True
+                continue
+
+            batch: List[Dict[str, Any]] = []
+            barriers: List[_Barrier] = []
+            stop = False
+
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, _Barrier):
+                    barriers.append(item)
+                else:
+                    batch.extend(item)
+
+                if stop or len(batch) >= self.max_batch:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            ok = self._commit(batch, sync=bool(barriers))
+            if barriers:
+                ok = ok and not self._failed_since_barrier
+                self._failed_since_barrier = False
+            elif not ok:
+                self._failed_since_barrier = True
+
+            for barrier in barriers:
+                barrier.ok = ok
+                barrier.done.set()
+
+            if stop:
+                return
+
+    def _commit(self, records: List[Dict[str, Any]], *, sync: bool) -> bool:
+        started = time.monotonic()
+        try:
+            if records:
+                self.log.append(records)
+                self._unsynced_records += len(records)
+            if sync:
+                self._sync()
+            else:
+                self._maybe_sync()
+        except Exception:
+            with self._stats_lock:
+                self.write_errors += 1
+                self.records_failed += len(records)
+            return False
+
+        elapsed = time.monotonic() - started
+        if records:
+            with self._stats_lock:
+                self.records_committed += len(records)
+                self.commits += 1
+                self._commit_seconds_total += elapsed
+                self._commit_seconds_last = elapsed
+                if elapsed > self._commit_seconds_max:
+                    self._commit_seconds_max = elapsed
+        return True
+
+    def _maybe_sync(self) -> None:
+        if self.durability != "fsync_interval" or not self._unsynced_records:
+            return
+        due = (
+            self._unsynced_records >= self.fsync_interval_records
+            or time.monotonic() - self._last_sync >= self.fsync_interval
+        )
+        if due:
+            self._sync()
+
+    def _sync(self) -> None:
+        self.log.sync()
+        self._unsynced_records = 0
+        self._last_sync = time.monotonic()
+        with self._stats_lock:
+            self.fsyncs += 1
+
+    def _idle_timeout(self) -> Optional[float]:
+        if self.durability == "fsync_interval" and self._unsynced_records:
+            return max(self.fsync_interval - (time.monotonic() - self._last_sync), 0.001)
+        return None
+
+    # -------------------------------------------------
+    # INLINE FALLBACK
+    # -------------------------------------------------
+
+    def _write_inline(self, records: List[Dict[str, Any]]) -> bool:
+        try:
+            self.log.append(records)
+            if self.durability == "fsync_always":
+                self.log.sync()
+        except Exception:
+            with self._stats_lock:
+                self.write_errors += 1
+                self.records_failed += len(records)
+            return False
+        with self._stats_lock:
+            self.records_inline += len(records)
+        return True
@@ -2,26 +2,20 @@ import json
 import sys
 from pathlib import Path
 
-import sys
-from pathlib import Path
-
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT))
 
-from enforcement_engine import enforce
+from enforcement_engine import enforce, replay_config, replay_mode
+from logs.bucket_logger import lookup_trace
 
 from models.enforcement_input import EnforcementInput
 
-LOG_FILE = Path("logs/replayable_traces.json")
-
 
 def replay(trace_id: str):
-    with LOG_FILE.open("r", encoding="utf-8") as f:
-        for line in f:
-            record = json.loads(line)
-            if record["trace_id"] == trace_id:
-                return record
-    raise ValueError("Trace ID not found")
+    record = lookup_trace(trace_id)
+    if record is None:
+        raise ValueError("Trace ID not found")
+    return record
 
 
 def rebuild_input(snapshot: dict) -> EnforcementInput:
@@ -36,6 +30,25 @@ def rebuild_input(snapshot: dict) -> EnforcementInput:
     )
 
 
+def replay_record(record: dict) -> dict:
+    # Replay under the config version the record was written under
+    config_hash = record.get("config_hash")
+    config, config_available = replay_config(config_hash)
+
+    enforcement_input = rebuild_input(record["input_snapshot"])
+    with replay_mode(config=config):
+        decision = enforce(enforcement_input)
+
+    return {
+        "trace_id": record["trace_id"],
+        "original_decision": record["final_decision"],
+        "replayed_decision": decision.decision,
+        "config_hash": config_hash,
+        "config_available": config_available,
+        "match": config_available and record["final_decision"] == decision.decision,
+    }
+
+
 if __name__ == "__main__":
     if len(sys.argv) != 2:
         print("Usage: python replay/replay_enforcement.py <trace_id>")
@@ -44,14 +57,6 @@ if __name__ == "__main__":
     trace_id = sys.argv[1]
     record = replay(trace_id)
 
-    enforcement_input = rebuild_input(record["input_snapshot"])
-    decision = enforce(enforcement_input)
-
-    result = {
-        "trace_id": trace_id,
-        "original_decision": record["final_decision"],
-        "replayed_decision": decision.decision,
-        "match": record["final_decision"] == decision.decision,
-    }
+    result = replay_record(record)
 
     print(json.dumps(result, indent=2))
@@ -1,22 +1,15 @@
 import json
-from pathlib import Path
 
-from enforcement_engine import enforce
+from enforcement_engine import enforce, replay_config, replay_mode
+from logs.bucket_logger import lookup_trace
 from models.enforcement_input import EnforcementInput
 
-LOG_FILE = Path("logs/enforcement_logs.jsonl")
-
 def replay(trace_id: str):
-    if not LOG_FILE.exists():
-        raise FileNotFoundError("No enforcement logs found.")
-
-    with LOG_FILE.open("r", encoding="utf-8") as f:
-        for line in f:
-            record = json.loads(line)
-            if record["trace_id"] == trace_id:
-                return _replay_record(record)
+    record = lookup_trace(trace_id)
+    if record is None:
+        raise ValueError(f"Trace ID not found: {trace_id}")
 
-    raise ValueError(f"Trace ID not found: {trace_id}")
+    return _replay_record(record)
 
 def _replay_record(record):
     input_snapshot = record["input_snapshot"]
@@ -31,13 +24,21 @@ def _replay_record(record):
         risk_flags=input_snapshot["risk_flags"],
     )
 
-    decision = enforce(reconstructed_input)
+    # Replay under the config version the record was written under
+    config_hash = record.get("config_hash")
+    config, config_available = replay_config(config_hash)
+    with replay_mode(config=config):
+        decision = enforce(reconstructed_input)
 
     return {
         "original_trace_id": record["trace_id"],
         "original_decision": record["final_decision"],
         "replayed_decision": decision.decision,
-        "deterministic_match": decision.decision == record["final_decision"],
+        "config_hash": config_hash,
+        "config_available": config_available,
+        "deterministic_match": (
+            config_available and decision.decision == record["final_decision"]
+        ),
     }
 
 if __name__ == "__main__":
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+import enforcement_gateway
+from enforcement_gateway import app
+from utils.admission import (
+    SHED_QUEUE_FULL,
+    SHED_QUEUE_TIMEOUT,
+    AdmissionController,
+    Overloaded,
+)
+
+client = TestClient(app)
+
+
+def make_request():
+    return {
+        "intelligence": {
+            "data": {
+                "trace_id": "upstream-1",
+                "intent": "admission please",
+                "suggested_action": "respond",
+                "confidence": 0.9,
+                "version_hash": "INTELLIGENCE_v1_LOCKED",
+            }
+        },
+        "context": {
+            "emotional_output": {"tone": "neutral", "dependency_score": 0.0},
+            "age_gate_status": "ALLOWED",
+            "region_policy": "IN",
+            "platform_policy": "INSTAGRAM",
+            "karma_score": 0.0,
+            "risk_flags": [],
+        },
+    }
+
+
+def test_queue_timeout_and_queue_full_are_shed():
+    admission = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout_ms=20)
+
+    async def scenario():
+        await admission.acquire()                      # holds the only slot
+        waiter = asyncio.ensure_future(admission.acquire())
+        await asyncio.sleep(0)                         # waiter is queued
+
+        with pytest.raises(Overloaded) as full:
+            await admission.acquire()
+        assert full.value.reason == SHED_QUEUE_FULL
+
+        with pytest.raises(Overloaded) as timed_out:
+            await waiter
+        assert timed_out.value.reason == SHED_QUEUE_TIMEOUT
+
+        admission.release()
+
+    asyncio.run(scenario())
+
+    assert admission.active() == 0
+    assert admission.queued() == 0
+    assert admission.shed.value(SHED_QUEUE_FULL) == 1
+    assert admission.shed.value(SHED_QUEUE_TIMEOUT) == 1
+
+
+def test_released_slot_is_handed_to_oldest_waiter():
+    admission = AdmissionController(max_concurrent=1, max_queue=4, queue_timeout_ms=1000)
+    order = []
+
+    async def request(name):
+        async with admission.slot():
+            order.append(name)
+            await asyncio.sleep(0.001)
+
+    async def scenario():
+        await asyncio.gather(*(request(i) for i in range(4)))
+
+    asyncio.run(scenario())
+
+    assert order == [0, 1, 2, 3]
+    assert admission.active() == 0
+    assert admission.queue_wait.snapshot()["count"] == 4
+
+
+def test_gateway_sheds_with_deterministic_block(monkeypatch):
+    admission = AdmissionController(max_concurrent=1, max_queue=0, queue_timeout_ms=0)
+    monkeypatch.setattr(enforcement_gateway, "ADMISSION", admission)
+
+    asyncio.run(admission.acquire())                   # saturate
+    try:
+        first = client.post("/enforce", json=make_request()).json()
+        second = client.post("/enforce", json=make_request()).json()
+    finally:
+        admission.release()
+
+    assert first["decision"] == "BLOCK"
+    assert first["reason_code"] == "OVERLOAD_SHED"
+    assert first == second
+    assert admission.shed.value(SHED_QUEUE_FULL) == 2
+
+    # Capacity back: the same request is enforced normally
+    admitted = client.post("/enforce", json=make_request()).json()
+    assert admitted["decision"] == "EXECUTE"
+    assert admitted["reason_code"] is None
+    assert admitted["trace_id"] != first["trace_id"]
@@ -0,0 +1,95 @@
+import random
+import re
+
+from validators.akanksha.behavior_validator import (
+    BehaviorValidator,
+    CompiledPatternLibrary,
+    Decision,
+    PatternLibrary,
+    RiskCategory,
+)
+
+
+def reference_validate(validator, text, age_gate_status):
+    """
+    Pattern-by-pattern reference (the pre-compiled algorithm).
+    """
+    lowered = text.lower()
+    if not age_gate_status and re.search(r'love|romantic|attached|dependency', lowered):
+        return validator._hard_block(
+            RiskCategory.YOUTH_RISK_BEHAVIOR,
+            ["underage_emotional_context"],
+            text,
+            98.0,
+            "Under-age emotional or romantic dependency detected",
+        )
+    for table, decision in (
+        (PatternLibrary.HARD_DENY_PATTERNS, Decision.HARD_DENY),
+        (PatternLibrary.SOFT_REWRITE_PATTERNS, Decision.SOFT_REWRITE),
+    ):
+        for category, patterns in table.items():
+            matches = [
+                (confidence, pattern, label)
+                for pattern, confidence, label in patterns
+                if re.search(pattern, lowered, re.IGNORECASE)
+            ]
+            if matches:
+                return validator._build_result(decision, category, matches, text)
+    return None
+
+
+FRAGMENTS = [
+    "kill myself", "unalive myself", "want to die", "I will kill you",
+    "kill someone", "send me nudes", "tell me something sexy", "sexting",
+    "I am 15", "I am 19", "underage", "minor", "minors", "stay with me forever",
+    "you are all I have", "don’t leave me", "if you really cared", "you owe me",
+    "I am lonely", "all alone", "love", "glove", "romantic", "attached",
+    "dependency_score: 0.9", "hello", "xkill myself", "ſexting", "KILL MYSELF",
+    " ", " | ", "tone: neutral",
+]
+
+
+def corpus(n=400, seed=7):
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield "".join(rng.choice(FRAGMENTS) + rng.choice(["", " ", ".", "_"]) for _ in range(rng.randint(0, 8)))
+
+
+def test_scan_equals_per_pattern_search():
+    library = CompiledPatternLibrary(PatternLibrary)
+    for text in corpus():
+        lowered = text.lower()
+        expected = {
+            e.index
+            for e in library.entries
+            if e.regex.search(lowered)
+        }
+        assert library.scan(lowered) == expected
+
+
+def test_validate_behavior_is_byte_identical_to_reference():
+    validator = BehaviorValidator()
+    for text in corpus():
+        for age_ok in (True, False):
+            result = validator.validate_behavior(
+                intent="",
+                conversational_output=text,
+                age_gate_status=age_ok,
+                region_rule_status=None,
+                platform_policy_state=None,
+                karma_bias_input=0.0,
+            )
+            expected = reference_validate(validator, text, age_ok)
+            if expected is None:
+                assert result.decision == Decision.ALLOW
+                assert result.matched_patterns == []
+            else:
+                assert result.decision == expected.decision
+                assert result.risk_category == expected.risk_category
+                assert result.matched_patterns == expected.matched_patterns
+                assert result.confidence == expected.confidence
+                assert result.internal_trace == expected.internal_trace
+
+
+def test_library_compiled_once_per_validator_default():
+    assert BehaviorValidator().compiled_library is BehaviorValidator().compiled_library
@@ -0,0 +1,183 @@
+import json
+import multiprocessing
+
+import pytest
+
+import logs.bucket_logger as bucket_logger
+from logs.bucket_logger import LOG_FILE, SegmentedTraceLog, export_json_array, log_enforcement
+from logs.trace_index import TraceIndex
+from models.evaluator_result import EvaluatorResult
+
+
+def make_record(i):
+    return {
+        "trace_id": f"{i:064x}",
+        "final_decision": "ALLOW",
+        "input_snapshot": {"intent": f"intent {i} — ünïcode", "risk_flags": []},
+    }
+
+
+def test_fixed_size_segments_and_rollover(tmp_path):
+    log = SegmentedTraceLog(tmp_path, max_records=3)
+    log.append([make_record(i) for i in range(4)])
+    log.append([make_record(i) for i in range(4, 7)])
+
+    segments = log.segments()
+    assert [p.name for p in segments] == [
+        "traces-00000001.jsonl",
+        "traces-00000002.jsonl",
+        "traces-00000003.jsonl",
+    ]
+    assert [len(p.read_text().splitlines()) for p in segments] == [3, 3, 1]
+    assert list(log.iter_records()) == [make_record(i) for i in range(7)]
+
+
+def test_one_canonical_line_per_record(tmp_path):
+    log = SegmentedTraceLog(tmp_path)
+    log.append([make_record(1)])
+
+    line = log.segments()[0].read_text(encoding="utf-8")
+    assert line == json.dumps(
+        make_record(1), sort_keys=True, separators=(",", ":"), ensure_ascii=True
+    ) + "\n"
+
+
+def test_reopen_continues_tail_segment(tmp_path):
+    SegmentedTraceLog(tmp_path, max_records=5).append([make_record(0), make_record(1)])
+
+    log = SegmentedTraceLog(tmp_path, max_records=5)
+    log.append([make_record(i) for i in range(2, 6)])
+
+    assert [len(p.read_text().splitlines()) for p in log.segments()] == [5, 1]
+
+
+def test_torn_tail_is_skipped_and_never_appended_to(tmp_path):
+    log = SegmentedTraceLog(tmp_path)
+    log.append([make_record(0)])
+    log.close()
+    with log.segments()[0].open("a") as f:
+        f.write('{"trace_id": "torn')
+
+    log = SegmentedTraceLog(tmp_path)
+    log.append([make_record(1)])
+
+    assert len(log.segments()) == 2
+    assert list(log.iter_records()) == [make_record(0), make_record(1)]
+
+
+def test_export_is_byte_identical_to_json_array(tmp_path):
+    log = SegmentedTraceLog(tmp_path / "segments", max_records=2)
+    records = [make_record(i) for i in range(5)]
+    log.append(records)
+
+    out = tmp_path / "export.json"
+    assert log.export_json_array(out) == 5
+    assert out.read_text(encoding="utf-8") == json.dumps(
+        records, indent=2, sort_keys=True, ensure_ascii=True
+    )
+
+    empty = SegmentedTraceLog(tmp_path / "empty")
+    assert empty.export_json_array(tmp_path / "empty.json") == 0
+    assert (tmp_path / "empty.json").read_text() == json.dumps([], indent=2)
+
+
+def test_log_enforcement_appends_to_segmented_log(tmp_path, monkeypatch):
+    log = SegmentedTraceLog(tmp_path)
+    monkeypatch.setattr(bucket_logger, "TRACE_LOG", log)
+    monkeypatch.setattr(bucket_logger, "TRACE_WRITER", None)
+
+    log_enforcement(
+        trace_id="abc",
+        input_snapshot={"intent": "hello"},
+        akanksha_verdict={"decision": "EXECUTE", "risk_category": "clean", "confidence": 0.0},
+        evaluator_results=[EvaluatorResult("age_compliance", False, "EXECUTE", "")],
+        final_decision="ALLOW",
+    )
+
+    (record,) = log.iter_records()
+    assert record["trace_id"] == "abc"
+    assert record["input_snapshot"]["intent"] == "hello"
+    assert record["raj_evaluators"] == [
+        {"action": "EXECUTE", "name": "age_compliance", "triggered": False}
+    ]
+
+
+def test_legacy_log_is_imported_once(tmp_path):
+    legacy = tmp_path / "replayable_traces.json"
+    legacy.write_text(json.dumps([make_record(i) for i in range(3)], indent=2))
+    before = legacy.read_bytes()
+
+    log = SegmentedTraceLog(
+        tmp_path / "segments",
+        max_records=2,
+        index=TraceIndex(tmp_path / "index.sqlite3"),
+        per_process=True,
+        legacy_source=legacy,
+    )
+    log.append([make_record(3)])
+    # Appends never pay for the import; the first read does
+    assert not any(p.name.startswith("traces-legacy-") for p in log.segments())
+
+    # Legacy records first, then the live stream
+    assert list(log.iter_records()) == [make_record(i) for i in range(4)]
+    assert [p.name for p in log.segments()][:2] == [
+        "traces-legacy-00000001.jsonl",
+        "traces-legacy-00000002.jsonl",
+    ]
+    assert log.lookup(make_record(1)["trace_id"]) == make_record(1)
+    assert legacy.read_bytes() == before
+
+    # Idempotent: a second importer (or restart) writes nothing
+    assert log.import_json_array(legacy) == 0
+    again = SegmentedTraceLog(tmp_path / "segments", per_process=True, legacy_source=legacy)
+    assert len(list(again.iter_records())) == 4
+
+
+def test_export_refuses_to_overwrite_legacy_log():
+    before = LOG_FILE.read_bytes()
+    with pytest.raises(ValueError):
+        export_json_array(LOG_FILE)
+    assert LOG_FILE.read_bytes() == before
+
+
+def test_legacy_import_streams_and_completes_after_interruption(tmp_path, monkeypatch):
+    legacy = tmp_path / "replayable_traces.json"
+    legacy.write_text(json.dumps([make_record(i) for i in range(5)], indent=2))
+    directory = tmp_path / "segments"
+
+    # Interrupted run: a later segment landed, the first never did
+    log = SegmentedTraceLog(directory, max_records=2)
+    log.import_json_array(legacy)
+    (directory / "traces-legacy-00000001.jsonl").unlink()
+
+    reads = []
+    real = bucket_logger.iter_traces
+    monkeypatch.setattr(bucket_logger, "iter_traces", lambda p: reads.append(p) or real(p, read_size=64))
+    assert log.import_json_array(legacy) == 5
+    assert reads == [legacy]
+    assert [r["trace_id"] for r in log.iter_records()] == [make_record(i)["trace_id"] for i in range(5)]
+    assert not list(directory.glob(".*.tmp"))
+
+
+def _import_legacy(directory, legacy, queue):
+    log = SegmentedTraceLog(directory, max_records=2)
+    queue.put(log.import_json_array(legacy))
+
+
+def test_only_one_process_imports_the_legacy_log(tmp_path):
+    legacy = tmp_path / "replayable_traces.json"
+    legacy.write_text(json.dumps([make_record(i) for i in range(50)], indent=2))
+    directory = tmp_path / "segments"
+
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    workers = [ctx.Process(target=_import_legacy, args=(directory, legacy, queue)) for _ in range(4)]
+    for p in workers:
+        p.start()
+    imported = sorted(queue.get(timeout=60) for _ in workers)
+    for p in workers:
+        p.join(60)
+        assert p.exitcode == 0
+
+    assert imported == [0, 0, 0, 50]
+    assert len(list(SegmentedTraceLog(directory).iter_records())) == 50
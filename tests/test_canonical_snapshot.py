@@ -0,0 +1,104 @@
+import hashlib
+import json
+import pickle
+from pathlib import Path
+
+from __version__ import ENGINE_VERSION
+from logs.bucket_logger import _build_record, canonical_record_line
+from models.evaluator_result import EvaluatorResult
+from utils.deterministic_trace import (
+    CanonicalSnapshot,
+    encode_canonical,
+    generate_trace_id,
+    normalize_input,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+
+GOLDEN_PAYLOADS = [
+    {},
+    {"b": 1, "a": 2},
+    {
+        "intent": "Stay With Me FOREVER",
+        "emotional_output": {"tone": "Attached", "dependency_score": 0.9},
+        "age_gate_status": "ALLOWED",
+        "region_policy": "IN",
+        "platform_policy": "INSTAGRAM",
+        "karma_score": 0.0,
+        "risk_flags": ["SELF_HARM", "PLATFORM_VIOLATION"],
+    },
+    {"unicode": "héllo — 😀 ÅNGSTRÖM", "quote": 'say "hi"\\n', "ctrl": "\t\x00\x1f"},
+    {"floats": [0.1, 1e-7, 1e21, -0.0, 3.0, 123456789.123456789]},
+    {"ints": [0, -1, 2 ** 63, True, False, None]},
+    {"nested": {"z": {"y": [{"b": 1, "a": [2, {"d": 4, "c": 3}]}]}}},
+    {"nan": float("nan"), "inf": float("inf"), "ninf": float("-inf")},
+    {"Key": "UPPER", "key": "lower"},
+]
+
+GOLDEN_NORMALIZED = [
+    "{}",
+    '{"a":2,"b":1}',
+    '{"age_gate_status":"allowed","emotional_output":{"dependency_score":0.9,'
+    '"tone":"attached"},"intent":"stay with me forever","karma_score":0.0,'
+    '"platform_policy":"instagram","region_policy":"in",'
+    '"risk_flags":["self_harm","platform_violation"]}',
+]
+
+
+def reference_trace_id(payload, category):
+    raw = f"{normalize_input(payload)}|{category.lower()}|{ENGINE_VERSION}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def test_fast_encoder_is_byte_identical_to_normalize_input():
+    for payload in GOLDEN_PAYLOADS:
+        assert encode_canonical(payload).lower().encode() == normalize_input(payload).encode()
+        assert CanonicalSnapshot(payload).normalized == normalize_input(payload)
+
+    for payload, expected in zip(GOLDEN_PAYLOADS, GOLDEN_NORMALIZED):
+        assert normalize_input(payload) == expected
+
+
+def test_trace_ids_unchanged():
+    for payload in GOLDEN_PAYLOADS:
+        snapshot = CanonicalSnapshot(payload)
+        for category in ("ALLOW", "REWRITE", "BLOCK", "TERMINATE", "RUNTIME_GATEWAY", 7):
+            expected = reference_trace_id(payload, str(category))
+            assert generate_trace_id(payload, category) == expected
+            assert generate_trace_id(snapshot, category) == expected
+            assert snapshot.trace_id(category) == expected
+
+
+def test_historical_trace_ids_reproduce():
+    records = json.loads((ROOT / "logs" / "replayable_traces.json").read_text())
+    assert records
+    for record in records:
+        snapshot = CanonicalSnapshot(record["input_snapshot"])
+        assert snapshot.trace_id(record["final_decision"]) == record["trace_id"]
+
+
+def test_record_line_splice_is_byte_identical():
+    snapshot = CanonicalSnapshot(GOLDEN_PAYLOADS[2])
+    for stage_timings in (None, {"akanksha": 12, "evaluator.x": 1}):
+        record = _build_record(
+            trace_id=snapshot.trace_id("REWRITE"),
+            input_snapshot=snapshot,
+            akanksha_verdict={"decision": "soft_rewrite", "risk_category": "ÿ", "confidence": 0.5},
+            evaluator_results=[EvaluatorResult("dependency_tone", True, "REWRITE", "X")],
+            final_decision="REWRITE",
+            stage_timings=stage_timings,
+        )
+        assert record["input_snapshot"] is snapshot
+        assert canonical_record_line(record) == json.dumps(
+            record, sort_keys=True, separators=(",", ":"), ensure_ascii=True
+        )
+
+
+def test_snapshot_is_a_plain_mapping_and_pickles():
+    snapshot = CanonicalSnapshot(GOLDEN_PAYLOADS[2])
+    snapshot.trace_id("ALLOW")
+
+    clone = pickle.loads(pickle.dumps(snapshot))
+    assert clone == snapshot == GOLDEN_PAYLOADS[2]
+    assert clone.canonical == snapshot.canonical
+    assert clone.trace_id("ALLOW") == snapshot.trace_id("ALLOW")
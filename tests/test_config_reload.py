@@ -0,0 +1,247 @@
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+import enforcement_engine
+import replay_enforcement
+import tools.replay_verifier as replay_verifier
+from replay.replay_enforcement import replay_record
+from config_loader import CONFIG, CONFIG_DIR, ConfigManager
+from enforcement_engine import enforce, enforce_many, replay_mode
+from evaluator_modules import build_evaluators
+from tools.replay_tool import replay_trace
+from logs.bucket_logger import MemorySink, use_log_sink
+from utils.verdict_cache import VerdictCache
+from models.enforcement_input import EnforcementInput
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+def make_input(dependency_score=0.5):
+    return EnforcementInput(
+        intent="config reload",
+        emotional_output={"tone": "neutral", "dependency_score": dependency_score},
+        age_gate_status="ALLOWED",
+        region_policy="IN",
+        platform_policy="INSTAGRAM",
+        karma_score=0.0,
+        risk_flags=[],
+    )
+
+
+def make_manager(tmp_path):
+    config_dir = tmp_path / "config"
+    shutil.copytree(CONFIG_DIR, config_dir)
+    manager = ConfigManager(config_dir, archive_dir=tmp_path / "archive")
+    manager.register_derived(
+        "evaluators",
+        lambda snapshot: tuple(build_evaluators(snapshot.enforcement.get("evaluators"))),
+    )
+    return manager
+
+
+def set_threshold(config_dir, threshold):
+    path = config_dir / "enforcement.yaml"
+    document = yaml.safe_load(path.read_text())
+    document["evaluators"]["dependency_tone"]["threshold"] = threshold
+    path.write_text(yaml.safe_dump(document))
+    # Same-second rewrites must still change the signature
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_paths_resolve_relative_to_the_package(tmp_path):
+    probe = "import config_loader; print(config_loader.CONFIG.snapshot.config_hash)"
+    output = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": str(ROOT_DIR)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert output.stdout.strip() == CONFIG.snapshot.config_hash
+
+
+def test_snapshot_is_read_only():
+    with pytest.raises(TypeError):
+        CONFIG.snapshot.runtime["kill_switch"] = True
+    with pytest.raises(TypeError):
+        CONFIG.snapshot.enforcement["evaluators"]["dependency_tone"].update(threshold=0.1)
+
+
+def test_changed_file_is_validated_and_swapped(tmp_path):
+    manager = make_manager(tmp_path)
+    before = manager.snapshot
+
+    assert manager.check() is False
+    set_threshold(manager.config_dir, 0.4)
+    assert manager.check() is True
+
+    after = manager.snapshot
+    assert after.config_hash != before.config_hash
+    assert after.derived["evaluators"][4].threshold == 0.4
+    # The old version is untouched and archived for replay
+    assert before.derived["evaluators"][4].threshold == 0.7
+    assert manager.archived(before.config_hash).config_hash == before.config_hash
+    assert manager.reloads == 1
+
+
+def set_runtime(config_dir, **changes):
+    path = config_dir / "runtime.yaml"
+    document = yaml.safe_load(path.read_text())
+    for dotted, value in changes.items():
+        *parents, key = dotted.split("__")
+        section = document
+        for parent in parents:
+            section = section[parent]
+        section[key] = value
+    path.write_text(yaml.safe_dump(document))
+
+
+def test_config_hash_covers_policy_fields_only(tmp_path, monkeypatch):
+    manager = make_manager(tmp_path)
+    monkeypatch.setattr(enforcement_engine, "CONFIG", manager)
+    cache = VerdictCache()
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", cache)
+    before = manager.snapshot
+
+    with use_log_sink(MemorySink()) as sink:
+        enforce(make_input())
+        # Operational knobs: published, same hash, cached verdicts still hit
+        set_runtime(
+            manager.config_dir,
+            verdict_cache__ttl_seconds=60,
+            gateway__admission__max_queue=8,
+            instrumentation__sample_rate=0.5,
+        )
+        assert manager.check() is True
+        enforce(make_input())
+
+    assert manager.snapshot.runtime["verdict_cache"]["ttl_seconds"] == 60
+    assert manager.snapshot.config_hash == before.config_hash
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["invalidations"] == 0
+    result = replay_verifier.verify_chunk(sink.records, max_samples=5)
+    assert result["verified"] == 2
+    assert result["config_unavailable"] == 0
+
+    # Policy fields: new hash
+    set_runtime(manager.config_dir, kill_switch=True)
+    assert manager.check() is True
+    assert manager.snapshot.config_hash != before.config_hash
+
+
+def test_invalid_version_keeps_the_active_snapshot(tmp_path):
+    manager = make_manager(tmp_path)
+    before = manager.snapshot
+
+    set_threshold(manager.config_dir, 7)
+    assert manager.check() is False
+    assert manager.snapshot.config_hash == before.config_hash
+    assert manager.reload_failures == 1
+    assert "threshold" in manager.last_error
+
+    path = manager.config_dir / "enforcement.yaml"
+    document = yaml.safe_load(path.read_text())
+    document["evaluators"]["dependency_tone"] = 0.5
+    path.write_text(yaml.safe_dump(document))
+    assert manager.check() is False
+    assert manager.snapshot.config_hash == before.config_hash
+    assert "dependency_tone must be a mapping" in manager.last_error
+
+    (manager.config_dir / "runtime.yaml").write_text("kill_switch: [unterminated\n")
+    assert manager.check() is False
+    assert manager.snapshot.config_hash == before.config_hash
+    assert manager.reload_failures == 3
+
+    # Not retried until the files change again
+    assert manager.check() is False
+    assert manager.reload_failures == 3
+
+
+def test_watcher_publishes_off_the_request_path(tmp_path):
+    manager = make_manager(tmp_path)
+    before = manager.snapshot.config_hash
+    manager.start_watching(interval_ms=5)
+    try:
+        set_threshold(manager.config_dir, 0.3)
+        deadline = time.monotonic() + 5
+        while manager.snapshot.config_hash == before:
+            assert time.monotonic() < deadline
+            time.sleep(0.005)
+    finally:
+        manager.stop_watching()
+    assert manager.status()["watching"] is False
+
+
+def test_engine_records_config_hash_and_follows_a_swap(tmp_path, monkeypatch):
+    manager = make_manager(tmp_path)
+    monkeypatch.setattr(enforcement_engine, "CONFIG", manager)
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", None)
+    old_hash = manager.snapshot.config_hash
+
+    with use_log_sink(MemorySink()) as sink:
+        assert enforce(make_input()).decision == "ALLOW"
+        set_threshold(manager.config_dir, 0.4)
+        manager.check()
+        assert enforce(make_input()).decision == "REWRITE"
+        [batched] = enforce_many([make_input()])
+
+    assert batched.decision == "REWRITE"
+    hashes = [r["config_hash"] for r in sink.records]
+    assert hashes == [old_hash, manager.snapshot.config_hash, manager.snapshot.config_hash]
+    assert hashes[0] != hashes[1]
+
+
+def test_replay_uses_the_recorded_snapshot(tmp_path, monkeypatch):
+    manager = make_manager(tmp_path)
+    monkeypatch.setattr(enforcement_engine, "CONFIG", manager)
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", None)
+
+    sink = MemorySink()
+    with replay_mode(sink):
+        enforce(make_input())                      # ALLOW under threshold 0.7
+    set_threshold(manager.config_dir, 0.4)
+    manager.check()                                # now REWRITE
+
+    result = replay_verifier.verify_chunk(sink.records, max_samples=5)
+    assert result["verified"] == 1
+    assert result["decision_mismatches"] == 0
+
+    record = {**sink.records[0], "config_hash": "0" * 64}
+    result = replay_verifier.verify_chunk([record], max_samples=5)
+    assert result["config_unavailable"] == 1
+
+
+def test_replay_entry_points_use_the_recorded_snapshot(tmp_path, monkeypatch):
+    manager = make_manager(tmp_path)
+    monkeypatch.setattr(enforcement_engine, "CONFIG", manager)
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", None)
+
+    sink = MemorySink()
+    with replay_mode(sink):
+        enforce(make_input())                      # ALLOW under threshold 0.7
+    set_threshold(manager.config_dir, 0.4)
+    manager.check()                                # now REWRITE
+    [record] = sink.records
+
+    replayed = replay_enforcement._replay_record(record)
+    assert replayed["replayed_decision"] == "ALLOW"
+    assert replayed["deterministic_match"] is True
+    assert replay_record(record)["match"] is True
+    assert replay_trace(record) is True
+
+    # Snapshot not archived here: reported, never a silent match
+    missing = {**record, "config_hash": "0" * 64}
+    replayed = replay_enforcement._replay_record(missing)
+    assert replayed["config_available"] is False
+    assert replayed["deterministic_match"] is False
+    assert replay_record(missing)["match"] is False
+    assert replay_trace(missing) is False
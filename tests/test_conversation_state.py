@@ -0,0 +1,83 @@
+from validators.akanksha.behavior_validator import BehaviorValidator, Decision
+from validators.akanksha.conversation_state import ConversationStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def batch(validator, text, age_ok=True):
+    return validator.validate_behavior(
+        intent="",
+        conversational_output=text,
+        age_gate_status=age_ok,
+        region_rule_status=None,
+        platform_policy_state=None,
+        karma_bias_input=0.0,
+    )
+
+
+TURNS = [
+    "hi there",
+    "I am lonely tonight",
+    "you owe me, I am lonely",
+    "stay with me forever, I am lonely and all alone",
+    "ok bye",
+]
+
+
+def test_turn_results_match_isolated_validation_and_counts_accumulate():
+    validator = BehaviorValidator()
+    store = ConversationStore(validator, escalation_threshold=3)
+
+    outcomes = [store.validate_turn("conv-1", text, True) for text in TURNS]
+
+    assert [o.result for o in outcomes] == [batch(validator, t) for t in TURNS]
+    signals = outcomes[3].signals
+    assert signals.turn == 4
+    assert signals.category_turns["loneliness_hook"] == 3
+    assert signals.category_hits["loneliness_hook"] == 4     # two patterns in turn 4
+    assert signals.category_turns["manipulative_phrasing"] == 1
+    assert signals.escalating_categories == ("loneliness_hook",)
+    assert signals.consecutive_risky_turns == 3 and signals.escalated
+
+    last = outcomes[4].signals
+    assert last.consecutive_risky_turns == 0 and last.risky_turns == 3
+    assert outcomes[0].signals.escalated is False
+
+
+def test_conversations_are_isolated_by_handle():
+    store = ConversationStore()
+    store.validate_turn("a", "I am lonely", True)
+    other = store.validate_turn("b", "hello", True)
+    assert other.signals.turn == 1 and other.signals.category_hits == {}
+
+
+def test_underage_context_counts_as_youth_risk():
+    store = ConversationStore()
+    outcome = store.validate_turn("teen", "i love you", False)
+    assert outcome.result.decision == Decision.HARD_DENY
+    assert outcome.signals.category_hits == {"youth_risk_behavior": 1}
+
+
+def test_store_is_bounded_and_evicts_idle_conversations():
+    clock = FakeClock()
+    store = ConversationStore(max_conversations=2, idle_ttl_seconds=10, clock=clock)
+
+    store.validate_turn("a", "I am lonely", True)
+    store.validate_turn("b", "I am lonely", True)
+    store.validate_turn("c", "I am lonely", True)      # evicts "a" (LRU)
+    assert store.stats()["evictions"] == 1
+    assert store.validate_turn("a", "I am lonely", True).signals.turn == 1
+
+    clock.now = 11
+    store.validate_turn("d", "hi", True)               # the rest are idle
+    assert store.stats()["expirations"] == 2
+    assert store.stats()["conversations"] == 1
+
+    store.close("d")
+    assert store.stats()["conversations"] == 0
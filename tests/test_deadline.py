@@ -0,0 +1,143 @@
+import itertools
+
+import pytest
+from fastapi.testclient import TestClient
+
+import enforcement_engine
+import enforcement_gateway
+import utils.deadline
+from enforcement_engine import enforce, enforce_many
+from enforcement_gateway import app
+from logs.bucket_logger import MemorySink, use_log_sink
+from models.enforcement_input import EnforcementInput
+from utils.deadline import Deadline, DeadlineExceeded
+from utils.deterministic_trace import generate_trace_id
+from validators.akanksha.behavior_validator import DEFAULT_COMPILED_LIBRARY
+from validators.akanksha.enforcement_adapter import EnforcementAdapter
+
+client = TestClient(app)
+
+
+def make_input(intent="budget please"):
+    return EnforcementInput(
+        intent=intent,
+        emotional_output={"tone": "neutral", "dependency_score": 0.0},
+        age_gate_status="ALLOWED",
+        region_policy="IN",
+        platform_policy="INSTAGRAM",
+        karma_score=0.0,
+        risk_flags=[],
+    )
+
+
+def expiring_after(monkeypatch, checks):
+    # Clock reads 0 for `checks` reads, then jumps past the deadline.
+    ticks = itertools.chain([0.0] * (checks + 1), itertools.repeat(10.0))
+    monkeypatch.setattr(utils.deadline, "_clock", lambda: next(ticks))
+    return Deadline.after(1.0)
+
+
+def test_expired_deadline_terminates_and_is_logged(monkeypatch):
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", None)
+    payload = make_input()
+
+    with use_log_sink(MemorySink()) as sink:
+        verdict = enforce(payload, deadline=Deadline.after(-1.0))
+
+    assert verdict.decision == "TERMINATE"
+    assert verdict.reason_code == "DEADLINE_EXCEEDED"
+    assert verdict.trace_id == generate_trace_id(
+        input_payload=enforcement_engine._canonical_trace_payload(payload),
+        enforcement_category="TERMINATE",
+    )
+
+    [record] = sink.records
+    assert record["trace_id"] == verdict.trace_id
+    assert record["final_decision"] == "TERMINATE"
+    assert record["deadline_exceeded"] is True
+    assert record["akanksha_verdict"]["decision"] is None
+
+
+def test_unexpired_deadline_does_not_change_verdict(monkeypatch):
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", None)
+    payload = make_input("you are all I have")
+
+    assert enforce(payload, deadline=Deadline.after(60.0)) == enforce(payload)
+
+
+def test_enforce_many_fails_the_batch_closed_on_expiry(monkeypatch):
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", None)
+    batch = [make_input("first"), make_input("second")]
+    expired = Deadline.after(-1.0)
+
+    with use_log_sink(MemorySink()) as sink:
+        verdicts = enforce_many(batch, deadline=expired)
+        singles = [enforce(p, deadline=expired) for p in batch]
+
+    assert verdicts == singles
+    assert {v.reason_code for v in verdicts} == {"DEADLINE_EXCEEDED"}
+    assert all(record["deadline_exceeded"] is True for record in sink.records)
+
+
+def test_enforce_many_checks_deadline_before_akanksha(monkeypatch):
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", None)
+    deadline = expiring_after(monkeypatch, 1)     # passes before STEP 2 only
+
+    with use_log_sink(MemorySink()) as sink:
+        [verdict] = enforce_many([make_input()], deadline=deadline)
+
+    assert verdict.reason_code == "DEADLINE_EXCEEDED"
+    [record] = sink.records
+    assert record["raj_evaluators"]              # STEP 2 ran
+
+
+def test_pattern_scan_checks_deadline_between_candidates(monkeypatch):
+    text = "all alone " * 50
+    deadline = expiring_after(monkeypatch, checks=3)
+
+    with pytest.raises(DeadlineExceeded):
+        DEFAULT_COMPILED_LIBRARY.scan(text, deadline=deadline)
+
+
+def test_adapter_propagates_deadline_instead_of_failing(monkeypatch):
+    deadline = expiring_after(monkeypatch, checks=1)
+
+    with pytest.raises(DeadlineExceeded):
+        EnforcementAdapter().validate(make_input("all alone " * 50), deadline=deadline)
+
+
+def test_deadline_inside_akanksha_terminates(monkeypatch):
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", None)
+    # Two stage checks pass; the budget runs out inside the scan.
+    deadline = expiring_after(monkeypatch, checks=3)
+
+    verdict = enforce(make_input("all alone " * 50), deadline=deadline)
+
+    assert verdict.decision == "TERMINATE"
+    assert verdict.reason_code == "DEADLINE_EXCEEDED"
+
+
+def test_gateway_budget_exhaustion_blocks(monkeypatch):
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", None)
+    monkeypatch.setattr(enforcement_gateway, "REQUEST_DEADLINE_MS", 1e-9)
+
+    response = client.post("/enforce", json={
+        "intelligence": {
+            "data": {
+                "trace_id": "upstream-1",
+                "intent": "deadline please",
+                "suggested_action": "respond",
+                "confidence": 0.9,
+                "version_hash": "INTELLIGENCE_v1_LOCKED",
+            }
+        },
+        "context": {
+            "emotional_output": {"tone": "neutral", "dependency_score": 0.0},
+            "age_gate_status": "ALLOWED",
+            "region_policy": "IN",
+            "platform_policy": "INSTAGRAM",
+        },
+    })
+
+    assert response.status_code == 200
+    assert response.json()["decision"] == "BLOCK"
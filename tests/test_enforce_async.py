@@ -0,0 +1,167 @@
+import asyncio
+import time
+
+import httpx
+
+import enforcement_engine
+import enforcement_gateway
+import logs.bucket_logger as bucket_logger
+from enforcement_engine import enforce, enforce_async
+from enforcement_gateway import app
+from logs.bucket_logger import MemorySink, use_log_sink
+from models.enforcement_input import EnforcementInput
+from utils.admission import SHED_QUEUE_FULL, SHED_QUEUE_TIMEOUT, AdmissionController
+from utils.single_flight import SingleFlight
+
+
+def make_input(intent="test", dependency_score=0.0, age_gate_status="ALLOWED", risk_flags=None):
+    return EnforcementInput(
+        intent=intent,
+        emotional_output={"tone": "neutral", "dependency_score": dependency_score},
+        age_gate_status=age_gate_status,
+        region_policy="IN",
+        platform_policy="INSTAGRAM",
+        karma_score=0.0,
+        risk_flags=risk_flags or [],
+    )
+
+
+INPUTS = [
+    make_input(),
+    make_input(dependency_score=0.9),
+    make_input(age_gate_status="BLOCKED"),
+    make_input(risk_flags=["PLATFORM_VIOLATION"]),
+    make_input(intent="I want to die"),
+    make_input(intent="you are all I have"),
+]
+
+
+def test_enforce_async_matches_enforce(monkeypatch):
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", None)
+
+    with use_log_sink(MemorySink()) as sync_sink:
+        expected = [enforce(p) for p in INPUTS]
+
+    async def run():
+        with use_log_sink(MemorySink()) as sink:
+            verdicts = [await enforce_async(p) for p in INPUTS]
+        return verdicts, sink.records
+
+    verdicts, records = asyncio.run(run())
+
+    assert verdicts == expected
+    assert records == sync_sink.records
+
+
+class _FullWriter:
+    def __init__(self):
+        self.submitted = []
+
+    def try_submit(self, records):
+        return False
+
+    def submit(self, records):
+        self.submitted.extend(records)
+        return True
+
+
+def test_full_writer_queue_falls_back_to_executor(monkeypatch):
+    writer = _FullWriter()
+    monkeypatch.setattr(bucket_logger, "TRACE_WRITER", writer)
+
+    verdict = asyncio.run(enforce_async(make_input(intent="executor please")))
+
+    assert [r["trace_id"] for r in writer.submitted] == [verdict.trace_id]
+
+
+def test_gateway_serves_concurrent_requests_on_the_loop(monkeypatch):
+    # Concurrency on the loop, not load shedding: no admission limit
+    monkeypatch.setattr(enforcement_gateway, "ADMISSION", None)
+
+    def request(i):
+        return {
+            "intelligence": {
+                "data": {
+                    "trace_id": f"upstream-{i}",
+                    "intent": f"async please {i % 5}",
+                    "suggested_action": "respond",
+                    "confidence": 0.9,
+                    "version_hash": "INTELLIGENCE_v1_LOCKED",
+                }
+            },
+            "context": {
+                "emotional_output": {"tone": "neutral", "dependency_score": 0.0},
+                "age_gate_status": "ALLOWED",
+                "region_policy": "IN",
+                "platform_policy": "INSTAGRAM",
+            },
+        }
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://gate") as client:
+            responses = await asyncio.gather(
+                *(client.post("/enforce", json=request(i)) for i in range(100))
+            )
+        return [r.json() for r in responses]
+
+    bodies = asyncio.run(run())
+
+    assert all(b["decision"] == "EXECUTE" for b in bodies)
+    # Same payload → same trace ID, regardless of interleaving
+    assert len({b["trace_id"] for b in bodies}) == 5
+    for i, body in enumerate(bodies):
+        assert body["trace_id"] == bodies[i % 5]["trace_id"]
+
+
+def test_gateway_coalesces_and_sheds_under_concurrency(monkeypatch):
+    admission = AdmissionController(max_concurrent=4, max_queue=4, queue_timeout_ms=1)
+    flight = SingleFlight()
+    monkeypatch.setattr(enforcement_gateway, "ADMISSION", admission)
+    monkeypatch.setattr(enforcement_gateway, "IN_FLIGHT", flight)
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", None)
+
+    evaluate = enforcement_engine.evaluate
+
+    def slow_evaluate(*args, **kwargs):
+        time.sleep(0.02)        # holds the slot; the loop keeps serving
+        return evaluate(*args, **kwargs)
+
+    monkeypatch.setattr(enforcement_engine, "evaluate", slow_evaluate)
+
+    body = {
+        "intelligence": {
+            "data": {
+                "trace_id": "upstream-1",
+                "intent": "coalesce and shed",
+                "suggested_action": "respond",
+                "confidence": 0.9,
+                "version_hash": "INTELLIGENCE_v1_LOCKED",
+            }
+        },
+        "context": {
+            "emotional_output": {"tone": "neutral", "dependency_score": 0.0},
+            "age_gate_status": "ALLOWED",
+            "region_policy": "IN",
+            "platform_policy": "INSTAGRAM",
+        },
+    }
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://gate") as client:
+            with use_log_sink(MemorySink()):
+                responses = await asyncio.gather(
+                    *(client.post("/enforce", json=body) for _ in range(300))
+                )
+        return [r.json() for r in responses]
+
+    bodies = asyncio.run(run())
+
+    shed = [b for b in bodies if b["reason_code"] == "OVERLOAD_SHED"]
+    served = [b for b in bodies if b["reason_code"] is None]
+    assert flight.coalesced > 0
+    assert admission.shed.value(SHED_QUEUE_FULL) + admission.shed.value(SHED_QUEUE_TIMEOUT) == len(shed) > 0
+    assert served and {b["decision"] for b in served} == {"EXECUTE"}
+    assert len({b["trace_id"] for b in served}) == 1
+    assert admission.active() == 0 and flight.in_flight() == 0
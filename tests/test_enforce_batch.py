@@ -0,0 +1,207 @@
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import enforcement_gateway
+import logs.bucket_logger as bucket_logger
+from enforcement_gateway import app
+from logs.bucket_logger import SegmentedTraceLog
+from utils.admission import SHED_QUEUE_FULL, AdmissionController
+
+client = TestClient(app)
+
+
+def make_request(intent="batch me", dependency_score=0.1, confidence=0.9, region="IN"):
+    return {
+        "intelligence": {
+            "data": {
+                "trace_id": "upstream",
+                "intent": intent,
+                "suggested_action": "respond",
+                "confidence": confidence,
+                "version_hash": "INTELLIGENCE_v1_LOCKED",
+            }
+        },
+        "context": {
+            "emotional_output": {"tone": "neutral", "dependency_score": dependency_score},
+            "age_gate_status": "ALLOWED",
+            "region_policy": region,
+            "platform_policy": "INSTAGRAM",
+        },
+    }
+
+
+@pytest.fixture
+def log(tmp_path, monkeypatch):
+    log = SegmentedTraceLog(tmp_path)
+    monkeypatch.setattr(bucket_logger, "TRACE_LOG", log)
+    monkeypatch.setattr(bucket_logger, "TRACE_WRITER", None)
+    return log
+
+
+def read_ndjson(response):
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_batch_matches_single_requests_in_order(log):
+    requests = [
+        make_request("first"),
+        make_request("second", confidence=5.0),          # contract violation
+        make_request("third", dependency_score=0.9),     # rewrite
+        make_request("fourth", region="RESTRICTED"),     # block
+    ]
+
+    batch = read_ndjson(client.post("/enforce/batch", json=requests))
+    single = [client.post("/enforce", json=r).json() for r in requests]
+
+    assert [r["decision"] for r in batch] == ["EXECUTE", "BLOCK", "REWRITE", "BLOCK"]
+    assert [(r["decision"], r["trace_id"], r["rewrite_class"]) for r in batch] == [
+        (r["decision"], r["trace_id"], r["rewrite_class"]) for r in single
+    ]
+    assert len(list(log.iter_records())) == 6        # 3 engine items, twice
+
+
+def test_ndjson_items_fail_closed_individually(log):
+    body = "\n".join([
+        json.dumps(make_request("ok")),
+        "{not json",
+        json.dumps({"intelligence": {"data": {}}}),      # schema violation
+        "",
+        json.dumps(make_request("also ok")),
+    ]) + "\n"
+
+    results = read_ndjson(
+        client.post(
+            "/enforce/batch",
+            content=body,
+            headers={"content-type": "application/x-ndjson"},
+        )
+    )
+
+    assert [r["decision"] for r in results] == ["EXECUTE", "BLOCK", "BLOCK", "EXECUTE"]
+    assert all(len(r["trace_id"]) == 64 for r in results)
+
+
+def test_batch_uses_one_engine_call_per_chunk(log, monkeypatch):
+    calls = []
+    real = enforcement_gateway.enforce_many
+    monkeypatch.setattr(enforcement_gateway, "BATCH_CHUNK_SIZE", 2)
+    monkeypatch.setattr(
+        enforcement_gateway,
+        "enforce_many",
+        lambda inputs, **kwargs: calls.append(len(inputs)) or real(inputs, **kwargs),
+    )
+
+    results = read_ndjson(
+        client.post("/enforce/batch", json=[make_request(f"item {i}") for i in range(5)])
+    )
+
+    assert len(results) == 5
+    assert calls == [2, 2, 1]
+
+
+def test_engine_failure_blocks_only_engine_items(log, monkeypatch):
+    def boom(inputs, **kwargs):
+        raise RuntimeError("engine down")
+
+    monkeypatch.setattr(enforcement_gateway, "enforce_many", boom)
+    monkeypatch.setattr(enforcement_gateway, "enforce", boom)
+
+    results = read_ndjson(
+        client.post("/enforce/batch", json=[make_request(), make_request(confidence=5.0)])
+    )
+
+    assert [r["decision"] for r in results] == ["BLOCK", "BLOCK"]
+    assert results[0]["trace_id"] != results[1]["trace_id"]
+
+
+def test_failing_item_does_not_fail_its_chunk(log):
+    requests = [
+        make_request("fine"),
+        make_request("bad score", dependency_score="high"),     # evaluator raises
+        make_request("rewrite", dependency_score=0.9),
+    ]
+
+    batch = read_ndjson(client.post("/enforce/batch", json=requests))
+    single = [client.post("/enforce", json=r).json() for r in requests]
+
+    assert [r["decision"] for r in batch] == ["EXECUTE", "BLOCK", "REWRITE"]
+    assert [(r["decision"], r["trace_id"]) for r in batch] == [
+        (r["decision"], r["trace_id"]) for r in single
+    ]
+    assert len(list(log.iter_records())) == 6        # 3 engine items, twice
+
+
+def test_non_array_json_body_is_rejected():
+    assert client.post("/enforce/batch", json={"not": "a list"}).status_code == 400
+    assert client.post("/enforce/batch", content=b"[oops").status_code == 400
+
+
+def test_ndjson_upload_is_gated_chunk_by_chunk(log, monkeypatch):
+    calls = []
+    real = enforcement_gateway.enforce_many
+    monkeypatch.setattr(enforcement_gateway, "BATCH_CHUNK_SIZE", 2)
+    monkeypatch.setattr(
+        enforcement_gateway,
+        "enforce_many",
+        lambda inputs, **kwargs: calls.append(len(inputs)) or real(inputs, **kwargs),
+    )
+    body = "".join(json.dumps(make_request(f"line {i}")) + "\n" for i in range(5))
+
+    results = read_ndjson(
+        client.post(
+            "/enforce/batch",
+            content=body,
+            headers={"content-type": "application/x-ndjson"},
+        )
+    )
+
+    assert [r["decision"] for r in results] == ["EXECUTE"] * 5
+    assert calls == [2, 2, 1]
+
+
+def test_chunks_that_cannot_be_admitted_are_shed(log, monkeypatch):
+    admission = AdmissionController(max_concurrent=1, max_queue=0, queue_timeout_ms=0)
+    monkeypatch.setattr(enforcement_gateway, "ADMISSION", admission)
+    monkeypatch.setattr(enforcement_gateway, "BATCH_CHUNK_SIZE", 2)
+    requests = [make_request("shed me"), {"not": "a request"}, make_request("me too")]
+
+    asyncio.run(admission.acquire())                   # saturate
+    try:
+        shed = read_ndjson(client.post("/enforce/batch", json=requests))
+    finally:
+        admission.release()
+
+    assert [r["decision"] for r in shed] == ["BLOCK"] * 3
+    assert [r["reason_code"] for r in shed] == ["OVERLOAD_SHED", None, "OVERLOAD_SHED"]
+    assert admission.shed.value(SHED_QUEUE_FULL) == 2    # one per chunk
+    assert list(log.iter_records()) == []                # nothing ran
+
+    # Capacity back: the same items are enforced normally
+    admitted = read_ndjson(client.post("/enforce/batch", json=requests))
+    assert [r["decision"] for r in admitted] == ["EXECUTE", "BLOCK", "EXECUTE"]
+
+
+def test_each_chunk_gets_the_request_deadline(log, monkeypatch):
+    deadlines = []
+    real = enforcement_gateway.enforce_many
+
+    def record(inputs, *, deadline=None):
+        deadlines.append(deadline)
+        return real(inputs, deadline=deadline)
+
+    monkeypatch.setattr(enforcement_gateway, "REQUEST_DEADLINE_MS", 0.001)
+    monkeypatch.setattr(enforcement_gateway, "BATCH_CHUNK_SIZE", 1)
+    monkeypatch.setattr(enforcement_gateway, "enforce_many", record)
+
+    results = read_ndjson(
+        client.post("/enforce/batch", json=[make_request("late"), make_request("later")])
+    )
+
+    assert len(deadlines) == 2 and deadlines[0] is not deadlines[1]
+    assert [r["decision"] for r in results] == ["BLOCK", "BLOCK"]
+    assert [r.get("deadline_exceeded") for r in log.iter_records()] == [True, True]
@@ -0,0 +1,93 @@
+import enforcement_engine
+from enforcement_engine import enforce, enforce_many
+from models.enforcement_input import EnforcementInput
+from validators.akanksha.behavior_validator import BehaviorValidator
+
+
+def make_input(
+    intent="test",
+    dependency_score=0.0,
+    age_gate_status="ALLOWED",
+    region_policy="IN",
+    risk_flags=None,
+):
+    return EnforcementInput(
+        intent=intent,
+        emotional_output={"tone": "neutral", "dependency_score": dependency_score},
+        age_gate_status=age_gate_status,
+        region_policy=region_policy,
+        platform_policy="INSTAGRAM",
+        karma_score=0.0,
+        risk_flags=risk_flags or [],
+    )
+
+
+BATCH = [
+    make_input(),
+    make_input(dependency_score=0.9),
+    make_input(age_gate_status="BLOCKED"),
+    make_input(region_policy="RESTRICTED"),
+    make_input(risk_flags=["PLATFORM_VIOLATION"]),
+    make_input(risk_flags=["EMOTIONAL_MANIPULATION", "HIGH_RISK"]),
+    make_input(intent="I want to die"),
+    make_input(intent="you are all I have"),
+]
+
+
+def test_enforce_many_matches_enforce_elementwise():
+    assert enforce_many(BATCH) == [enforce(p) for p in BATCH]
+
+
+def test_enforce_many_empty_batch():
+    assert enforce_many([]) == []
+
+
+def test_enforce_many_commits_log_once(monkeypatch):
+    commits = []
+    monkeypatch.setattr(
+        enforcement_engine, "log_enforcement_many", commits.append
+    )
+
+    verdicts = enforce_many(BATCH)
+
+    assert len(commits) == 1
+    assert [e["trace_id"] for e in commits[0]] == [v.trace_id for v in verdicts]
+
+
+def test_akanksha_failure_terminates_only_that_element(monkeypatch):
+    original = BehaviorValidator._classify
+
+    def flaky(self, hits, conversational_output, age_gate_status):
+        # Shared by the batch pass and the single path
+        if "boom" in conversational_output:
+            raise RuntimeError("validator bug")
+        return original(self, hits, conversational_output, age_gate_status)
+
+    monkeypatch.setattr(BehaviorValidator, "_classify", flaky)
+
+    batch = [make_input(), make_input(intent="boom"), make_input(dependency_score=0.9)]
+    verdicts = enforce_many(batch)
+
+    assert verdicts[1].decision == "TERMINATE"
+    assert verdicts[1].reason_code == "AKANKSHA_VALIDATION_FAILED"
+    assert verdicts[1] == enforce(batch[1])
+    assert [verdicts[0], verdicts[2]] == [enforce(batch[0]), enforce(batch[2])]
+
+
+def test_evaluator_failure_terminates_only_that_element(monkeypatch):
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", None)
+    commits = []
+    monkeypatch.setattr(enforcement_engine, "log_enforcement_many", commits.append)
+
+    # dependency_tone raises TypeError on a non-numeric score
+    batch = [make_input(), make_input(dependency_score="high"), make_input(dependency_score=0.9)]
+    verdicts = enforce_many(batch)
+
+    assert verdicts[1].decision == "TERMINATE"
+    assert verdicts[1].reason_code == "EVALUATOR_FAILED"
+    assert [verdicts[0].decision, verdicts[2].decision] == ["ALLOW", "REWRITE"]
+    assert verdicts == [enforce(p) for p in batch]
+
+    [entries] = commits
+    names = [r.name for r in entries[1]["evaluator_results"]]
+    assert "dependency_tone" not in names and len(names) == 6    # the rest completed
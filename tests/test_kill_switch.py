@@ -0,0 +1,109 @@
+import json
+import multiprocessing
+import time
+
+import enforcement_engine
+from enforcement_engine import enforce, enforce_many
+from logs.bucket_logger import MemorySink, use_log_sink
+from models.enforcement_input import EnforcementInput
+from tools import kill_switch as kill_switch_tool
+from utils.kill_switch import SharedKillSwitch
+
+
+def make_switch(tmp_path, static=False):
+    return SharedKillSwitch(
+        tmp_path / "kill_switch.flag",
+        tmp_path / "kill_switch_events.jsonl",
+        static=static,
+    )
+
+
+def make_input(intent="kill switch please"):
+    return EnforcementInput(
+        intent=intent,
+        emotional_output={"tone": "neutral", "dependency_score": 0.0},
+        age_gate_status="ALLOWED",
+        region_policy="IN",
+        platform_policy="INSTAGRAM",
+        karma_score=0.0,
+        risk_flags=[],
+    )
+
+
+def test_toggle_is_shared_and_logged(tmp_path):
+    operator = make_switch(tmp_path)
+    worker = make_switch(tmp_path)
+    assert not worker.engaged()
+
+    operator.set(True, actor="oncall", reason="incident")
+    assert worker.engaged()
+
+    operator.set(False, actor="oncall", reason="resolved")
+    assert not worker.engaged()
+
+    events = [
+        json.loads(line)
+        for line in (tmp_path / "kill_switch_events.jsonl").read_text().splitlines()
+    ]
+    assert [(e["engaged"], e["previous"], e["generation"]) for e in events] == [
+        (True, False, 1),
+        (False, True, 2),
+    ]
+    assert events[0]["actor"] == "oncall" and events[0]["reason"] == "incident"
+
+
+def test_static_config_switch_cannot_be_released(tmp_path):
+    switch = make_switch(tmp_path, static=True)
+    switch.set(False, actor="oncall", reason="try")
+    assert switch.engaged()
+
+
+def _engage(tmp_path):
+    make_switch(tmp_path).set(True, actor="other-process", reason="test")
+
+
+def test_toggle_from_another_process_is_visible(tmp_path):
+    worker = make_switch(tmp_path)
+
+    process = multiprocessing.get_context("spawn").Process(target=_engage, args=(tmp_path,))
+    process.start()
+    process.join(30)
+    assert process.exitcode == 0
+
+    deadline = time.monotonic() + 1.0
+    while not worker.engaged():
+        assert time.monotonic() < deadline
+    assert worker.generation() == 1
+
+
+def test_engine_terminates_and_audits_while_engaged(tmp_path, monkeypatch):
+    switch = make_switch(tmp_path)
+    monkeypatch.setattr(enforcement_engine, "KILL_SWITCH", switch)
+
+    switch.set(True, actor="oncall", reason="incident")
+    with use_log_sink(MemorySink()) as sink:
+        single = enforce(make_input())
+        [batched] = enforce_many([make_input()])
+
+    assert single.decision == "TERMINATE"
+    assert single.reason_code == "GLOBAL_KILL_SWITCH"
+    assert batched == single
+    assert [r["final_decision"] for r in sink.records] == ["TERMINATE", "TERMINATE"]
+
+    switch.set(False, actor="oncall", reason="resolved")
+    assert enforce(make_input()).reason_code != "GLOBAL_KILL_SWITCH"
+
+
+def test_cli_engage_release_and_status(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(kill_switch_tool, "from_config", lambda *a: make_switch(tmp_path))
+
+    assert kill_switch_tool.main(["engage", "--reason", "incident", "--actor", "oncall"]) == 0
+    assert make_switch(tmp_path).engaged()
+
+    assert kill_switch_tool.main(["release", "--reason", "resolved", "--actor", "oncall"]) == 0
+    capsys.readouterr()
+
+    assert kill_switch_tool.main(["status"]) == 0
+    status = json.loads(capsys.readouterr().out)
+    assert status["engaged"] is False
+    assert status["generation"] == 2
@@ -0,0 +1,108 @@
+import threading
+
+from fastapi.testclient import TestClient
+
+import enforcement_engine
+from enforcement_gateway import app
+from utils.metrics import Exposition, Histogram, LabeledCounter, StageMetrics
+
+client = TestClient(app)
+
+
+def make_request(confidence=0.9):
+    return {
+        "intelligence": {
+            "data": {
+                "trace_id": "upstream-1",
+                "intent": "metrics please",
+                "suggested_action": "respond",
+                "confidence": confidence,
+                "version_hash": "INTELLIGENCE_v1_LOCKED",
+            }
+        },
+        "context": {
+            "emotional_output": {"tone": "neutral", "dependency_score": 0.1},
+            "age_gate_status": "ALLOWED",
+            "region_policy": "IN",
+            "platform_policy": "INSTAGRAM",
+        },
+    }
+
+
+def sample_value(body, prefix):
+    for line in body.splitlines():
+        if line.startswith(prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+def test_labeled_counter_merges_thread_shards():
+    counter = LabeledCounter()
+
+    def work():
+        for _ in range(1000):
+            counter.inc("ALLOW")
+        counter.inc(("BLOCK", "POLICY_VIOLATION"), 2)
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert counter.values() == {"ALLOW": 6000, ("BLOCK", "POLICY_VIOLATION"): 12}
+    counter.reset()
+    assert counter.value("ALLOW") == 0
+
+
+def test_exposition_text_format():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    histogram.observe(0.5)
+
+    out = Exposition()
+    out.counter("x_total", "Things.", [({"kind": 'a"b'}, 3)])
+    out.histogram("lat_seconds", "Latency.", [({"stage": "s"}, histogram.snapshot())])
+
+    assert out.render().splitlines() == [
+        "# HELP x_total Things.",
+        "# TYPE x_total counter",
+        'x_total{kind="a\\"b"} 3',
+        "# HELP lat_seconds Latency.",
+        "# TYPE lat_seconds histogram",
+        'lat_seconds_bucket{stage="s",le="0.1"} 0',
+        'lat_seconds_bucket{stage="s",le="1.0"} 1',
+        'lat_seconds_bucket{stage="s",le="+Inf"} 1',
+        'lat_seconds_sum{stage="s"} 0.5',
+        'lat_seconds_count{stage="s"} 1',
+    ]
+
+
+def test_metrics_endpoint_reports_gateway_and_engine(monkeypatch):
+    monkeypatch.setattr(enforcement_engine, "STAGE_METRICS", StageMetrics(sample_rate=1.0))
+    monkeypatch.setattr(enforcement_engine, "log_enforcement", lambda **kw: None)
+    before = client.get("/metrics").text
+
+    assert client.post("/enforce", json=make_request()).json()["decision"] == "EXECUTE"
+    assert client.post("/enforce", json=make_request(confidence=2.0)).json()["decision"] == "BLOCK"
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+
+    def delta(prefix):
+        return sample_value(body, prefix) - sample_value(before, prefix)
+
+    assert delta('enforcement_gateway_requests_total{decision="EXECUTE"}') == 1
+    assert delta('enforcement_gateway_requests_total{decision="BLOCK"}') == 1
+    assert delta("enforcement_intelligence_rejections_total") == 1
+    assert delta("enforcement_gateway_latency_seconds_count") == 2
+    assert delta(
+        'enforcement_verdicts_total{decision="ALLOW",reason="CONTENT_AND_ACTION_ALLOWED"}'
+    ) == 1
+    assert 'enforcement_stage_latency_seconds_count{stage="akanksha"} 1' in body
+    assert "enforcement_trace_writer_queue_depth" in body
+    assert "enforcement_akanksha_failures_total" in body
+    assert "enforcement_kill_switch_hits_total" in body
+    assert delta("enforcement_gateway_coalesced_total") == 0
+    assert "enforcement_gateway_in_flight_evaluations 0" in body
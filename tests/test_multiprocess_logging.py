@@ -0,0 +1,144 @@
+import json
+import multiprocessing
+import threading
+from collections import defaultdict
+
+from logs.bucket_logger import SegmentedTraceLog, _segment_stream
+from logs.trace_index import TraceIndex
+
+PROCESSES = 4
+THREADS = 4
+RECORDS = 300      # per thread
+BATCH = 3
+
+
+def make_log(directory):
+    return SegmentedTraceLog(
+        directory,
+        max_records=50,     # frequent rollover under contention
+        index=TraceIndex(directory / "index.sqlite3"),
+        per_process=True,
+    )
+
+
+def make_record(worker, thread, n):
+    return {
+        "trace_id": f"{worker}-{thread}-{n}",
+        "worker": worker,
+        "thread": thread,
+        "n": n,
+        "payload": "x" * (n % 97),     # varied record sizes
+    }
+
+
+def _worker(directory, worker):
+    log = make_log(directory)
+
+    def run(thread):
+        for start in range(0, RECORDS, BATCH):
+            log.append([
+                make_record(worker, thread, n)
+                for n in range(start, min(start + BATCH, RECORDS))
+            ])
+
+    threads = [threading.Thread(target=run, args=(t,)) for t in range(THREADS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    log.close()
+
+
+def test_no_lost_or_torn_records_across_processes_and_threads(tmp_path):
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=_worker, args=(tmp_path, w)) for w in range(PROCESSES)]
+    for p in workers:
+        p.start()
+    for p in workers:
+        p.join(60)
+        assert p.exitcode == 0
+
+    log = make_log(tmp_path)
+
+    # Every line is complete, canonical JSON
+    for segment in log.segments():
+        for line in segment.read_bytes().splitlines(keepends=True):
+            assert line.endswith(b"\n")
+            json.loads(line)
+
+    # One stream per live process (worker slots)
+    streams = {_segment_stream(s.name) for s in log.segments()}
+    assert 1 <= len(streams) <= PROCESSES
+    assert all(stream.startswith("w") for stream in streams)
+
+    records = list(log.iter_records())
+    assert len(records) == PROCESSES * THREADS * RECORDS
+    assert len({r["trace_id"] for r in records}) == len(records)
+
+    # Per-thread append order survives the merge
+    sequences = defaultdict(list)
+    for r in records:
+        sequences[(r["worker"], r["thread"])].append(r["n"])
+    assert all(seq == list(range(RECORDS)) for seq in sequences.values())
+
+    # Deterministic merge
+    assert list(make_log(tmp_path).iter_records()) == records
+
+    # One index file per stream; lookups merge them
+    index = log.index
+    assert sorted(p.name for p in tmp_path.glob("index*.sqlite3")) == sorted(
+        index.stream_path(stream).name
+        for stream in {_segment_stream(s.name) for s in log.segments()}
+    )
+    for r in records[::37]:
+        assert log.lookup(r["trace_id"]) == r
+
+
+def _append_in_child(log, queue):
+    log.append([make_record("child", 0, 0)])
+    queue.put(log.stream)
+
+
+def test_forked_child_writes_its_own_stream(tmp_path):
+    log = make_log(tmp_path)
+    log.append([make_record("parent", 0, 0)])
+
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    child = ctx.Process(target=_append_in_child, args=(log, queue))
+    child.start()
+    child_stream = queue.get(timeout=30)
+    child.join(30)
+    assert child.exitcode == 0
+
+    log.append([make_record("parent", 0, 1)])
+
+    assert child_stream != log.stream
+    streams = defaultdict(list)
+    for segment in log.segments():
+        streams[_segment_stream(segment.name)].extend(
+            json.loads(line)["trace_id"] for line in segment.read_text().splitlines()
+        )
+    assert streams[log.stream] == ["parent-0-0", "parent-0-1"]
+    assert streams[child_stream] == ["child-0-0"]
+
+
+def _one_record(directory, worker):
+    log = make_log(directory)
+    log.append([make_record(worker, 0, 0)])
+    log.close()
+
+
+def test_restarted_workers_reuse_their_slot_stream(tmp_path):
+    ctx = multiprocessing.get_context("spawn")
+    for worker in range(3):                      # three worker lifetimes
+        p = ctx.Process(target=_one_record, args=(tmp_path, worker))
+        p.start()
+        p.join(60)
+        assert p.exitcode == 0
+
+    log = make_log(tmp_path)
+    assert {_segment_stream(s.name) for s in log.segments()} == {"w0"}
+    assert [p.name for p in tmp_path.glob("index*.sqlite3")] == ["index.w0.sqlite3"]
+    assert [r["trace_id"] for r in log.iter_records()] == ["0-0-0", "1-0-0", "2-0-0"]
+    assert log.lookup("2-0-0")["worker"] == 2
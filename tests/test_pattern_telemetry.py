@@ -0,0 +1,87 @@
+import dataclasses
+import threading
+
+from fastapi.testclient import TestClient
+
+from enforcement_gateway import app
+from validators.akanksha.behavior_validator import (
+    BehaviorValidator,
+    CompiledPatternLibrary,
+    Decision,
+    PatternLibrary,
+    PatternTelemetry,
+    RiskCategory,
+)
+
+
+def validate(validator, text, age_ok=True, match_all=False):
+    return validator.validate_behavior(
+        intent="",
+        conversational_output=text,
+        age_gate_status=age_ok,
+        region_rule_status=None,
+        platform_policy_state=None,
+        karma_bias_input=0.0,
+        match_all=match_all,
+    )
+
+
+TEXT = "I am lonely, you owe me... I want to die, send me nudes and i love you"
+
+
+def test_match_all_reports_every_pattern_with_unchanged_decision():
+    validator = BehaviorValidator()
+    default = validate(validator, TEXT, age_ok=False)
+    full = validate(validator, TEXT, age_ok=False, match_all=True)
+
+    assert default.all_matches is None
+    assert dataclasses.replace(full, all_matches=None) == default
+    assert [(m.category, m.label) for m in full.all_matches] == [
+        (RiskCategory.YOUTH_RISK_BEHAVIOR, "underage_emotional_context"),
+        (RiskCategory.ILLEGAL_INTENT_PROBING, "Death wish"),
+        (RiskCategory.SEXUAL_ESCALATION_ATTEMPT, "Nude request"),
+        (RiskCategory.MANIPULATIVE_PHRASING, "Emotional debt"),
+        (RiskCategory.LONELINESS_HOOK, "Loneliness expression"),
+    ]
+    assert full.all_matches[0].decision == Decision.HARD_DENY
+    assert full.all_matches[-1].decision == Decision.SOFT_REWRITE
+
+
+def test_per_pattern_counters_across_threads():
+    library = CompiledPatternLibrary(PatternLibrary).warm()
+    telemetry = PatternTelemetry(library)
+    validator = BehaviorValidator(library, telemetry)
+
+    def worker():
+        for _ in range(250):
+            validate(validator, "I am lonely and all alone")
+            validate(validator, "hello there")
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    snapshot = telemetry.snapshot()
+    by_label = {p["label"]: p for p in snapshot["patterns"]}
+    assert snapshot["scans"] == 2000
+    assert snapshot["scan_seconds"] > 0
+    assert by_label["Loneliness expression"]["hits"] == 1000
+    assert by_label["Isolation"]["hits"] == 1000
+    assert by_label["Loneliness expression"]["confirm_seconds"] > 0
+    # The shared pass is its own bucket, not folded into any pattern
+    confirm_total = sum(p["confirm_seconds"] for p in snapshot["patterns"])
+    assert snapshot["finder_seconds"] > 0
+    assert snapshot["finder_seconds"] + confirm_total <= snapshot["scan_seconds"]
+    # Dead patterns are visible with zero hits
+    assert by_label["Nude request"]["hits"] == 0
+    assert by_label["Nude request"]["confirm_seconds"] == 0.0
+
+
+def test_metrics_export_pattern_counters():
+    client = TestClient(app)
+    body = client.get("/metrics").text
+    assert "# TYPE enforcement_akanksha_pattern_hits_total counter" in body
+    assert "# TYPE enforcement_akanksha_finder_seconds_total counter" in body
+    assert 'enforcement_akanksha_pattern_hits_total{category="loneliness_hook",label="Isolation"}' in body
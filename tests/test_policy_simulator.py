@@ -0,0 +1,118 @@
+import json
+
+import pytest
+
+import logs.bucket_logger as bucket_logger
+from enforcement_engine import enforce_many, replay_mode
+from evaluator_modules import ALL_EVALUATORS, build_evaluators
+from config_loader import ConfigError
+from logs.bucket_logger import MemorySink, SegmentedTraceLog
+from models.enforcement_input import EnforcementInput
+from tools.policy_simulator import candidate_policy, current_policy, main, simulate
+
+
+def make_input(i, region="IN"):
+    return EnforcementInput(
+        intent=f"simulate {i % 12}",
+        emotional_output={"tone": "neutral", "dependency_score": (i % 10) / 10},
+        age_gate_status="ALLOWED",
+        region_policy=region,
+        platform_policy="INSTAGRAM",
+        karma_score=0.0,
+        risk_flags=[],
+    )
+
+
+def write_traces(path, inputs):
+    sink = MemorySink()
+    with replay_mode(sink):
+        enforce_many(inputs)
+    path.write_text(json.dumps(sink.records, indent=2))
+    return sink.records
+
+
+def test_build_evaluators_defaults_match_live_set():
+    defaults = build_evaluators()
+    assert [e.name for e in defaults] == [e.name for e in ALL_EVALUATORS]
+    assert defaults[4].threshold == ALL_EVALUATORS[4].threshold == 0.7
+    assert defaults[1].restricted_regions == frozenset({"RESTRICTED"})
+
+
+def test_identical_policy_is_all_diagonal_and_matches_recorded(tmp_path):
+    records = write_traces(tmp_path / "t.json", [make_input(i) for i in range(40)])
+
+    summary = simulate(tmp_path / "t.json", current_policy(), chunk_size=9)
+
+    assert summary["total"] == 40
+    assert summary["changed"] == 0
+    recorded = {}
+    for r in records:
+        recorded[r["final_decision"]] = recorded.get(r["final_decision"], 0) + 1
+    assert {src: row[src] for src, row in summary["matrix"].items()} == recorded
+
+
+def test_evaluator_failure_fails_only_that_input(tmp_path):
+    bad = make_input(0).model_copy(
+        update={"emotional_output": {"tone": "neutral", "dependency_score": "high"}}
+    )
+    write_traces(tmp_path / "t.json", [bad] + [make_input(i) for i in range(1, 10)])
+
+    summary = simulate(tmp_path / "t.json", current_policy(), chunk_size=10)
+
+    assert summary["total"] == 10
+    assert summary["changed"] == 0
+    assert summary["matrix"]["TERMINATE"] == {"TERMINATE": 1}
+
+
+def test_lower_threshold_moves_allow_to_rewrite_with_samples(tmp_path, monkeypatch):
+    log = SegmentedTraceLog(tmp_path / "live")
+    monkeypatch.setattr(bucket_logger, "TRACE_LOG", log)
+    monkeypatch.setattr(bucket_logger, "TRACE_WRITER", None)
+    records = write_traces(tmp_path / "t.json", [make_input(i) for i in range(40)])
+
+    candidate = candidate_policy(dependency_threshold=0.45)
+    summary = simulate(tmp_path / "t.json", candidate, workers=2, chunk_size=7, max_samples=2)
+
+    moved = [
+        r["trace_id"] for r, i in zip(records, range(40))
+        if 0.45 < (i % 10) / 10 <= 0.7 and r["final_decision"] == "ALLOW"
+    ]
+    assert summary["matrix"]["ALLOW"]["REWRITE"] == len(moved) > 0
+    assert summary["changed"] == len(moved)
+    assert summary["samples"]["ALLOW->REWRITE"] == moved[:2]
+    assert list(log.iter_records()) == []
+
+
+def test_candidate_config_adds_restricted_region(tmp_path):
+    write_traces(tmp_path / "t.json", [make_input(i, region="EU") for i in range(10)])
+    config = tmp_path / "candidate.yaml"
+    config.write_text(
+        "evaluators:\n  region_restriction:\n    restricted_regions: [RESTRICTED, EU]\n"
+    )
+
+    summary = simulate(tmp_path / "t.json", candidate_policy(str(config)))
+
+    assert summary["changed"] == 10
+    assert set(summary["matrix"]) <= {"ALLOW", "REWRITE", "BLOCK"}
+    assert all(set(row) == {"BLOCK"} for row in summary["matrix"].values())
+
+
+def test_invalid_candidate_is_rejected_before_simulation(tmp_path, capsys):
+    before = current_policy()
+    config = tmp_path / "candidate.yaml"
+
+    config.write_text("evaluators:\n  dependency_tone:\n    threshold: 7\n")
+    with pytest.raises(ConfigError, match="threshold"):
+        candidate_policy(str(config))
+    config.write_text("evaluators:\n  region_restriction: EU\n")
+    with pytest.raises(ConfigError, match="region_restriction"):
+        candidate_policy(str(config))
+    config.write_text("evaluators: [unterminated\n")
+    with pytest.raises(ConfigError):
+        candidate_policy(str(config))
+    with pytest.raises(ConfigError, match="threshold"):
+        candidate_policy(dependency_threshold=-0.5)
+
+    assert current_policy() == before
+    assert main([str(tmp_path / "t.json"), "--dependency-threshold", "1.5"]) == 1
+    assert "threshold" in capsys.readouterr().err
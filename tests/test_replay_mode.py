@@ -0,0 +1,73 @@
+import enforcement_engine
+import logs.bucket_logger as bucket_logger
+from enforcement_engine import enforce, enforce_many, replay_mode
+from logs.bucket_logger import MemorySink, SegmentedTraceLog
+from models.enforcement_input import EnforcementInput
+from tools.replay_tool import replay_trace
+from utils.verdict_cache import VerdictCache
+
+
+def make_input(dependency_score=0.9):
+    return EnforcementInput(
+        intent="replay me",
+        emotional_output={"tone": "neutral", "dependency_score": dependency_score},
+        age_gate_status="ALLOWED",
+        region_policy="IN",
+        platform_policy="INSTAGRAM",
+        karma_score=0.0,
+        risk_flags=[],
+    )
+
+
+def isolate_log(tmp_path, monkeypatch):
+    log = SegmentedTraceLog(tmp_path)
+    monkeypatch.setattr(bucket_logger, "TRACE_LOG", log)
+    monkeypatch.setattr(bucket_logger, "TRACE_WRITER", None)
+    return log
+
+
+def test_replay_mode_routes_records_to_sink(tmp_path, monkeypatch):
+    log = isolate_log(tmp_path, monkeypatch)
+    sink = MemorySink()
+
+    with replay_mode(sink):
+        verdict = enforce(make_input())
+        enforce_many([make_input(0.0), make_input(0.5)])
+
+    assert [r["trace_id"] for r in sink.records][0] == verdict.trace_id
+    assert len(sink.records) == 3
+    assert list(log.iter_records()) == []
+
+
+def test_replay_mode_defaults_to_null_sink_and_restores(tmp_path, monkeypatch):
+    log = isolate_log(tmp_path, monkeypatch)
+
+    with replay_mode():
+        enforce(make_input())
+    assert list(log.iter_records()) == []
+
+    enforce(make_input())
+    assert len(list(log.iter_records())) == 1
+
+
+def test_replay_mode_bypasses_verdict_cache(monkeypatch):
+    cache = VerdictCache()
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", cache)
+
+    with replay_mode():
+        enforce(make_input())
+        enforce(make_input())
+
+    assert cache.stats()["hits"] == 0
+    assert cache.stats()["size"] == 0
+
+
+def test_replay_tool_does_not_relog(tmp_path, monkeypatch):
+    log = isolate_log(tmp_path, monkeypatch)
+    sink = MemorySink()
+    with replay_mode(sink):
+        enforce(make_input())
+    (record,) = sink.records
+
+    assert replay_trace(record) is True
+    assert list(log.iter_records()) == []
@@ -0,0 +1,135 @@
+import threading
+import time
+
+import enforcement_engine
+from enforcement_engine import enforce
+from models.enforcement_input import EnforcementInput
+from utils.single_flight import SingleFlight
+from validators.akanksha.enforcement_adapter import EnforcementAdapter
+
+CALLERS = 8
+
+
+def make_input(intent="coalesce me"):
+    return EnforcementInput(
+        intent=intent,
+        emotional_output={"tone": "neutral", "dependency_score": 0.0},
+        age_gate_status="ALLOWED",
+        region_policy="IN",
+        platform_policy="INSTAGRAM",
+        karma_score=0.0,
+        risk_flags=[],
+    )
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def _run_concurrently(fn, count=CALLERS):
+    results = [None] * count
+
+    def worker(i):
+        try:
+            results[i] = fn()
+        except Exception as exc:
+            results[i] = exc
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    return threads, results
+
+
+def test_single_flight_runs_once_per_key():
+    flight = SingleFlight()
+    release = threading.Event()
+    runs = []
+
+    def compute():
+        runs.append(1)
+        release.wait(5)
+        return "result"
+
+    threads, results = _run_concurrently(lambda: flight.do("k", compute))
+    _wait_for(lambda: flight.coalesced == CALLERS - 1)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(runs) == 1
+    assert sorted(shared for _, shared in results) == [False] + [True] * (CALLERS - 1)
+    assert {result for result, _ in results} == {"result"}
+    assert flight.in_flight() == 0
+
+
+def test_single_flight_delivers_leader_error_to_waiters():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def compute():
+        release.wait(5)
+        raise RuntimeError("boom")
+
+    threads, results = _run_concurrently(lambda: flight.do("k", compute), count=3)
+    _wait_for(lambda: flight.coalesced == 2)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert flight.in_flight() == 0
+
+    # Nothing retained: the next call runs again
+    assert flight.do("k", lambda: "fresh") == ("fresh", False)
+
+
+def test_coalesced_enforce_shares_verdict_and_audits_every_caller(monkeypatch):
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", None)
+
+    release = threading.Event()
+    validations = []
+    original = EnforcementAdapter.validate
+
+    def slow_validate(self, input_payload, deadline=None):
+        validations.append(1)
+        release.wait(5)
+        return original(self, input_payload, deadline)
+
+    monkeypatch.setattr(EnforcementAdapter, "validate", slow_validate)
+
+    records = []
+    monkeypatch.setattr(
+        enforcement_engine, "log_enforcement", lambda **kw: records.append(kw)
+    )
+
+    flight = SingleFlight()
+    threads, verdicts = _run_concurrently(
+        lambda: enforce(make_input(), single_flight=flight)
+    )
+    _wait_for(lambda: flight.coalesced == CALLERS - 1)
+    release.set()
+    for t in threads:
+        t.join()
+
+    expected = enforce(make_input())
+
+    assert len(validations) == 2        # one coalesced flight + the reference call
+    assert all(v == expected for v in verdicts)
+    assert len(records) == CALLERS + 1
+    assert {r["trace_id"] for r in records} == {expected.trace_id}
+    assert sum(1 for r in records if r.get("coalesced")) == CALLERS - 1
+
+
+def test_distinct_payloads_are_not_coalesced(monkeypatch):
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", None)
+    flight = SingleFlight()
+
+    a = enforce(make_input("first"), single_flight=flight)
+    b = enforce(make_input("second"), single_flight=flight)
+
+    assert flight.coalesced == 0
+    assert a.trace_id != b.trace_id
@@ -0,0 +1,91 @@
+import threading
+
+import enforcement_engine
+from enforcement_engine import enforce, replay_mode, reset_stage_metrics, stage_metrics_snapshot
+from evaluator_modules import ALL_EVALUATORS
+from logs.bucket_logger import MemorySink
+from models.enforcement_input import EnforcementInput
+from utils.metrics import STAGES, Histogram, StageMetrics
+
+
+def make_input():
+    return EnforcementInput(
+        intent="time me",
+        emotional_output={"tone": "neutral", "dependency_score": 0.9},
+        age_gate_status="ALLOWED",
+        region_policy="IN",
+        platform_policy="INSTAGRAM",
+        karma_score=0.0,
+        risk_flags=[],
+    )
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram(buckets=(1, 5, 10))
+    for value in (0.5, 1, 3, 7, 50):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == [(1, 2), (5, 3), (10, 4), ("+Inf", 5)]
+    assert snapshot["count"] == 5
+    assert snapshot["sum"] == 61.5
+
+    histogram.reset()
+    assert histogram.snapshot()["count"] == 0
+
+
+def test_histogram_shards_merge_across_threads():
+    histogram = Histogram()
+
+    def work():
+        for _ in range(1000):
+            histogram.observe(0.001)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert histogram.snapshot()["count"] == 8000
+
+
+def test_counter_sampling_is_deterministic():
+    metrics = StageMetrics(sample_rate=0.25)
+    sampled = [metrics.sample_next() for _ in range(12)]
+    assert sampled == [False, False, False, True] * 3
+
+    assert not any(StageMetrics(sample_rate=0).sample_next() for _ in range(10))
+
+
+def test_sampled_enforce_feeds_histograms_and_trace_record(monkeypatch):
+    monkeypatch.setattr(
+        enforcement_engine, "STAGE_METRICS", StageMetrics(sample_rate=1.0, attach_to_trace=True)
+    )
+    sink = MemorySink()
+
+    with replay_mode(sink):
+        verdict = enforce(make_input())
+
+    snapshot = stage_metrics_snapshot()
+    assert snapshot["sampled_requests"] == 1
+    assert set(snapshot["stages"]) == set(STAGES) - {"cache_lookup"}  # replay: no cache
+    assert set(snapshot["evaluators"]) == {e.name for e in ALL_EVALUATORS}
+
+    (record,) = sink.records
+    assert record["trace_id"] == verdict.trace_id
+    assert "akanksha" in record["stage_timings_us"]
+    assert "evaluator.dependency_tone" in record["stage_timings_us"]
+
+    reset_stage_metrics()
+    assert stage_metrics_snapshot()["sampled_requests"] == 0
+
+
+def test_unsampled_records_carry_no_timings(monkeypatch):
+    monkeypatch.setattr(enforcement_engine, "STAGE_METRICS", StageMetrics(sample_rate=0))
+    sink = MemorySink()
+
+    with replay_mode(sink):
+        enforce(make_input())
+
+    assert "stage_timings_us" not in sink.records[0]
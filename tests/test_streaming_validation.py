@@ -0,0 +1,106 @@
+import random
+
+import pytest
+
+from validators.akanksha.behavior_validator import (
+    BehaviorValidator,
+    CompiledPatternLibrary,
+    Decision,
+    PatternLibrary,
+    RiskCategory,
+)
+
+FRAGMENTS = [
+    "kill myself", "want to die", "I will kill you", "send me nudes", "sexting",
+    "I am 15", "I am 175", "underage", "minor", "minority", "stay with me forever",
+    "you are all I have", "don’t leave me", "you owe me", "I am lonely", "all alone",
+    "love", "glove", "romantic", "hello", "xkill myself", "ſexting", "KILL MYSELF",
+    " ", " | ", "tone: neutral",
+]
+
+
+def corpus(n=300, seed=11):
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield "".join(
+            rng.choice(FRAGMENTS) + rng.choice(["", " ", ".", "_"])
+            for _ in range(rng.randint(0, 8))
+        )
+
+
+def random_chunks(text, rng):
+    chunks, pos = [], 0
+    while pos < len(text):
+        size = rng.choice([1, 1, 2, 3, 5, 8, 40])
+        chunks.append(text[pos:pos + size])
+        pos += size
+    return chunks
+
+
+def batch(validator, text, age_ok):
+    return validator.validate_behavior(
+        intent="",
+        conversational_output=text,
+        age_gate_status=age_ok,
+        region_rule_status=None,
+        platform_policy_state=None,
+        karma_bias_input=0.0,
+    )
+
+
+def test_final_result_is_identical_to_batch():
+    validator = BehaviorValidator()
+    rng = random.Random(3)
+    for text in corpus():
+        for age_ok in (True, False):
+            stream = validator.stream(intent="", age_gate_status=age_ok)
+            for chunk in random_chunks(text, rng):
+                stream.feed(chunk)
+            assert stream.finish() == batch(validator, text, age_ok)
+
+
+def test_pattern_split_across_chunks_fires_provisionally():
+    stream = BehaviorValidator().stream(intent="", age_gate_status=True)
+    assert stream.feed("okay but I want to d") is None
+    assert stream.feed("ie") is None              # needs the next character
+    assert stream.feed(" now, and more text follows") == Decision.HARD_DENY
+    assert stream.finish().decision == Decision.HARD_DENY
+
+
+def test_word_boundary_is_not_assumed_at_a_chunk_edge():
+    validator = BehaviorValidator()
+    stream = validator.stream(intent="", age_gate_status=True)
+    assert stream.feed("a minor") is None
+    assert stream.feed("ity view") is None
+    assert stream.finish() == batch(validator, "a minority view", True)
+    assert stream.finish().decision == Decision.ALLOW
+
+
+def test_match_at_end_of_stream_is_confirmed_by_finish():
+    stream = BehaviorValidator().stream(intent="", age_gate_status=True)
+    stream.feed("I am a minor")
+    assert stream.finish().decision == Decision.HARD_DENY
+    with pytest.raises(RuntimeError):
+        stream.feed("more")
+
+
+def test_scan_cost_is_proportional_to_new_text():
+    validator = BehaviorValidator()
+    stream = validator.stream(intent="", age_gate_status=True)
+    chunk = "tone: neutral and friendly. "
+    for _ in range(2000):
+        stream.feed(chunk)
+    window = validator.compiled_library.max_width + 1
+    assert stream.scanned_chars <= 2000 * (len(chunk) + window)
+
+
+def test_unbounded_patterns_cannot_stream():
+    class Unbounded(PatternLibrary):
+        SOFT_REWRITE_PATTERNS = {
+            RiskCategory.LONELINESS_HOOK: [(r'\bso+ lonely\b', 60, "Unbounded")],
+        }
+
+    validator = BehaviorValidator(CompiledPatternLibrary(Unbounded))
+    assert validator.compiled_library.max_width is None
+    with pytest.raises(ValueError):
+        validator.stream(intent="", age_gate_status=True)
@@ -0,0 +1,201 @@
+import time
+import threading
+
+import logs.bucket_logger as bucket_logger
+from logs.bucket_logger import log_enforcement
+from logs.trace_writer import AsyncTraceWriter
+
+
+class FakeLog:
+    def __init__(self, gate=None):
+        self.records = []
+        self.syncs = 0
+        self.appends = 0
+        self.gate = gate
+        self.lock = threading.Lock()
+
+    def append(self, records):
+        # Only the background writer is held at the gate.
+        if self.gate is not None and threading.current_thread().name == "trace-writer":
+            self.gate.wait()
+        with self.lock:
+            self.records.extend(records)
+            self.appends += 1
+
+    def sync(self):
+        self.syncs += 1
+
+
+def test_flush_commits_in_order_and_fsyncs():
+    log = FakeLog()
+    writer = AsyncTraceWriter(log, durability="os_buffered")
+    for i in range(50):
+        writer.submit([{"n": i}])
+
+    assert writer.flush(timeout=5)
+    assert log.records == [{"n": i} for i in range(50)]
+    assert log.syncs >= 1
+    assert writer.stats()["records_committed"] == 50
+    writer.close()
+
+
+def test_fsync_always_waits_for_durability():
+    log = FakeLog()
+    writer = AsyncTraceWriter(log, durability="fsync_always")
+
+    writer.submit([{"n": 1}])
+
+    assert log.records == [{"n": 1}]
+    assert log.syncs >= 1
+    writer.close()
+
+
+def test_group_commit_batches_queued_records():
+    gate = threading.Event()
+    log = FakeLog(gate)
+    writer = AsyncTraceWriter(log, durability="os_buffered", queue_max=100)
+
+    writer.submit([{"n": 0}])          # writer thread blocks on this one
+    for i in range(1, 20):
+        writer.submit([{"n": i}])
+    assert writer.stats()["queue_depth"] >= 1
+
+    gate.set()
+    writer.flush(timeout=5)
+
+    assert len(log.records) == 20
+    assert log.appends < 20            # queued records shared commits
+    writer.close()
+
+
+def test_drop_backpressure_counts_dropped_records():
+    gate = threading.Event()
+    log = FakeLog(gate)
+    writer = AsyncTraceWriter(log, queue_max=2, backpressure="drop")
+
+    results = [writer.submit([{"n": i}]) for i in range(10)]
+
+    assert False in results
+    assert writer.stats()["records_dropped"] == results.count(False)
+    gate.set()
+    writer.close()
+
+
+def test_inline_backpressure_writes_on_caller_thread():
+    gate = threading.Event()
+    log = FakeLog(gate)
+    writer = AsyncTraceWriter(log, queue_max=1, backpressure="inline")
+
+    for i in range(4):
+        writer.submit([{"n": i}])      # queue holds one: the rest go inline
+    assert writer.stats()["records_inline"] >= 2
+
+    gate.set()
+    writer.flush(timeout=5)
+
+    assert sorted(r["n"] for r in log.records) == [0, 1, 2, 3]
+    writer.close()
+
+
+def test_try_submit_never_blocks():
+    gate = threading.Event()
+    log = FakeLog(gate)
+    writer = AsyncTraceWriter(log, queue_max=2, backpressure="block")
+
+    results = [writer.try_submit([{"n": i}]) for i in range(10)]
+
+    assert True in results and False in results
+    assert writer.stats()["records_dropped"] == 0
+    assert AsyncTraceWriter(FakeLog(), durability="fsync_always").try_submit([{"n": 0}]) is False
+
+    gate.set()
+    writer.flush(timeout=5)
+    assert len(log.records) == results.count(True)
+    writer.close()
+
+
+def test_close_drains_queue():
+    log = FakeLog()
+    writer = AsyncTraceWriter(log, durability="fsync_interval", fsync_interval_ms=10000)
+    for i in range(10):
+        writer.submit([{"n": i}])
+
+    writer.close()
+
+    assert len(log.records) == 10
+    assert log.syncs >= 1
+
+
+class FailingLog(FakeLog):
+    def __init__(self):
+        super().__init__()
+        self.failing = True
+
+    def append(self, records):
+        if self.failing:
+            raise OSError("disk full")
+        super().append(records)
+
+
+def test_failed_commit_fails_the_barrier():
+    log = FailingLog()
+    writer = AsyncTraceWriter(log, durability="fsync_always")
+
+    assert writer.submit([{"n": 1}]) is False          # caller is told
+    assert writer.stats()["records_failed"] == 1
+
+    buffered = AsyncTraceWriter(log, durability="os_buffered")
+    assert buffered.submit([{"n": 2}]) is True          # queued
+    assert buffered.flush(timeout=5) is False           # but never persisted
+
+    log.failing = False
+    assert writer.submit([{"n": 3}]) is True
+    assert buffered.submit([{"n": 4}]) is True
+    assert buffered.flush(timeout=5) is True
+    assert log.records == [{"n": 3}, {"n": 4}]
+    writer.close()
+    buffered.close()
+
+
+def test_interval_sync_does_not_clear_a_failed_commit():
+    log = FailingLog()
+    writer = AsyncTraceWriter(log, durability="fsync_interval", fsync_interval_ms=1)
+
+    assert writer.submit([{"n": 1}]) is True
+    deadline = time.monotonic() + 5
+    while writer.stats()["records_failed"] < 1:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+    log.failing = False
+    writer.submit([{"n": 2}])
+    while log.syncs < 1:                                # interval sync ran
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+    assert writer.flush(timeout=5) is False
+    assert log.records == [{"n": 2}]
+    assert writer.flush(timeout=5) is True              # reported once
+    writer.close()
+
+
+def test_dropped_record_is_reported_to_the_logger(monkeypatch):
+    gate = threading.Event()
+    writer = AsyncTraceWriter(FakeLog(gate), queue_max=1, backpressure="drop")
+    monkeypatch.setattr(bucket_logger, "TRACE_WRITER", writer)
+
+    def log(i):
+        return log_enforcement(
+            trace_id=f"{i:064x}",
+            input_snapshot={"intent": "drop me"},
+            akanksha_verdict=None,
+            evaluator_results=[],
+            final_decision="ALLOW",
+        )
+
+    results = [log(i) for i in range(5)]
+
+    assert False in results
+    assert writer.stats()["records_dropped"] == results.count(False)
+    gate.set()
+    writer.close()
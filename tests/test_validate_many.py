@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from models.enforcement_input import EnforcementInput
+from validators.akanksha.behavior_validator import (
+    BehaviorValidator,
+    CompiledPatternLibrary,
+    PatternLibrary,
+    PatternTelemetry,
+)
+from validators.akanksha.enforcement_adapter import EnforcementAdapter
+
+FRAGMENTS = [
+    "kill myself", "want to die", "send me nudes", "I am 15", "minor", "minority",
+    "stay with me forever", "you are all I have", "you owe me", "I am lonely",
+    "all alone", "love", "romantic", "hello", "KILL MYSELF", " ", ". ",
+]
+
+
+def corpus(n=400, seed=5):
+    rng = random.Random(seed)
+    texts = [
+        "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 6)))
+        for _ in range(n)
+    ]
+    gates = [rng.random() < 0.7 for _ in texts]
+    return texts, gates
+
+
+def single(validator, text, gate):
+    return validator.validate_behavior(
+        intent="",
+        conversational_output=text,
+        age_gate_status=gate,
+        region_rule_status=None,
+        platform_policy_state=None,
+        karma_bias_input=0.0,
+    )
+
+
+def test_elements_are_identical_to_the_single_call():
+    validator = BehaviorValidator()
+    texts, gates = corpus()
+    batch = validator.validate_many(texts, gates)
+
+    assert len(batch) == len(texts)
+    for i, (text, gate) in enumerate(zip(texts, gates)):
+        expected = single(validator, text, gate)
+        assert batch.decisions[i] == expected.decision
+        assert batch.categories[i] == expected.risk_category
+        assert batch.confidences[i] == expected.confidence
+        assert batch.result(i) == expected
+    assert batch.results() == [single(validator, t, g) for t, g in zip(texts, gates)]
+
+
+def test_scalar_gate_and_duplicates_are_scanned_once():
+    library = CompiledPatternLibrary(PatternLibrary)
+    telemetry = PatternTelemetry(library)
+    validator = BehaviorValidator(library, telemetry)
+
+    batch = validator.validate_many(["I am lonely", "hello", "I am lonely"] * 10)
+
+    assert telemetry.snapshot()["scans"] == 2
+    assert batch.decisions[0] == batch.decisions[2] == single(validator, "I am lonely", True).decision
+    assert validator.validate_many([]).results() == []
+
+
+def test_gate_length_must_match():
+    with pytest.raises(ValueError):
+        BehaviorValidator().validate_many(["a", "b"], [True])
+
+
+def test_adapter_batch_uses_one_shared_pass_and_matches_validate(monkeypatch):
+    texts, gates = corpus(n=200, seed=11)
+    inputs = [
+        EnforcementInput(
+            intent=text,
+            emotional_output={"tone": "neutral", "dependency_score": 0.0},
+            age_gate_status="ALLOWED" if gate else "BLOCKED",
+            region_policy="IN",
+            platform_policy="INSTAGRAM",
+            karma_score=0.0,
+            risk_flags=[],
+        )
+        for text, gate in zip(texts, gates)
+    ]
+    broken = inputs[0].model_copy(update={"emotional_output": None})    # serialization fails
+    adapter = EnforcementAdapter()
+    expected = [adapter.validate(i) for i in inputs]
+
+    calls = []
+    validate_many = BehaviorValidator.validate_many
+    monkeypatch.setattr(
+        BehaviorValidator,
+        "validate_many",
+        lambda self, *args: calls.append(1) or validate_many(self, *args),
+    )
+    monkeypatch.setattr(BehaviorValidator, "validate_behavior", None)    # never per item
+
+    assert adapter.validate_many(inputs + [broken]) == expected + [None]
+    assert calls == [1]
@@ -0,0 +1,123 @@
+import threading
+
+import enforcement_engine
+from enforcement_engine import enforce
+from logs.bucket_logger import MemorySink, use_log_sink
+from models.enforcement_input import EnforcementInput
+from utils.verdict_cache import VerdictCache
+from validators.akanksha import behavior_validator
+from validators.akanksha.behavior_validator import PatternLibrary, RiskCategory
+from validators.akanksha.validator_manager import ValidatorManager
+
+
+class ExtendedLibrary(PatternLibrary):
+    SOFT_REWRITE_PATTERNS = {
+        **PatternLibrary.SOFT_REWRITE_PATTERNS,
+        RiskCategory.LONELINESS_HOOK: [(r'\bnobody listens\b', 66, "Isolation (new)")],
+    }
+
+
+class BrokenLibrary(PatternLibrary):
+    # The HARD_DENY self-test probe no longer fires
+    HARD_DENY_PATTERNS = {}
+
+
+def make_input(intent):
+    return EnforcementInput(
+        intent=intent,
+        emotional_output={"tone": "neutral", "dependency_score": 0.0},
+        age_gate_status="ALLOWED",
+        region_policy="IN",
+        platform_policy="INSTAGRAM",
+        karma_score=0.0,
+        risk_flags=[],
+    )
+
+
+def test_requests_share_one_prebuilt_validator(monkeypatch):
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", None)
+    built = []
+    original = behavior_validator.BehaviorValidator.__init__
+
+    def counting_init(self, *args, **kwargs):
+        built.append(self)
+        original(self, *args, **kwargs)
+
+    monkeypatch.setattr(behavior_validator.BehaviorValidator, "__init__", counting_init)
+
+    with use_log_sink(MemorySink()):
+        for i in range(5):
+            enforce(make_input(f"shared validator {i}"))
+
+    assert built == []
+    library = enforcement_engine.AKANKSHA.current().validator.compiled_library
+    assert len(library._tails) == len(library.entries)      # warmed
+
+
+def test_install_swaps_atomically_and_keeps_old_instance_on_failure():
+    manager = ValidatorManager()
+    first = manager.current()
+
+    assert manager.install(ExtendedLibrary) is True
+    second = manager.current()
+    assert second is not first and manager.generation == 2
+    assert second.validate(make_input("nobody listens"))["decision"] == "REWRITE"
+    assert first.validate(make_input("nobody listens"))["decision"] == "EXECUTE"
+
+    assert manager.install(BrokenLibrary) is False
+    assert manager.current() is second
+    assert manager.failures == 1 and "self-test" in manager.last_error
+
+
+def test_install_invalidates_cached_verdicts(monkeypatch):
+    manager = ValidatorManager()
+    monkeypatch.setattr(enforcement_engine, "AKANKSHA", manager)
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", VerdictCache())
+
+    with use_log_sink(MemorySink()):
+        assert enforce(make_input("nobody listens")).decision == "ALLOW"
+        assert enforce(make_input("nobody listens")).decision == "ALLOW"    # cached
+        assert manager.install(ExtendedLibrary) is True
+        assert enforce(make_input("nobody listens")).decision == "REWRITE"
+
+    stats = enforcement_engine.VERDICT_CACHE.stats()
+    assert stats["hits"] == 1 and stats["invalidations"] == 1
+
+
+def test_no_valid_validator_fails_closed(monkeypatch):
+    manager = ValidatorManager(BrokenLibrary)
+    assert not manager.ready()
+    monkeypatch.setattr(enforcement_engine, "AKANKSHA", manager)
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", None)
+
+    with use_log_sink(MemorySink()):
+        verdict = enforce(make_input("no validator"))
+
+    assert verdict.decision == "TERMINATE"
+    assert verdict.reason_code == "AKANKSHA_VALIDATION_FAILED"
+
+
+def test_concurrent_validation_across_a_swap():
+    manager = ValidatorManager()
+    inputs = [make_input("I want to die"), make_input("you are all I have"), make_input("hi")]
+    expected = [manager.current().validate(i)["decision"] for i in inputs]
+    errors = []
+
+    def worker():
+        try:
+            for _ in range(200):
+                got = [manager.current().validate(i)["decision"] for i in inputs]
+                assert got == expected
+        except Exception as exc:        # surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for _ in range(5):
+        manager.install(PatternLibrary)
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert manager.generation == 6
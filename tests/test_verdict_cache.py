@@ -0,0 +1,109 @@
+import enforcement_engine
+from config_loader import CONFIG
+from enforcement_engine import enforce
+from models.enforcement_input import EnforcementInput
+from utils.metrics import StageMetrics
+from utils.verdict_cache import VerdictCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_input(intent="cache me", dependency_score=0.9, age_gate_status="ALLOWED"):
+    return EnforcementInput(
+        intent=intent,
+        emotional_output={"tone": "neutral", "dependency_score": dependency_score},
+        age_gate_status=age_gate_status,
+        region_policy="IN",
+        platform_policy="INSTAGRAM",
+        karma_score=0.0,
+        risk_flags=[],
+    )
+
+
+def test_lru_eviction_and_counters():
+    cache = VerdictCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", "fp", 1)
+    cache.put("b", "fp", 2)
+    assert cache.get("a", "fp") == 1      # a becomes most recent
+    cache.put("c", "fp", 3)               # evicts b
+
+    assert cache.get("b", "fp") is None
+    assert cache.get("c", "fp") == 3
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 2 / 3
+
+
+def test_ttl_expiry():
+    clock = FakeClock()
+    cache = VerdictCache(max_entries=10, ttl_seconds=5, clock=clock)
+    cache.put("a", "fp", 1)
+    clock.now = 4.9
+    assert cache.get("a", "fp") == 1
+    clock.now = 5.0
+    assert cache.get("a", "fp") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_fingerprint_change_invalidates():
+    cache = VerdictCache()
+    cache.put("a", "v1", 1)
+    assert cache.get("a", "v2") is None
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_engine_cache_hit_still_emits_audit_record(monkeypatch):
+    cache = VerdictCache()
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", cache)
+    # Sampled records carry timings; keep both records comparable
+    monkeypatch.setattr(enforcement_engine, "STAGE_METRICS", StageMetrics(sample_rate=0))
+    logged = []
+    monkeypatch.setattr(
+        enforcement_engine, "log_enforcement", lambda **kw: logged.append(kw)
+    )
+
+    v1 = enforce(make_input())
+    v2 = enforce(make_input())
+
+    assert v1 == v2
+    assert cache.stats()["hits"] == 1
+    assert len(logged) == 2
+    assert logged[0] == logged[1]
+
+
+def test_engine_cache_invalidated_by_policy_change(monkeypatch):
+    cache = VerdictCache()
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", cache)
+    monkeypatch.setattr(enforcement_engine, "log_enforcement", lambda **kw: None)
+
+    enforce(make_input())
+    candidate = CONFIG.build(
+        {**CONFIG.snapshot.enforcement, "policy_revision": "candidate"},
+        CONFIG.snapshot.runtime,
+    )
+    monkeypatch.setattr(CONFIG, "snapshot", candidate)
+    enforce(make_input())
+
+    assert cache.stats()["hits"] == 0
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_case_variants_are_not_conflated(monkeypatch):
+    cache = VerdictCache()
+    monkeypatch.setattr(enforcement_engine, "VERDICT_CACHE", cache)
+    monkeypatch.setattr(enforcement_engine, "log_enforcement", lambda **kw: None)
+
+    allowed = make_input(dependency_score=0.0)
+    lowered = make_input(dependency_score=0.0, age_gate_status="allowed")
+
+    assert enforce(allowed).decision == "ALLOW"
+    assert enforce(lowered).decision == "BLOCK"
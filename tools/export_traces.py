@@ -0,0 +1,32 @@
+"""
+TRACE EXPORT TOOL
+=================
+Exports the segmented enforcement log to the canonical
+JSON array format (tools/replay_tool.py, proof files).
+
+READ-ONLY ON THE LOG (the legacy logs/replayable_traces.json
+is never overwritten; it is part of the export via its
+imported "legacy" stream).
+"""
+
+import os
+import sys
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+from logs.bucket_logger import export_json_array
+
+
+def main(output_file: str):
+    count = export_json_array(output_file)
+    print(f"Exported {count} enforcement trace(s) → {output_file}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python tools/export_traces.py <output_file>")
+        print("  e.g. python tools/export_traces.py logs/exports/replayable_traces.json")
+        sys.exit(1)
+
+    main(sys.argv[1])
@@ -0,0 +1,57 @@
+"""
+KILL SWITCH CONTROL
+===================
+Engages / releases the shared global kill switch for EVERY local
+worker process at once (no restart, no config reload).
+
+    python tools/kill_switch.py status
+    python tools/kill_switch.py engage  --reason "incident 42"
+    python tools/kill_switch.py release --reason "incident 42 resolved"
+
+Every toggle is appended to the kill switch event log.
+The static `kill_switch` in config/runtime.yaml cannot be released here.
+"""
+
+import argparse
+import getpass
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+from config_loader import RUNTIME_CONFIG
+from utils.kill_switch import from_config
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Shared global kill switch")
+    parser.add_argument("action", choices=("status", "engage", "release"))
+    parser.add_argument("--reason", help="required for engage / release")
+    parser.add_argument("--actor", default=None, help="defaults to the current user")
+    args = parser.parse_args(argv)
+
+    switch = from_config(RUNTIME_CONFIG, ROOT_DIR)
+
+    if args.action == "status":
+        print(json.dumps(switch.status(), indent=2, sort_keys=True))
+        return 0
+
+    if not args.reason:
+        parser.error(f"--reason is required to {args.action}")
+
+    event = switch.set(
+        args.action == "engage",
+        actor=args.actor or getpass.getuser(),
+        reason=args.reason,
+    )
+    print(json.dumps(event, indent=2, sort_keys=True))
+
+    if args.action == "release" and switch.static:
+        print("WARNING: kill_switch is set in config/runtime.yaml; enforcement stays terminated")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
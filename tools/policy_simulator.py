@@ -0,0 +1,305 @@
+"""
+POLICY SIMULATOR
+================
+What-if analysis: replays historical input snapshots under the
+CURRENT and a CANDIDATE policy and reports how decisions move.
+
+- Policy = enforcement.yaml `evaluators` section (dependency_tone
+  threshold, region_restriction regions), optionally overridden
+  on the command line
+- Columnar: each chunk runs evaluate_many() per policy; Akanksha
+  (policy-independent) runs ONCE per unique snapshot and is shared
+- Chunks are deduplicated on the canonical payload and fanned out
+  to a process pool; input is streamed (see replay_verifier)
+- Output: decision-transition matrix (ALLOW→BLOCK, ...) with
+  sample trace IDs per changed cell
+
+READ-ONLY
+NO LOGGING (the live trace log is never touched)
+"""
+
+import argparse
+import copy
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import yaml
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+from config_loader import CONFIG, ConfigError, validate_evaluators
+from enforcement_engine import (
+    AKANKSHA,
+    _evaluator_rows,
+    _resolve_final_decision,
+    _resolve_raj_decision,
+)
+from evaluator_modules import build_evaluators
+from models.enforcement_input import EnforcementInput
+from tools.replay_tool import _extract_input_snapshot
+from tools.replay_verifier import _chunks, iter_traces
+from utils.verdict_cache import canonical_cache_key
+
+MALFORMED = "MALFORMED"
+
+
+# -------------------------------------------------
+# POLICIES
+# -------------------------------------------------
+
+def current_policy() -> Dict[str, Any]:
+    return copy.deepcopy(CONFIG.current().enforcement.get("evaluators") or {})
+
+
+def candidate_policy(
+    config_path: Optional[str] = None,
+    *,
+    dependency_threshold: Optional[float] = None,
+    restricted_regions: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Current policy, overlaid with a candidate enforcement.yaml
+    (its `evaluators` section) and then explicit overrides.
+
+    The candidate is validated like a config reload (and its evaluator
+    set built) BEFORE it is returned. Raises ConfigError; the current
+    policy is never modified.
+    """
+    policy = current_policy()
+    source = config_path or "candidate policy"
+
+    if config_path is not None:
+        try:
+            with open(config_path, "r", encoding="utf-8") as f:
+                candidate = yaml.safe_load(f) or {}
+        except (OSError, yaml.YAMLError) as exc:
+            raise ConfigError(f"{config_path}: {exc}") from exc
+        if not isinstance(candidate, dict):
+            raise ConfigError(f"{config_path}: expected a mapping")
+        validate_evaluators(candidate.get("evaluators"), config_path)
+        for name, settings in (candidate.get("evaluators") or {}).items():
+            policy.setdefault(name, {}).update(settings or {})
+
+    if dependency_threshold is not None:
+        policy.setdefault("dependency_tone", {})["threshold"] = dependency_threshold
+    if restricted_regions is not None:
+        policy.setdefault("region_restriction", {})["restricted_regions"] = list(
+            restricted_regions
+        )
+
+    validate_evaluators(policy, source)
+    try:
+        build_evaluators(policy)
+    except Exception as exc:
+        raise ConfigError(f"{source}: {type(exc).__name__}: {exc}") from exc
+
+    return policy
+
+
+# -------------------------------------------------
+# SIMULATION (RUNS IN WORKERS)
+# -------------------------------------------------
+
+def simulate_chunk(
+    records: List[Tuple[Optional[str], Any]],
+    current: Dict[str, Any],
+    candidate: Dict[str, Any],
+    max_samples: int,
+) -> Dict[str, Any]:
+    """
+    records: (trace_id, input_snapshot) pairs.
+    """
+    unique_index: Dict[str, int] = {}
+    unique_inputs: List[EnforcementInput] = []
+    positions: List[Tuple[Optional[str], int]] = []
+
+    for trace_id, snapshot in records:
+        try:
+            key = canonical_cache_key(snapshot)
+            if key not in unique_index:
+                unique_inputs.append(_to_input(snapshot))
+                unique_index[key] = len(unique_inputs) - 1
+            positions.append((trace_id, unique_index[key]))
+        except Exception:
+            positions.append((trace_id, -1))
+
+    akanksha_results = AKANKSHA.current().validate_many(unique_inputs)
+    before = _decide(unique_inputs, akanksha_results, current)
+    after = (
+        before if candidate == current
+        else _decide(unique_inputs, akanksha_results, candidate)
+    )
+
+    result = {"total": 0, "changed": 0, "matrix": {}, "samples": {}}
+    for trace_id, index in positions:
+        src = before[index] if index >= 0 else MALFORMED
+        dst = after[index] if index >= 0 else MALFORMED
+        _count(result, src, dst, trace_id, max_samples)
+
+    return result
+
+
+def _to_input(snapshot: Dict[str, Any]) -> EnforcementInput:
+    return EnforcementInput(
+        intent=snapshot["intent"],
+        emotional_output=snapshot["emotional_output"],
+        age_gate_status=snapshot["age_gate_status"],
+        region_policy=snapshot["region_policy"],
+        platform_policy=snapshot["platform_policy"],
+        karma_score=snapshot.get("karma_score", 0.0),
+        risk_flags=snapshot.get("risk_flags", []),
+    )
+
+
+def _decide(inputs, akanksha_results, policy) -> List[str]:
+    """
+    Public decision per input under policy (STEPS 2–5 of the engine,
+    without trace IDs or logging).
+    """
+    rows, failed = _evaluator_rows(build_evaluators(policy), inputs)
+    decisions = []
+    for evaluator_results, evaluator_failed, akanksha_result in zip(
+        rows, failed, akanksha_results
+    ):
+        if evaluator_failed or akanksha_result is None:
+            decisions.append("TERMINATE")
+            continue
+        final_decision = _resolve_final_decision(
+            raj_decision=_resolve_raj_decision(evaluator_results),
+            ak_decision=akanksha_result["decision"],
+        )
+        decisions.append("ALLOW" if final_decision == "EXECUTE" else final_decision)
+    return decisions
+
+
+def _count(result, src, dst, trace_id, max_samples) -> None:
+    result["total"] += 1
+    row = result["matrix"].setdefault(src, {})
+    row[dst] = row.get(dst, 0) + 1
+    if src != dst:
+        result["changed"] += 1
+        samples = result["samples"].setdefault(f"{src}->{dst}", [])
+        if len(samples) < max_samples and trace_id is not None:
+            samples.append(trace_id)
+
+
+# -------------------------------------------------
+# DRIVER
+# -------------------------------------------------
+
+def simulate(
+    path,
+    candidate: Dict[str, Any],
+    *,
+    current: Optional[Dict[str, Any]] = None,
+    workers: int = 0,
+    chunk_size: int = 5000,
+    max_samples: int = 5,
+) -> Dict[str, Any]:
+    """
+    Simulate candidate vs current over every trace in path.
+    workers <= 1 runs in-process.
+    """
+    current = current_policy() if current is None else current
+    started = time.monotonic()
+    summary = {"total": 0, "changed": 0, "matrix": {}, "samples": {}}
+
+    chunks = (
+        [_slim(record) for record in chunk]
+        for chunk in _chunks(iter_traces(path), chunk_size)
+    )
+
+    if workers <= 1:
+        for chunk in chunks:
+            _merge(summary, simulate_chunk(chunk, current, candidate, max_samples), max_samples)
+    else:
+        max_in_flight = workers * 2
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            in_flight = deque()
+            for chunk in chunks:
+                in_flight.append(
+                    pool.submit(simulate_chunk, chunk, current, candidate, max_samples)
+                )
+                if len(in_flight) >= max_in_flight:
+                    _merge(summary, in_flight.popleft().result(), max_samples)
+            while in_flight:
+                _merge(summary, in_flight.popleft().result(), max_samples)
+
+    elapsed = time.monotonic() - started
+    summary["current_policy"] = current
+    summary["candidate_policy"] = candidate
+    summary["elapsed_seconds"] = round(elapsed, 3)
+    summary["traces_per_second"] = round(summary["total"] / elapsed, 1) if elapsed else 0.0
+    return summary
+
+
+def _slim(record) -> Tuple[Optional[str], Any]:
+    # Only what the workers need crosses the process boundary.
+    if not isinstance(record, dict):
+        return None, None
+    try:
+        snapshot = _extract_input_snapshot(record)
+    except KeyError:
+        snapshot = None
+    return record.get("trace_id"), snapshot
+
+
+def _merge(summary: Dict[str, Any], part: Dict[str, Any], max_samples: int) -> None:
+    summary["total"] += part["total"]
+    summary["changed"] += part["changed"]
+    for src, row in part["matrix"].items():
+        target = summary["matrix"].setdefault(src, {})
+        for dst, count in row.items():
+            target[dst] = target.get(dst, 0) + count
+    for cell, ids in part["samples"].items():
+        samples = summary["samples"].setdefault(cell, [])
+        samples.extend(ids[: max_samples - len(samples)])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="What-if policy simulation over traces")
+    parser.add_argument("trace_file", help="JSON array, JSONL file or segment directory")
+    parser.add_argument("--candidate-config", help="candidate enforcement.yaml")
+    parser.add_argument("--dependency-threshold", type=float)
+    parser.add_argument(
+        "--restricted-regions",
+        help="comma-separated region list (replaces the current list)",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--max-samples", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    try:
+        candidate = candidate_policy(
+            args.candidate_config,
+            dependency_threshold=args.dependency_threshold,
+            restricted_regions=(
+                [r.strip() for r in args.restricted_regions.split(",") if r.strip()]
+                if args.restricted_regions is not None
+                else None
+            ),
+        )
+    except ConfigError as exc:
+        print(f"Invalid candidate policy: {exc}", file=sys.stderr)
+        return 1
+
+    summary = simulate(
+        args.trace_file,
+        candidate,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        max_samples=args.max_samples,
+    )
+    print(json.dumps(summary, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,25 @@
+"""
+TRACE INDEX REBUILD
+===================
+Rebuilds trace_id → (segment, offset) from the segmented
+enforcement log.
+
+READ-ONLY ON THE LOG
+"""
+
+import os
+import sys
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+from logs.bucket_logger import rebuild_trace_index
+
+
+def main():
+    count = rebuild_trace_index()
+    print(f"Indexed {count} enforcement trace(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from stored enforcement traces.
 READ-ONLY
 NO EXECUTION
 NO TRACE GENERATION
+NO RE-LOGGING (replay_mode)
 """
 
 import json
@@ -16,7 +17,7 @@ import sys
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, ROOT_DIR)
 
-from enforcement_engine import enforce
+from enforcement_engine import enforce, replay_config, replay_mode
 from models.enforcement_input import EnforcementInput
 from utils.deterministic_trace import generate_trace_id
 
@@ -48,7 +49,11 @@ def replay_trace(trace: dict) -> bool:
         risk_flags=input_snapshot.get("risk_flags", []),
     )
 
-    decision = enforce(enforcement_input)
+    # Replay under the config version the trace was written under
+    config_hash = trace.get("config_hash")
+    config, config_available = replay_config(config_hash)
+    with replay_mode(config=config):
+        decision = enforce(enforcement_input)
 
     recomputed_trace_id = generate_trace_id(
         input_payload=input_snapshot,
@@ -56,11 +61,13 @@ def replay_trace(trace: dict) -> bool:
     )
 
     trace_match = recomputed_trace_id == expected_trace_id
-    decision_match = decision.decision == expected_decision
+    decision_match = config_available and decision.decision == expected_decision
 
     print("—" * 60)
     print(f"Trace ID match    : {'✅' if trace_match else '❌'}")
     print(f"Decision match    : {'✅' if decision_match else '❌'}")
+    if not config_available:
+        print(f"Config snapshot   : ❌ {config_hash} not archived (replayed under the active config)")
     print(f"Expected decision : {expected_decision}")
     print(f"Replayed decision : {decision.decision}")
     print(f"Trace ID          : {expected_trace_id}")
@@ -0,0 +1,256 @@
+"""
+PARALLEL REPLAY VERIFIER
+========================
+Streams an enforcement trace archive and verifies, for every trace,
+both the recomputed trace_id and the replayed decision.
+
+- Input: JSON array (replayable_traces.json export), line-delimited
+  JSON (segments / .jsonl), or a segment directory
+- Parsed incrementally: memory is bounded by chunk_size × in-flight
+  chunks, never by archive size
+- Chunks fan out to a process pool; each chunk replays through
+  enforce_many() inside replay_mode() (no re-logging, no cache)
+- Output: one compact summary report (counts + sample mismatches)
+- Records marked deadline_exceeded (TERMINATE on an exhausted time
+  budget) are verified by trace_id only: replay has no deadline
+- Kill-switch records (TERMINATE / GLOBAL_KILL_SWITCH) are verified
+  by trace_id only: the shared flag is runtime state, not config
+- Records carrying a config_hash replay under that archived config
+  snapshot; if it is not archived here the record is verified by
+  trace_id only (config_unavailable)
+
+READ-ONLY
+NO EXECUTION
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterator, List
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+from enforcement_engine import enforce_many, replay_config, replay_mode
+from models.enforcement_input import EnforcementInput
+from logs.trace_reader import iter_traces
+from tools.replay_tool import _extract_input_snapshot
+from utils.deterministic_trace import generate_trace_id
+
+
+# -------------------------------------------------
+# VERIFICATION (RUNS IN WORKERS)
+# -------------------------------------------------
+
+def verify_chunk(records: List[Dict[str, Any]], max_samples: int) -> Dict[str, Any]:
+    result = {
+        "total": 0,
+        "verified": 0,
+        "trace_id_mismatches": 0,
+        "decision_mismatches": 0,
+        "malformed": 0,
+        "deadline_exceeded": 0,
+        "kill_switch": 0,
+        "config_unavailable": 0,
+        "samples": [],
+    }
+
+    inputs, expected = [], []
+    for record in records:
+        result["total"] += 1
+        try:
+            snapshot = _extract_input_snapshot(record)
+            inputs.append(
+                EnforcementInput(
+                    intent=snapshot["intent"],
+                    emotional_output=snapshot["emotional_output"],
+                    age_gate_status=snapshot["age_gate_status"],
+                    region_policy=snapshot["region_policy"],
+                    platform_policy=snapshot["platform_policy"],
+                    karma_score=snapshot.get("karma_score", 0.0),
+                    risk_flags=snapshot.get("risk_flags", []),
+                )
+            )
+            expected.append((
+                record["trace_id"],
+                record["final_decision"],
+                snapshot,
+                record.get("deadline_exceeded") is True,
+                _is_kill_switch(record),
+                record.get("config_hash"),
+            ))
+        except Exception:
+            result["malformed"] += 1
+            trace_id = record.get("trace_id") if isinstance(record, dict) else None
+            _sample(result, max_samples, trace_id, "malformed", None, None)
+
+    # One enforce_many() per config version in the chunk
+    by_config = {}
+    for position, (*_, config_hash) in enumerate(expected):
+        by_config.setdefault(config_hash, []).append(position)
+
+    verdicts = [None] * len(inputs)
+    unavailable = set()
+    for config_hash, positions in by_config.items():
+        config, available = replay_config(config_hash)
+        if not available:
+            unavailable.update(positions)
+        with replay_mode(config=config):
+            replayed = enforce_many([inputs[p] for p in positions])
+        for position, verdict in zip(positions, replayed):
+            verdicts[position] = verdict
+
+    for position, ((trace_id, decision, snapshot, timed_out, killed, _), verdict) in enumerate(
+        zip(expected, verdicts)
+    ):
+        recomputed = generate_trace_id(
+            input_payload=snapshot,
+            enforcement_category=decision,
+        )
+        trace_ok = recomputed == trace_id
+        no_config = position in unavailable
+        decision_ok = timed_out or killed or no_config or verdict.decision == decision
+        if timed_out:
+            result["deadline_exceeded"] += 1
+        if killed:
+            result["kill_switch"] += 1
+        if no_config:
+            result["config_unavailable"] += 1
+
+        if trace_ok and decision_ok:
+            result["verified"] += 1
+            continue
+        if not trace_ok:
+            result["trace_id_mismatches"] += 1
+            _sample(result, max_samples, trace_id, "trace_id", trace_id, recomputed)
+        if not decision_ok:
+            result["decision_mismatches"] += 1
+            _sample(result, max_samples, trace_id, "decision", decision, verdict.decision)
+
+    return result
+
+
+def _is_kill_switch(record: Dict[str, Any]) -> bool:
+    if record.get("kill_switch") is True:
+        return True
+    # Records written before the marker: the kill switch is the only
+    # TERMINATE without evaluator results that is not a deadline.
+    return (
+        record.get("final_decision") == "TERMINATE"
+        and not record.get("raj_evaluators")
+        and record.get("deadline_exceeded") is not True
+    )
+
+
+def _sample(result, max_samples, trace_id, kind, expected, replayed) -> None:
+    if len(result["samples"]) < max_samples:
+        result["samples"].append({
+            "trace_id": trace_id,
+            "kind": kind,
+            "expected": expected,
+            "replayed": replayed,
+        })
+
+
+# -------------------------------------------------
+# DRIVER
+# -------------------------------------------------
+
+def verify(
+    path,
+    *,
+    workers: int = 0,
+    chunk_size: int = 2000,
+    max_samples: int = 20,
+) -> Dict[str, Any]:
+    """
+    Verify every trace in path. workers <= 1 runs in-process.
+    """
+    started = time.monotonic()
+    summary = {
+        "total": 0,
+        "verified": 0,
+        "trace_id_mismatches": 0,
+        "decision_mismatches": 0,
+        "malformed": 0,
+        "deadline_exceeded": 0,
+        "kill_switch": 0,
+        "config_unavailable": 0,
+        "samples": [],
+    }
+
+    chunks = _chunks(iter_traces(path), chunk_size)
+
+    if workers <= 1:
+        for chunk in chunks:
+            _merge(summary, verify_chunk(chunk, max_samples), max_samples)
+    else:
+        # Bounded window of in-flight chunks, merged in submission
+        # order so the report is identical for any worker count
+        max_in_flight = workers * 2
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            in_flight = deque()
+            for chunk in chunks:
+                in_flight.append(pool.submit(verify_chunk, chunk, max_samples))
+                if len(in_flight) >= max_in_flight:
+                    _merge(summary, in_flight.popleft().result(), max_samples)
+            while in_flight:
+                _merge(summary, in_flight.popleft().result(), max_samples)
+
+    elapsed = time.monotonic() - started
+    summary["elapsed_seconds"] = round(elapsed, 3)
+    summary["traces_per_second"] = round(summary["total"] / elapsed, 1) if elapsed else 0.0
+    summary["deterministic"] = summary["verified"] == summary["total"]
+    return summary
+
+
+def _chunks(records: Iterator[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    while True:
+        chunk = list(islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _merge(summary: Dict[str, Any], part: Dict[str, Any], max_samples: int) -> None:
+    for key in (
+        "total",
+        "verified",
+        "trace_id_mismatches",
+        "decision_mismatches",
+        "malformed",
+        "deadline_exceeded",
+        "kill_switch",
+        "config_unavailable",
+    ):
+        summary[key] += part[key]
+    room = max_samples - len(summary["samples"])
+    if room > 0:
+        summary["samples"].extend(part["samples"][:room])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parallel streaming replay verifier")
+    parser.add_argument("trace_file", help="JSON array, JSONL file or segment directory")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    parser.add_argument("--max-samples", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    summary = verify(
+        args.trace_file,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        max_samples=args.max_samples,
+    )
+    print(json.dumps(summary, indent=2))
+    return 0 if summary["deterministic"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+ADMISSION CONTROL
+-----------------
+Bounded concurrency in front of the enforcement path.
+
+- At most max_concurrent requests hold a slot
+- At most max_queue requests wait for one (FIFO)
+- A waiter that does not get a slot within queue_timeout is shed
+- Shedding is IMMEDIATE: no request waits beyond queue_timeout,
+  so tail latency stays bounded at peak
+
+Slots are handed directly from a releasing request to the oldest
+waiter. Counters are guarded by a threading lock and waiters are
+woken with call_soon_threadsafe, so one controller serves any number
+of event loops (one per worker / test client portal).
+"""
+
+import asyncio
+import threading
+from collections import deque
+from contextlib import asynccontextmanager
+from time import perf_counter
+from typing import Deque, Tuple
+
+from utils.metrics import Histogram, LabeledCounter
+
+SHED_QUEUE_FULL = "queue_full"
+SHED_QUEUE_TIMEOUT = "queue_timeout"
+
+
+class Overloaded(Exception):
+    """
+    Request shed by admission control (reason: queue_full | queue_timeout).
+    """
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class AdmissionController:
+
+    def __init__(
+        self,
+        *,
+        max_concurrent: int = 32,
+        max_queue: int = 256,
+        queue_timeout_ms: float = 50.0,
+    ):
+        self.max_concurrent = max(int(max_concurrent), 1)
+        self.max_queue = max(int(max_queue), 0)
+        self.queue_timeout = max(float(queue_timeout_ms), 0.0) / 1000.0
+
+        self._lock = threading.Lock()
+        self._active = 0
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
+        self.shed = LabeledCounter()       # by reason
+        self.queue_wait = Histogram()      # admitted requests only
+
+    # -------------------------------
+    # SLOT
+    # -------------------------------
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        Hold one slot for the body of the block; raises Overloaded
+        (without entering the block) when the request is shed.
+        """
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self) -> None:
+        started = perf_counter()
+
+        with self._lock:
+            if self._active < self.max_concurrent and not self._waiters:
+                self._active += 1
+                self.queue_wait.observe(0.0)
+                return
+            if len(self._waiters) >= self.max_queue:
+                self.shed.inc(SHED_QUEUE_FULL)
+                raise Overloaded(SHED_QUEUE_FULL)
+            loop = asyncio.get_running_loop()
+            waiter = loop.create_future()
+            entry = (loop, waiter)
+            self._waiters.append(entry)
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            with self._lock:
+                queued = entry in self._waiters
+                if queued:
+                    self._waiters.remove(entry)
+            if not queued:
+                # Handed a slot while timing out: give it back.
+                self.release()
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            self.shed.inc(SHED_QUEUE_TIMEOUT)
+            raise Overloaded(SHED_QUEUE_TIMEOUT) from None
+
+        self.queue_wait.observe(perf_counter() - started)
+
+    def release(self) -> None:
+        with self._lock:
+            if not self._waiters:
+                self._active -= 1
+                return
+            # Slot passes straight to the oldest waiter (active unchanged).
+            loop, waiter = self._waiters.popleft()
+        loop.call_soon_threadsafe(_grant, waiter)
+
+    # -------------------------------
+    # STATE
+    # -------------------------------
+
+    def active(self) -> int:
+        with self._lock:
+            return self._active
+
+    def queued(self) -> int:
+        with self._lock:
+            return len(self._waiters)
+
+
+def _grant(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,51 @@
+"""
+DEADLINE
+--------
+Per-request time budget, checked cooperatively between pipeline
+stages and inside long-running scans.
+
+- Monotonic clock only (never wall time)
+- Observational for the trace hash: a deadline changes WHETHER an
+  evaluation completes, never how a completed one is hashed
+- Expiry raises DeadlineExceeded; callers FAIL CLOSED
+"""
+
+import time
+from typing import Optional
+
+_clock = time.monotonic
+
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+class Deadline:
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, expires_at: float):
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        return cls(_clock() + seconds)
+
+    @classmethod
+    def after_ms(cls, milliseconds: Optional[float]) -> Optional["Deadline"]:
+        """
+        None (no budget) when milliseconds is None or not positive.
+        """
+        if milliseconds is None or milliseconds <= 0:
+            return None
+        return cls.after(milliseconds / 1000.0)
+
+    def remaining(self) -> float:
+        return self.expires_at - _clock()
+
+    def expired(self) -> bool:
+        return _clock() >= self.expires_at
+
+    def check(self) -> None:
+        if _clock() >= self.expires_at:
+            raise DeadlineExceeded()
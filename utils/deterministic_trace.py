@@ -17,6 +17,74 @@ def normalize_input(payload: Dict[str, Any]) -> str:
     ).lower()
 
 
+# Built once: identical output to the json.dumps() call in
+# normalize_input() (before .lower()), minus per-call encoder setup.
+_CANONICAL_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=True,
+)
+
+
+def encode_canonical(payload: Any) -> str:
+    """
+    Compact, sorted-key, ASCII JSON. Case preserved.
+    encode_canonical(p).lower() == normalize_input(p), byte for byte.
+    """
+    return _CANONICAL_ENCODER.encode(payload)
+
+
+class CanonicalSnapshot(dict):
+    """
+    CANONICAL SNAPSHOT
+    ------------------
+    A trace payload plus its canonical encoding, computed ONCE per
+    request and carried through engine, verdict cache and logger.
+
+    - canonical  : encode_canonical(payload)   → cache key, record line
+    - normalized : canonical.lower()           → trace hash input
+    - trace_id() : generate_trace_id(payload, category), hashed from a
+                   precomputed sha256 prefix
+
+    Still a dict (records, sinks and replay see a plain mapping).
+    READ-ONLY after construction: the encoding is not recomputed.
+    """
+
+    __slots__ = ("canonical", "_prefix", "_trace_ids")
+
+    def __init__(self, payload: Dict[str, Any]):
+        super().__init__(payload)
+        self.canonical = encode_canonical(self)
+        self._prefix = None
+        self._trace_ids: Dict[str, str] = {}
+
+    @property
+    def normalized(self) -> str:
+        return self.canonical.lower()
+
+    def trace_id(self, enforcement_category: str) -> str:
+        if not isinstance(enforcement_category, str):
+            # Fail-closed normalization (as generate_trace_id)
+            enforcement_category = str(enforcement_category)
+
+        trace_id = self._trace_ids.get(enforcement_category)
+        if trace_id is None:
+            if self._prefix is None:
+                self._prefix = hashlib.sha256(
+                    (self.normalized + "|").encode("utf-8")
+                )
+            digest = self._prefix.copy()
+            digest.update(
+                f"{enforcement_category.lower()}|{ENGINE_VERSION}".encode("utf-8")
+            )
+            trace_id = self._trace_ids[enforcement_category] = digest.hexdigest()
+        return trace_id
+
+    def __reduce__(self):
+        # Pickles as payload only (the sha256 prefix is not picklable).
+        return (CanonicalSnapshot, (dict(self),))
+
+
 def generate_trace_id(
     input_payload: Dict[str, Any],
     enforcement_category: str,
@@ -28,11 +96,14 @@ def generate_trace_id(
     - enforcement_category MUST be a string
     """
 
+    if isinstance(input_payload, CanonicalSnapshot):
+        return input_payload.trace_id(enforcement_category)
+
     if not isinstance(enforcement_category, str):
         # Fail-closed normalization
         enforcement_category = str(enforcement_category)
 
-    normalized = normalize_input(input_payload)
+    normalized = encode_canonical(input_payload).lower()
     raw = f"{normalized}|{enforcement_category.lower()}|{ENGINE_VERSION}"
 
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
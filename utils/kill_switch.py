@@ -0,0 +1,174 @@
+"""
+SHARED KILL SWITCH
+------------------
+Global kill switch backed by a memory-mapped flag file.
+
+- Every worker process maps the SAME small file (MAP_SHARED): a toggle
+  written by any process is visible to all of them on their next
+  request, without a restart or a config reload
+- engaged() is one byte read from the mapping (no syscall, no lock)
+- The static RUNTIME_CONFIG["kill_switch"] still applies: the switch
+  is engaged if EITHER is set
+- Every toggle is appended to an event log (JSONL), with the actor,
+  reason and the flag generation it produced
+
+Layout (FLAG_FILE_SIZE bytes):
+- byte 0    : 1 = engaged, 0 = released
+- bytes 8-15: generation (uint64 LE), incremented on every toggle
+"""
+
+import fcntl
+import json
+import mmap
+import os
+import struct
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+FLAG_FILE_SIZE = 64
+_GENERATION = struct.Struct("<Q")
+_GENERATION_OFFSET = 8
+
+DEFAULT_FLAG_FILE = "logs/kill_switch.flag"
+DEFAULT_EVENT_LOG = "logs/kill_switch_events.jsonl"
+
+
+def from_config(
+    runtime_config: Dict[str, Any],
+    base_dir: Path,
+    *,
+    static: Optional[bool] = None,
+) -> "SharedKillSwitch":
+    """
+    The deployment's kill switch (paths relative to base_dir).
+
+    static: None → runtime_config["kill_switch"]. The engine passes
+    False and checks the static switch on its active config snapshot.
+    """
+    settings = runtime_config.get("kill_switch_shared") or {}
+    if static is None:
+        static = runtime_config.get("kill_switch") is True
+    return SharedKillSwitch(
+        Path(base_dir) / settings.get("flag_file", DEFAULT_FLAG_FILE),
+        Path(base_dir) / settings.get("event_log", DEFAULT_EVENT_LOG),
+        static=static,
+    )
+
+
+class SharedKillSwitch:
+
+    def __init__(self, flag_file: Path, event_log: Optional[Path] = None, *, static: bool = False):
+        self.flag_file = Path(flag_file)
+        self.event_log = Path(event_log) if event_log is not None else None
+        self.static = static
+        self._toggle_lock = threading.Lock()
+        self._map: Optional[mmap.mmap] = None
+        try:
+            self._map = self._open()
+        except OSError:
+            # No shared flag (e.g. read-only filesystem): the static
+            # config switch alone applies. available() reports this.
+            self._map = None
+
+    # -------------------------------
+    # REQUEST PATH
+    # -------------------------------
+
+    def engaged(self) -> bool:
+        if self.static:
+            return True
+        flag = self._map
+        return flag is not None and flag[0] == 1
+
+    # -------------------------------
+    # CONTROL PATH
+    # -------------------------------
+
+    def set(self, engaged: bool, *, actor: str, reason: str) -> Dict[str, Any]:
+        """
+        Engage / release the shared flag and log the toggle event.
+        Returns the event. Raises OSError if the flag is unavailable.
+        """
+        if self._map is None:
+            raise OSError(f"Kill switch flag unavailable: {self.flag_file}")
+
+        # Toggles are rare: serialized across threads AND processes
+        # (the request path never takes either lock).
+        with self._toggle_lock, self.flag_file.open("rb") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            previous = self._map[0] == 1
+            generation = self.generation() + 1
+            self._map[_GENERATION_OFFSET:_GENERATION_OFFSET + _GENERATION.size] = (
+                _GENERATION.pack(generation)
+            )
+            self._map[0] = 1 if engaged else 0
+            self._map.flush()
+
+            event = {
+                "event": "kill_switch_toggle",
+                "engaged": bool(engaged),
+                "previous": previous,
+                "generation": generation,
+                "actor": actor,
+                "reason": reason,
+                "pid": os.getpid(),
+                "at": datetime.now(timezone.utc).isoformat(),
+            }
+            # Under the lock: the event log is in generation order
+            self._log_event(event)
+
+        return event
+
+    def generation(self) -> int:
+        if self._map is None:
+            return 0
+        return _GENERATION.unpack_from(self._map, _GENERATION_OFFSET)[0]
+
+    def available(self) -> bool:
+        return self._map is not None
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "engaged": self.engaged(),
+            "shared_flag": self._map is not None and self._map[0] == 1,
+            "static_config": self.static,
+            "generation": self.generation(),
+            "flag_file": str(self.flag_file),
+            "available": self.available(),
+        }
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    # -------------------------------
+    # INTERNAL
+    # -------------------------------
+
+    def _open(self) -> mmap.mmap:
+        self.flag_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.flag_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            # Extending with zeros is idempotent: concurrent first
+            # opens all see a released switch.
+            if os.fstat(fd).st_size < FLAG_FILE_SIZE:
+                os.ftruncate(fd, FLAG_FILE_SIZE)
+            return mmap.mmap(fd, FLAG_FILE_SIZE, flags=mmap.MAP_SHARED)
+        finally:
+            os.close(fd)
+
+    def _log_event(self, event: Dict[str, Any]) -> None:
+        if self.event_log is None:
+            return
+        self.event_log.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(event, sort_keys=True, separators=(",", ":")) + "\n"
+        # One O_APPEND write per event: safe across processes
+        fd = os.open(self.event_log, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line.encode("utf-8"))
+            os.fsync(fd)
+        finally:
+            os.close(fd)
@@ -0,0 +1,369 @@
+"""
+IN-PROCESS METRICS
+------------------
+Low-overhead counters and latency histograms for the enforcement
+path, plus Prometheus text exposition (no client library).
+
+Properties:
+- Per-thread shards: a thread only ever writes its own shard
+  (no lock on the hot path); shards are merged on snapshot / scrape
+- Fixed bucket bounds (seconds), Prometheus "le" semantics
+- Stage timing is SAMPLED with a counter (every Nth request):
+  deterministic, no randomness, near-zero cost when not sampled
+- Never part of the trace hash: metrics are observational only
+"""
+
+import itertools
+import math
+import threading
+from bisect import bisect_left
+from time import perf_counter
+from typing import Any, Dict, Hashable, Iterable, List, Sequence, Tuple
+
+# 10µs … 2.5s
+LATENCY_BUCKETS = (
+    0.00001, 0.000025, 0.00005,
+    0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5,
+    1.0, 2.5,
+)
+
+# enforce() stages, in pipeline order
+STAGES = (
+    "canonical_snapshot",
+    "kill_switch",
+    "cache_lookup",
+    "raj_evaluators",
+    "akanksha",
+    "resolution",
+    "trace_id",
+    "verdict",
+    "audit_log",
+)
+
+
+class _Shards:
+    """
+    One fixed-width list of numbers per thread.
+    """
+
+    def __init__(self, width: int):
+        self._width = width
+        self._local = threading.local()
+        self._shards: List[list] = []
+        self._lock = threading.Lock()
+
+    def local(self) -> list:
+        try:
+            return self._local.shard
+        except AttributeError:
+            return self._register()
+
+    def _register(self) -> list:
+        shard = [0] * self._width
+        with self._lock:
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
+
+    def merged(self) -> list:
+        with self._lock:
+            shards = list(self._shards)
+        return [sum(column) for column in zip(*shards)] if shards else [0] * self._width
+
+    def reset(self) -> None:
+        # In place: threads keep their shard references.
+        with self._lock:
+            for shard in self._shards:
+                shard[:] = [0] * self._width
+
+
+class LabeledCounter:
+    """
+    Monotonic counters keyed by a label value (or tuple of values).
+    Each thread owns a {key: count} dict; read with values().
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[Dict[Hashable, float]] = []
+        self._lock = threading.Lock()
+
+    def inc(self, key: Hashable = (), amount: float = 1) -> None:
+        try:
+            counts = self._local.counts
+        except AttributeError:
+            counts = self._register()
+        counts[key] = counts.get(key, 0) + amount
+
+    def values(self) -> Dict[Hashable, float]:
+        with self._lock:
+            shards = list(self._shards)
+        merged: Dict[Hashable, float] = {}
+        for counts in shards:
+            for key, count in list(counts.items()):
+                merged[key] = merged.get(key, 0) + count
+        return merged
+
+    def value(self, key: Hashable = ()) -> float:
+        return self.values().get(key, 0)
+
+    def reset(self) -> None:
+        with self._lock:
+            shards = list(self._shards)
+        for counts in shards:
+            for key in list(counts):
+                counts[key] = 0
+
+    def _register(self) -> Dict[Hashable, float]:
+        counts: Dict[Hashable, float] = {}
+        with self._lock:
+            self._shards.append(counts)
+        self._local.counts = counts
+        return counts
+
+
+def _histogram_snapshot(bounds: Sequence[float], row: list) -> Dict:
+    # row: [bucket counts..., +Inf count, sum]
+    cumulative, buckets = 0, []
+    for bound, count in zip(bounds, row):
+        cumulative += count
+        buckets.append((bound, cumulative))
+    cumulative += row[len(bounds)]
+    buckets.append(("+Inf", cumulative))
+    return {"buckets": buckets, "count": cumulative, "sum": row[-1]}
+
+
+class Histogram:
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.bounds = tuple(sorted(buckets))
+        self._shards = _Shards(len(self.bounds) + 2)
+        self._local = self._shards._local
+
+    def observe(self, value: float) -> None:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._shards._register()
+        shard[bisect_left(self.bounds, value)] += 1
+        shard[-1] += value
+
+    def snapshot(self) -> Dict:
+        return _histogram_snapshot(self.bounds, self._shards.merged())
+
+    def reset(self) -> None:
+        self._shards.reset()
+
+
+class HistogramSet:
+    """
+    Histograms keyed by name (one label), created on first use.
+    Each thread owns a {name: row} dict; observe_many() records a
+    whole request in one pass.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.bounds = tuple(sorted(buckets))
+        self._width = len(self.bounds) + 2
+        self._local = threading.local()
+        self._shards: List[Dict[str, list]] = []
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, value: float) -> None:
+        self.observe_many({name: value})
+
+    def observe_many(self, values: Dict[str, float]) -> None:
+        try:
+            rows = self._local.rows
+        except AttributeError:
+            rows = self._register()
+        bounds = self.bounds
+        for name, value in values.items():
+            row = rows.get(name)
+            if row is None:
+                row = rows[name] = [0] * self._width
+            row[bisect_left(bounds, value)] += 1
+            row[-1] += value
+
+    def snapshot(self) -> Dict[str, Dict]:
+        merged: Dict[str, list] = {}
+        for rows in self._all_rows():
+            for name, row in list(rows.items()):
+                total = merged.setdefault(name, [0] * self._width)
+                for i, value in enumerate(row):
+                    total[i] += value
+        return {
+            name: _histogram_snapshot(self.bounds, row)
+            for name, row in sorted(merged.items())
+        }
+
+    def reset(self) -> None:
+        for rows in self._all_rows():
+            for row in list(rows.values()):
+                row[:] = [0] * self._width
+
+    def _register(self) -> Dict[str, list]:
+        rows: Dict[str, list] = {}
+        with self._lock:
+            self._shards.append(rows)
+        self._local.rows = rows
+        return rows
+
+    def _all_rows(self) -> List[Dict[str, list]]:
+        with self._lock:
+            return list(self._shards)
+
+
+# -------------------------------------------------
+# ENFORCE() STAGE TIMING
+# -------------------------------------------------
+
+class StageTimer:
+    """
+    Timings of ONE sampled request. mark(stage) closes the stage
+    that started at the previous mark.
+    """
+
+    __slots__ = ("stages", "evaluators", "_last")
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self.evaluators: Dict[str, float] = {}
+        self._last = perf_counter()
+
+    def mark(self, stage: str) -> None:
+        now = perf_counter()
+        self.stages[stage] = now - self._last
+        self._last = now
+
+    def evaluator(self, name: str, seconds: float) -> None:
+        self.evaluators[name] = seconds
+
+    def as_trace_field(self) -> Dict[str, int]:
+        """
+        Whole microseconds, for attachment to a trace record.
+        """
+        timings = {stage: int(seconds * 1e6) for stage, seconds in self.stages.items()}
+        timings.update(
+            ("evaluator." + name, int(seconds * 1e6))
+            for name, seconds in self.evaluators.items()
+        )
+        return timings
+
+
+class StageMetrics:
+    """
+    Sampled per-stage / per-evaluator latency histograms.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: float = 0.01,
+        attach_to_trace: bool = True,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        self.sample_rate = float(sample_rate)
+        interval = round(1.0 / self.sample_rate) if self.sample_rate > 0 else 0
+        self.attach_to_trace = attach_to_trace
+        # Every interval-th call is sampled. A C-level iterator: the
+        # unsampled path costs one call and no Python frame.
+        self.sample_next = (
+            itertools.cycle((False,) * (interval - 1) + (True,)).__next__
+            if interval
+            else itertools.repeat(False).__next__
+        )
+        self._sampled = _Shards(1)
+        self._stages = HistogramSet(buckets)
+        self._evaluators = HistogramSet(buckets)
+
+    def record(self, timer: StageTimer) -> None:
+        self._sampled.local()[0] += 1
+        self._stages.observe_many(timer.stages)
+        self._evaluators.observe_many(timer.evaluators)
+
+    def snapshot(self) -> Dict:
+        return {
+            "sample_rate": self.sample_rate,
+            "sampled_requests": self._sampled.merged()[0],
+            "stages": self._stages.snapshot(),
+            "evaluators": self._evaluators.snapshot(),
+        }
+
+    def reset(self) -> None:
+        self._sampled.reset()
+        self._stages.reset()
+        self._evaluators.reset()
+
+
+# -------------------------------------------------
+# PROMETHEUS TEXT EXPOSITION (FORMAT 0.0.4)
+# -------------------------------------------------
+
+EXPOSITION_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Dict[str, Any]
+
+
+class Exposition:
+    """
+    Builds one scrape body, family by family.
+    """
+
+    def __init__(self):
+        self._lines: List[str] = []
+
+    def counter(self, name: str, help_text: str, samples: Iterable[Tuple[Labels, float]]) -> None:
+        self._family(name, "counter", help_text)
+        for labels, value in samples:
+            self._sample(name, labels, value)
+
+    def gauge(self, name: str, help_text: str, samples: Iterable[Tuple[Labels, float]]) -> None:
+        self._family(name, "gauge", help_text)
+        for labels, value in samples:
+            self._sample(name, labels, value)
+
+    def histogram(self, name: str, help_text: str, samples: Iterable[Tuple[Labels, Dict]]) -> None:
+        """
+        samples: (labels, Histogram / HistogramSet snapshot) pairs.
+        """
+        self._family(name, "histogram", help_text)
+        for labels, snapshot in samples:
+            for bound, cumulative in snapshot["buckets"]:
+                le = bound if bound == "+Inf" else _format_value(bound)
+                self._sample(f"{name}_bucket", {**labels, "le": le}, cumulative)
+            self._sample(f"{name}_sum", labels, snapshot["sum"])
+            self._sample(f"{name}_count", labels, snapshot["count"])
+
+    def render(self) -> str:
+        return "\n".join(self._lines) + "\n"
+
+    def _family(self, name: str, kind: str, help_text: str) -> None:
+        self._lines.append(f"# HELP {name} {_escape(help_text, quote=False)}")
+        self._lines.append(f"# TYPE {name} {kind}")
+
+    def _sample(self, name: str, labels: Labels, value: float) -> None:
+        if labels:
+            body = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+            name = f"{name}{{{body}}}"
+        self._lines.append(f"{name} {_format_value(value)}")
+
+
+def _escape(text: str, quote: bool = True) -> str:
+    text = text.replace("\\", "\\\\").replace("\n", "\\n")
+    return text.replace('"', '\\"') if quote else text
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
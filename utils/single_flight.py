@@ -0,0 +1,70 @@
+"""
+SINGLE-FLIGHT
+-------------
+Coalesces concurrent calls that share a key: the first caller (the
+leader) runs the computation, every caller arriving while it is in
+flight waits and receives the SAME result (or the same exception).
+
+Properties:
+- Scope is the in-flight window only: nothing is retained once the
+  leader finishes (the verdict cache handles reuse over time)
+- Thread-safe; waiting callers block on an Event, not a spin
+- A leader failure is delivered to every waiter (fail-closed upstream)
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        (result, shared): shared is True when this caller waited on
+        another caller's computation instead of running fn itself.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result, False
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
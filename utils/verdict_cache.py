@@ -0,0 +1,119 @@
+"""
+VERDICT CACHE
+-------------
+Bounded, in-process cache of deterministic enforcement outcomes.
+
+Properties:
+- Keyed on the canonical trace payload (case-preserving)
+- LRU eviction at max_entries, TTL expiry per entry
+- Invalidated wholesale when the fingerprint (config version +
+  Akanksha validator generation) changes
+- Thread-safe
+- NEVER authoritative: a miss always falls back to full evaluation
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from utils.deterministic_trace import encode_canonical
+
+
+def canonical_cache_key(trace_payload: Dict[str, Any]) -> str:
+    """
+    Canonical, case-preserving encoding of a trace payload.
+
+    NOT lowered (unlike normalize_input): inputs that differ only
+    in case may resolve to different decisions.
+    """
+    return encode_canonical(trace_payload)
+
+
+class VerdictCache:
+    """
+    LRU + TTL cache with hit / miss / eviction counters.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: float = 300.0,
+        clock=time.monotonic,
+    ):
+        self.max_entries = max(int(max_entries), 0)
+        self.ttl_seconds = float(ttl_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._fingerprint: Optional[Hashable] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: str, fingerprint: Hashable) -> Optional[Any]:
+        with self._lock:
+            self._check_fingerprint(fingerprint)
+
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, fingerprint: Hashable, value: Any) -> None:
+        if self.max_entries == 0:
+            return
+
+        with self._lock:
+            self._check_fingerprint(fingerprint)
+
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+    # -------------------------------------------------
+    # INTERNAL
+    # -------------------------------------------------
+
+    def _check_fingerprint(self, fingerprint: Hashable) -> None:
+        # Caller holds the lock.
+        if fingerprint != self._fingerprint:
+            if self._entries:
+                self._entries.clear()
+                self.invalidations += 1
+            self._fingerprint = fingerprint
@@ -17,10 +17,19 @@ Raj decides execution.
 
 import re
 import hashlib
-from typing import Dict, List, Tuple, Optional, Any
+from time import perf_counter
+from typing import Dict, List, Tuple, Optional, Any, Sequence, Set, Union
 from dataclasses import dataclass
 from enum import Enum
 
+from utils.deadline import Deadline
+from utils.metrics import LabeledCounter
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
 
 # ============================================================================
 # ENUMS
@@ -58,6 +67,15 @@ class ReasonCode(str, Enum):
 # VALIDATION RESULT (NON-AUTHORITATIVE)
 # ============================================================================
 
+@dataclass(frozen=True)
+class PatternMatch:
+    decision: Decision
+    category: RiskCategory
+    pattern: str
+    label: str
+    confidence: float
+
+
 @dataclass
 class ValidationResult:
     decision: Decision
@@ -69,6 +87,9 @@ class ValidationResult:
     explanation: str
     original_output: str
     safe_output: str = ""
+    # match_all=True only: EVERY matched pattern, precedence order
+    # (informational; the decision above is unchanged)
+    all_matches: Optional[List[PatternMatch]] = None
 
 
 # ============================================================================
@@ -114,6 +135,330 @@ class PatternLibrary:
     }
 
 
+# Under-age emotional / romantic context (case-sensitive, on lowered text)
+UNDERAGE_EMOTIONAL_PATTERN = r'love|romantic|attached|dependency'
+UNDERAGE_EMOTIONAL_LABEL = "underage_emotional_context"
+
+
+# ============================================================================
+# COMPILED PATTERN LIBRARY (SINGLE PASS)
+# ============================================================================
+
+@dataclass(frozen=True)
+class CompiledPattern:
+    index: int
+    decision: Decision
+    category: RiskCategory
+    pattern: str
+    confidence: float
+    label: str
+    regex: Any
+
+
+# Telemetry bucket of the shared finder pass (never an entry index)
+FINDER_PASS = -1
+
+
+class CompiledPatternLibrary:
+    """
+    PatternLibrary compiled ONCE into a single multi-pattern matcher.
+
+    All patterns are joined into one group-free alternation that walks
+    the text in a single pass and stops only where some pattern starts.
+    At each such position a named-group alternation, anchored there,
+    tells which pattern fired; later patterns starting at the same
+    position are confirmed with the tail of that alternation. The hit
+    set therefore equals running re.search() for every pattern.
+
+    Patterns must not use backreferences (groups are renumbered).
+    """
+
+    def __init__(self, library=PatternLibrary):
+        entries: List[CompiledPattern] = []
+        groups = []
+
+        for decision, table in (
+            (Decision.HARD_DENY, library.HARD_DENY_PATTERNS),
+            (Decision.SOFT_REWRITE, library.SOFT_REWRITE_PATTERNS),
+        ):
+            for category, patterns in table.items():
+                members = []
+                for pattern, confidence, label in patterns:
+                    entry = CompiledPattern(
+                        index=len(entries),
+                        decision=decision,
+                        category=category,
+                        pattern=pattern,
+                        confidence=confidence,
+                        label=label,
+                        regex=re.compile(pattern, re.IGNORECASE),
+                    )
+                    entries.append(entry)
+                    members.append(entry)
+                groups.append((decision, category, tuple(members)))
+
+        self.entries: Tuple[CompiledPattern, ...] = tuple(entries)
+        self.groups = tuple(groups)
+
+        # Under-age context: case-sensitive, and only consulted when the
+        # age gate failed, so it stays out of the shared pass.
+        self.underage = CompiledPattern(
+            index=len(entries),
+            decision=Decision.HARD_DENY,
+            category=RiskCategory.YOUTH_RISK_BEHAVIOR,
+            pattern=UNDERAGE_EMOTIONAL_PATTERN,
+            confidence=98.0,
+            label=UNDERAGE_EMOTIONAL_LABEL,
+            regex=re.compile(UNDERAGE_EMOTIONAL_PATTERN),
+        )
+
+        self._sources = [f"(?:{e.pattern})" for e in self.entries]
+        self._finder = re.compile("|".join(self._sources), re.IGNORECASE)
+        self._tails: Dict[int, Any] = {}
+
+        self.hard_deny_indices = frozenset(
+            [e.index for e in self.entries if e.decision == Decision.HARD_DENY]
+            + [self.underage.index]
+        )
+        # Longest possible match (None if some pattern is unbounded):
+        # how much text a streaming scan must carry between chunks.
+        widths = [_max_width(e.pattern, re.IGNORECASE) for e in self.entries]
+        widths.append(_max_width(UNDERAGE_EMOTIONAL_PATTERN, 0))
+        self.max_width = None if None in widths else max(widths)
+
+    def warm(self) -> "CompiledPatternLibrary":
+        """
+        Compile every tail alternation now instead of on first use:
+        afterwards scan() only reads shared state.
+        """
+        for start in range(len(self.entries)):
+            self._tail(start)
+        return self
+
+    # ------------------------------------------------------------------
+
+    def scan(
+        self,
+        text: str,
+        underage: bool = False,
+        deadline: Optional[Deadline] = None,
+        timings: Optional[Dict[int, float]] = None,
+    ) -> Set[int]:
+        """
+        Return the indices of every entry that matches anywhere in text.
+        With underage=True the under-age context index is included too.
+        deadline is checked at every candidate position (raises
+        DeadlineExceeded).
+        timings (telemetry only): accumulates, per entry index, the
+        seconds spent confirming it at candidate positions, and under
+        FINDER_PASS the seconds of the shared pass itself.
+        """
+        if deadline is not None:
+            deadline.check()
+
+        underage_search = self.underage.regex.search
+        search = self._finder.search
+        if timings is not None:
+            underage_search = _timed(underage_search, timings, self.underage.index)
+            search = _timed(search, timings, FINDER_PASS)
+
+        hits: Set[int] = set()
+        if underage and underage_search(text):
+            hits.add(self.underage.index)
+
+        total = len(self.entries)
+
+        m = search(text)
+        while m is not None:
+            pos = m.start()
+            index = -1
+            while index + 1 < total:
+                if timings is None:
+                    found = self._tail(index + 1).match(text, pos)
+                else:
+                    started = perf_counter()
+                    found = self._tail(index + 1).match(text, pos)
+                    elapsed = perf_counter() - started
+                    # A failed confirm is charged to the last hit; a
+                    # candidate no pattern confirms, to the finder pass
+                    charged = index if found is None else int(found.lastgroup[2:])
+                    timings[charged] = timings.get(charged, 0.0) + elapsed
+                if found is None:
+                    break
+                index = int(found.lastgroup[2:])
+                hits.add(index)
+
+            if deadline is not None:
+                deadline.check()
+            m = search(text, pos + 1)
+
+        return hits
+
+    def scan_window(
+        self,
+        window: str,
+        start: int,
+        final: bool,
+        underage: bool,
+        hits: Set[int],
+    ) -> None:
+        """
+        Incremental form of scan() over one window of a longer text.
+
+        Adds to hits every entry matching at a position >= start
+        (window[start - 1] is real context for \\b). A match is only
+        accepted once the character after it is known (it ends before
+        the window does), unless final: the window ends the text.
+        """
+        limit = len(window)
+
+        if underage:
+            regex = self.underage.regex
+            m = regex.search(window, start)
+            while m is not None:
+                if final or m.end() < limit:
+                    hits.add(self.underage.index)
+                    break
+                m = regex.search(window, m.start() + 1)
+
+        total = len(self.entries)
+        search = self._finder.search
+
+        m = search(window, start)
+        while m is not None:
+            pos = m.start()
+            index = -1
+            while index + 1 < total:
+                found = self._tail(index + 1).match(window, pos)
+                if found is None:
+                    break
+                index = int(found.lastgroup[2:])
+                if final or found.end() < limit:
+                    hits.add(index)
+            m = search(window, pos + 1)
+
+    def all_matches(self, hits: Set[int]) -> List[PatternMatch]:
+        """
+        Every hit as a PatternMatch, in precedence order
+        (under-age context first).
+        """
+        entries = [self.underage] if self.underage.index in hits else []
+        entries.extend(
+            e for _, _, members in self.groups for e in members if e.index in hits
+        )
+        return [
+            PatternMatch(
+                decision=e.decision,
+                category=e.category,
+                pattern=e.pattern,
+                label=e.label,
+                confidence=e.confidence,
+            )
+            for e in entries
+        ]
+
+    def category_matches(self, hits: Set[int]):
+        """
+        Yield (decision, category, matches) in precedence order,
+        matches in library order as (confidence, pattern, label).
+        """
+        for decision, category, members in self.groups:
+            matches = [
+                (e.confidence, e.pattern, e.label)
+                for e in members
+                if e.index in hits
+            ]
+            if matches:
+                yield decision, category, matches
+
+    # ------------------------------------------------------------------
+
+    def _alternation(self, start: int) -> str:
+        return "(?:" + "|".join(
+            f"(?P<_p{i}>{self._sources[i]})"
+            for i in range(start, len(self._sources))
+        ) + ")"
+
+    def _tail(self, start: int):
+        tail = self._tails.get(start)
+        if tail is None:
+            tail = re.compile(self._alternation(start), re.IGNORECASE)
+            self._tails[start] = tail
+        return tail
+
+
+class PatternTelemetry:
+    """
+    Per-pattern hit and latency counters for one compiled library.
+
+    Lock-free on the validation path (per-thread shards, merged on
+    read). Per-pattern latency (confirm_seconds) is the time spent
+    confirming that pattern at the candidate positions of the shared
+    pass. The shared finder pass (the alternation search, plus
+    candidates no pattern confirms) is NOT divided among patterns: it
+    is reported as its own bucket, finder_seconds. scan_seconds is the
+    wall time of whole scans. Entries never hit show up with hits == 0
+    (dead patterns).
+    """
+
+    def __init__(self, library: CompiledPatternLibrary):
+        self.library = library
+        self.hits = LabeledCounter()            # entry index → matches
+        self.confirm_seconds = LabeledCounter()  # entry index / FINDER_PASS → seconds
+        self.scans = LabeledCounter()           # () → scans, "seconds" → seconds
+
+    def record(self, hits: Set[int], timings: Dict[int, float], seconds: float) -> None:
+        for index in hits:
+            self.hits.inc(index)
+        for index, elapsed in timings.items():
+            self.confirm_seconds.inc(index, elapsed)
+        self.scans.inc(())
+        self.scans.inc("seconds", seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        hits = self.hits.values()
+        seconds = self.confirm_seconds.values()
+        scans = self.scans.values()
+        library = self.library
+        return {
+            "scans": scans.get((), 0),
+            "scan_seconds": scans.get("seconds", 0.0),
+            "finder_seconds": seconds.get(FINDER_PASS, 0.0),
+            "patterns": [
+                {
+                    "index": e.index,
+                    "decision": e.decision.value,
+                    "category": e.category.value,
+                    "label": e.label,
+                    "pattern": e.pattern,
+                    "hits": hits.get(e.index, 0),
+                    "confirm_seconds": seconds.get(e.index, 0.0),
+                }
+                for e in library.entries + (library.underage,)
+            ],
+        }
+
+    def reset(self) -> None:
+        self.hits.reset()
+        self.confirm_seconds.reset()
+        self.scans.reset()
+
+
+def _timed(search, timings: Dict[int, float], key: int):
+    def timed(*args):
+        started = perf_counter()
+        try:
+            return search(*args)
+        finally:
+            timings[key] = timings.get(key, 0.0) + perf_counter() - started
+    return timed
+
+
+def _max_width(pattern: str, flags: int) -> Optional[int]:
+    width = sre_parse.parse(pattern, flags).getwidth()[1]
+    return None if width >= sre_parse.MAXREPEAT else width
+
+
 # ============================================================================
 # CONFIDENCE ENGINE (DETERMINISTIC)
 # ============================================================================
@@ -141,12 +486,26 @@ class ConfidenceEngine:
         return min(base, 100.0)
 
 
+DEFAULT_COMPILED_LIBRARY = CompiledPatternLibrary(PatternLibrary)
+
+SAFE_REWRITE_OUTPUT = "Response adjusted for safety."
+HARD_BLOCK_OUTPUT = "I can’t engage with this. Please seek trusted support."
+
+
 # ============================================================================
 # BEHAVIOR VALIDATOR (LIVE AUTHORITY)
 # ============================================================================
 
 class BehaviorValidator:
 
+    def __init__(
+        self,
+        compiled_library: Optional[CompiledPatternLibrary] = None,
+        telemetry: Optional[PatternTelemetry] = None,
+    ):
+        self.compiled_library = compiled_library or DEFAULT_COMPILED_LIBRARY
+        self.telemetry = telemetry
+
     def validate_behavior(
         self,
         intent: str,
@@ -155,52 +514,150 @@ class BehaviorValidator:
         region_rule_status: Optional[Dict],
         platform_policy_state: Optional[Dict],
         karma_bias_input: float,
+        deadline: Optional[Deadline] = None,
+        match_all: bool = False,
     ) -> ValidationResult:
+        """
+        match_all: also report every matched pattern (all_matches),
+        from the same single pass. The decision is unchanged.
+        """
 
         text = conversational_output.lower()
 
         # ------------------------------------------------------------
-        # ABSOLUTE RULE: UNDER-AGE + EMOTIONAL / ROMANTIC = HARD DENY
+        # SINGLE PASS OVER THE COMPILED LIBRARY
         # ------------------------------------------------------------
-        if not age_gate_status:
-            if re.search(r'love|romantic|attached|dependency', text):
-                return self._hard_block(
-                    RiskCategory.YOUTH_RISK_BEHAVIOR,
-                    ["underage_emotional_context"],
-                    conversational_output,
-                    98.0,
-                    "Under-age emotional or romantic dependency detected",
-                )
+        hits = self._scan(text, not age_gate_status, deadline)
 
-        # ------------------------------------------------------------
-        # HARD DENY PATTERNS
-        # ------------------------------------------------------------
-        for category, patterns in PatternLibrary.HARD_DENY_PATTERNS.items():
-            matches = self._find_matches(text, patterns)
-            if matches:
-                return self._build_result(
-                    Decision.HARD_DENY,
-                    category,
-                    matches,
-                    conversational_output,
-                )
+        result = self._decide(hits, text, conversational_output, age_gate_status)
+        if match_all:
+            result.all_matches = self.compiled_library.all_matches(hits)
+        return result
 
-        # ------------------------------------------------------------
-        # SOFT REWRITE PATTERNS
-        # ------------------------------------------------------------
-        for category, patterns in PatternLibrary.SOFT_REWRITE_PATTERNS.items():
-            matches = self._find_matches(text, patterns)
-            if matches:
-                return self._build_result(
-                    Decision.SOFT_REWRITE,
-                    category,
-                    matches,
-                    conversational_output,
-                )
+    def stream(
+        self,
+        intent: str,
+        age_gate_status: bool,
+        region_rule_status: Optional[Dict] = None,
+        platform_policy_state: Optional[Dict] = None,
+        karma_bias_input: float = 0.0,
+    ) -> "ValidationStream":
+        """
+        Incremental validate_behavior() over a streamed
+        conversational_output (see ValidationStream).
+        """
+        return ValidationStream(self, age_gate_status)
+
+    def validate_many(
+        self,
+        texts: Sequence[str],
+        age_gate_status: Union[bool, Sequence[bool]] = True,
+    ) -> "BatchValidation":
+        """
+        Batch validate_behavior() over many conversational outputs.
+
+        Returns compact parallel arrays (decision, category,
+        confidence); element i is identical to the single call on
+        texts[i]. Full ValidationResults are built only on request
+        (BatchValidation.result(i) / results()). Repeated
+        (text, age_gate_status) pairs are scanned once.
+        """
+        texts = list(texts)
+        if isinstance(age_gate_status, bool):
+            gates = [age_gate_status] * len(texts)
+        else:
+            gates = [bool(g) for g in age_gate_status]
+            if len(gates) != len(texts):
+                raise ValueError("age_gate_status must match texts in length")
+
+        batch = BatchValidation(self, texts, gates)
+        scan = self._scan
+        classify = self._classify
+        seen: Dict[Tuple[str, bool], int] = {}
+
+        for i, (text, gate) in enumerate(zip(texts, gates)):
+            first = seen.get((text, gate))
+            if first is None:
+                seen[(text, gate)] = i
+                hits = scan(text.lower(), not gate)
+                decision, category, confidence, matches = classify(hits, text, gate)
+            else:
+                hits = batch.hits[first]
+                decision = batch.decisions[first]
+                category = batch.categories[first]
+                confidence = batch.confidences[first]
+                matches = batch.matches[first]
+            batch.hits.append(hits)
+            batch.decisions.append(decision)
+            batch.categories.append(category)
+            batch.confidences.append(confidence)
+            batch.matches.append(matches)
+
+        return batch
+
+    # =========================================================================
+    # INTERNAL HELPERS
+    # =========================================================================
+
+    def _scan(self, text: str, underage: bool, deadline: Optional[Deadline] = None) -> Set[int]:
+        telemetry = self.telemetry
+        if telemetry is None:
+            return self.compiled_library.scan(text, underage=underage, deadline=deadline)
+
+        timings: Dict[int, float] = {}
+        started = perf_counter()
+        hits = self.compiled_library.scan(
+            text, underage=underage, deadline=deadline, timings=timings
+        )
+        telemetry.record(hits, timings, perf_counter() - started)
+        return hits
+
+    def _decide(
+        self,
+        hits: Set[int],
+        text: str,
+        conversational_output: str,
+        age_gate_status: bool,
+    ) -> ValidationResult:
+        """
+        ValidationResult for the scan hits of conversational_output
+        (text is its lowered form).
+        """
+        decision, category, confidence, matches = self._classify(
+            hits, conversational_output, age_gate_status
+        )
+        return self._result(decision, category, confidence, matches, text, conversational_output)
+
+    def _result(
+        self,
+        decision: Decision,
+        category: RiskCategory,
+        confidence: float,
+        matches: Optional[List[Tuple[float, str, str]]],
+        text: str,
+        conversational_output: str,
+    ) -> ValidationResult:
+        """
+        ValidationResult for a _classify() verdict.
+        """
+        if matches is not None:
+            return self._build_result(
+                decision,
+                category,
+                matches,
+                conversational_output,
+                confidence,
+            )
+
+        if decision == Decision.HARD_DENY:
+            return self._hard_block(
+                RiskCategory.YOUTH_RISK_BEHAVIOR,
+                [UNDERAGE_EMOTIONAL_LABEL],
+                conversational_output,
+                98.0,
+                "Under-age emotional or romantic dependency detected",
+            )
 
-        # ------------------------------------------------------------
-        # CLEAN
-        # ------------------------------------------------------------
         return ValidationResult(
             decision=Decision.ALLOW,
             risk_category=RiskCategory.CLEAN,
@@ -213,20 +670,36 @@ class BehaviorValidator:
             safe_output=conversational_output,
         )
 
-    # =========================================================================
-    # INTERNAL HELPERS
-    # =========================================================================
-
-    def _find_matches(
+    def _classify(
         self,
-        text: str,
-        patterns: List[Tuple[str, float, str]],
-    ) -> List[Tuple[float, str, str]]:
-        return [
-            (confidence, pattern, label)
-            for pattern, confidence, label in patterns
-            if re.search(pattern, text, re.IGNORECASE)
-        ]
+        hits: Set[int],
+        conversational_output: str,
+        age_gate_status: bool,
+    ) -> Tuple[Decision, RiskCategory, float, Optional[List[Tuple[float, str, str]]]]:
+        """
+        (decision, category, confidence, matches): the verdict core
+        shared by every entry point. matches is None for the under-age
+        rule and for clean text.
+        """
+        library = self.compiled_library
+
+        # ------------------------------------------------------------
+        # ABSOLUTE RULE: UNDER-AGE + EMOTIONAL / ROMANTIC = HARD DENY
+        # ------------------------------------------------------------
+        if not age_gate_status and library.underage.index in hits:
+            return Decision.HARD_DENY, RiskCategory.YOUTH_RISK_BEHAVIOR, 98.0, None
+
+        # ------------------------------------------------------------
+        # HARD DENY, THEN SOFT REWRITE (CATEGORY PRECEDENCE)
+        # ------------------------------------------------------------
+        for decision, category, matches in library.category_matches(hits):
+            confidence = ConfidenceEngine.calculate(matches, conversational_output)
+            return decision, category, confidence, matches
+
+        # ------------------------------------------------------------
+        # CLEAN
+        # ------------------------------------------------------------
+        return Decision.ALLOW, RiskCategory.CLEAN, 0.0, None
 
     def _build_result(
         self,
@@ -234,8 +707,10 @@ class BehaviorValidator:
         category: RiskCategory,
         matches: List[Tuple[float, str, str]],
         original_output: str,
+        confidence: Optional[float] = None,
     ) -> ValidationResult:
-        confidence = ConfidenceEngine.calculate(matches, original_output)
+        if confidence is None:
+            confidence = ConfidenceEngine.calculate(matches, original_output)
         return ValidationResult(
             decision=decision,
             risk_category=category,
@@ -245,7 +720,7 @@ class BehaviorValidator:
             matched_patterns=[m[2] for m in matches],
             explanation=f"{len(matches)} {category.value} pattern(s) detected",
             original_output=original_output,
-            safe_output="Response adjusted for safety.",
+            safe_output=SAFE_REWRITE_OUTPUT,
         )
 
     def _hard_block(
@@ -265,9 +740,24 @@ class BehaviorValidator:
             matched_patterns=patterns,
             explanation=explanation,
             original_output=output,
-            safe_output="I can’t engage with this. Please seek trusted support.",
+            safe_output=HARD_BLOCK_OUTPUT,
         )
 
+    @staticmethod
+    def _safe_output(
+        decision: Decision,
+        matches: Optional[List[Tuple[float, str, str]]],
+        original_output: str,
+    ) -> str:
+        """
+        safe_output of the _result() for a _classify() verdict.
+        """
+        if matches is not None:
+            return SAFE_REWRITE_OUTPUT
+        if decision == Decision.HARD_DENY:
+            return HARD_BLOCK_OUTPUT
+        return original_output
+
     def _internal_trace(self, text: str, category: str) -> str:
         raw = f"{text}|{category}|akanksha_v1"
         return hashlib.sha256(raw.encode()).hexdigest()[:16]
@@ -283,3 +773,151 @@ class BehaviorValidator:
             RiskCategory.CLEAN: ReasonCode.CLEAN_CONTENT,
         }
         return mapping.get(category, ReasonCode.CLEAN_CONTENT)
+
+
+# ============================================================================
+# STREAMING VALIDATION (INCREMENTAL)
+# ============================================================================
+
+class ValidationStream:
+    """
+    validate_behavior() over a text stream, one chunk at a time.
+
+    - Matcher state survives chunk boundaries: each chunk is scanned
+      together with the last max_width + 1 characters before it, so a
+      pattern split across chunks is still caught
+    - Scan cost per chunk is O(len(chunk) + max_width), never the
+      whole text so far
+    - feed() returns Decision.HARD_DENY (provisional) as soon as a
+      HARD_DENY pattern is confirmed (one character of lookahead)
+    - finish() returns a ValidationResult identical to
+      validate_behavior() on the concatenated text
+
+    Requires bounded-width patterns (no unbounded repeats).
+    """
+
+    def __init__(self, validator: BehaviorValidator, age_gate_status: bool):
+        library = validator.compiled_library
+        if library.max_width is None:
+            raise ValueError("Streaming validation needs bounded-width patterns")
+
+        self.validator = validator
+        self.age_gate_status = age_gate_status
+        self.hits: Set[int] = set()
+        self.provisional: Optional[Decision] = None
+        self.result: Optional[ValidationResult] = None
+        self.scanned_chars = 0
+
+        self._library = library
+        self._keep = library.max_width + 1
+        self._chunks: List[str] = []
+        self._carry = ""            # lowered tail of the text so far
+        self._at_start = True       # carry begins at the start of the text
+
+    def feed(self, chunk: str) -> Optional[Decision]:
+        """
+        Scan one chunk. Returns the provisional decision (HARD_DENY or None).
+        """
+        if self.result is not None:
+            raise RuntimeError("Validation stream already finished")
+        if chunk:
+            self._chunks.append(chunk)
+            self._scan(self._carry + chunk.lower(), final=False)
+        return self.provisional
+
+    def finish(self) -> ValidationResult:
+        """
+        End of stream: the final result (idempotent).
+        """
+        if self.result is None:
+            self._scan(self._carry, final=True)
+            output = "".join(self._chunks)
+            self.result = self.validator._decide(
+                self.hits, output.lower(), output, self.age_gate_status
+            )
+        return self.result
+
+    def _scan(self, window: str, final: bool) -> None:
+        self._library.scan_window(
+            window,
+            0 if self._at_start else 1,
+            final,
+            not self.age_gate_status,
+            self.hits,
+        )
+        self.scanned_chars += len(window)
+
+        if self.provisional is None and not self.hits.isdisjoint(
+            self._library.hard_deny_indices
+        ):
+            self.provisional = Decision.HARD_DENY
+
+        if len(window) > self._keep:
+            self._carry = window[-self._keep:]
+            self._at_start = False
+        else:
+            self._carry = window
+
+
+# ============================================================================
+# BATCH VALIDATION (COMPACT RESULTS)
+# ============================================================================
+
+class BatchValidation:
+    """
+    Result of BehaviorValidator.validate_many(): parallel arrays, one
+    element per input text. Full ValidationResults on request only.
+    """
+
+    __slots__ = (
+        "decisions",
+        "categories",
+        "confidences",
+        "hits",
+        "matches",
+        "_validator",
+        "_texts",
+        "_gates",
+    )
+
+    def __init__(self, validator: BehaviorValidator, texts: List[str], gates: List[bool]):
+        self.decisions: List[Decision] = []
+        self.categories: List[RiskCategory] = []
+        self.confidences: List[float] = []
+        self.hits: List[Set[int]] = []        # scan hits (shared by duplicates)
+        self.matches: List[Optional[List[Tuple[float, str, str]]]] = []
+        self._validator = validator
+        self._texts = texts
+        self._gates = gates
+
+    def __len__(self) -> int:
+        return len(self.decisions)
+
+    def result(self, i: int) -> ValidationResult:
+        """
+        Element i as the full ValidationResult of validate_behavior().
+        """
+        text = self._texts[i]
+        return self._validator._result(
+            self.decisions[i],
+            self.categories[i],
+            self.confidences[i],
+            self.matches[i],
+            text.lower(),
+            text,
+        )
+
+    def reason_code(self, i: int) -> ReasonCode:
+        """
+        result(i).reason_code, without building the result.
+        """
+        return self._validator._map_reason(self.categories[i])
+
+    def safe_output(self, i: int) -> str:
+        """
+        result(i).safe_output, without building the result.
+        """
+        return self._validator._safe_output(self.decisions[i], self.matches[i], self._texts[i])
+
+    def results(self) -> List[ValidationResult]:
+        return [self.result(i) for i in range(len(self))]
@@ -0,0 +1,202 @@
+"""
+AKANKSHA CONVERSATION STATE
+
+Purpose:
+- Multi-turn escalation signals WITHOUT re-validating the transcript
+- Each turn is scanned ONCE (one pass over the compiled library);
+  only small per-category counters carry over between turns, so a
+  turn costs O(turn length) however long the conversation is
+- State lives in a bounded in-memory store keyed by the caller's
+  opaque conversation handle: LRU at max_conversations, evicted after
+  idle_ttl_seconds without a turn. An evicted conversation restarts
+  from empty state
+- Thread-safe
+
+The per-turn ValidationResult is exactly validate_behavior()'s.
+Signals are informational: Akanksha evaluates risk, Raj decides.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Set, Tuple
+
+from validators.akanksha.behavior_validator import (
+    BehaviorValidator,
+    Decision,
+    RiskCategory,
+    ValidationResult,
+)
+
+
+@dataclass(frozen=True)
+class ConversationSignals:
+    turn: int                                   # 1-based, this turn
+    category_hits: Dict[str, int]               # cumulative pattern hits
+    category_turns: Dict[str, int]              # turns each category fired in
+    risky_turns: int                            # turns not ALLOW
+    consecutive_risky_turns: int
+    escalating_categories: Tuple[str, ...]      # fired in >= threshold turns
+    escalated: bool
+
+
+@dataclass(frozen=True)
+class TurnResult:
+    result: ValidationResult
+    signals: ConversationSignals
+
+
+class _Conversation:
+    __slots__ = (
+        "turns",
+        "category_hits",
+        "category_turns",
+        "risky_turns",
+        "consecutive_risky_turns",
+        "last_seen",
+    )
+
+    def __init__(self, now: float):
+        self.turns = 0
+        self.category_hits: Dict[str, int] = {}
+        self.category_turns: Dict[str, int] = {}
+        self.risky_turns = 0
+        self.consecutive_risky_turns = 0
+        self.last_seen = now
+
+
+class ConversationStore:
+    """
+    Conversation-scoped validation state: bounded LRU + idle expiry.
+    """
+
+    def __init__(
+        self,
+        validator: Optional[BehaviorValidator] = None,
+        *,
+        max_conversations: int = 10000,
+        idle_ttl_seconds: float = 1800.0,
+        escalation_threshold: int = 3,
+        clock=time.monotonic,
+    ):
+        self.validator = validator or BehaviorValidator()
+        self.max_conversations = max(int(max_conversations), 1)
+        self.idle_ttl_seconds = float(idle_ttl_seconds)
+        self.escalation_threshold = max(int(escalation_threshold), 1)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conversations: "OrderedDict[str, _Conversation]" = OrderedDict()
+
+        self.evictions = 0
+        self.expirations = 0
+
+    def validate_turn(
+        self,
+        handle: str,
+        conversational_output: str,
+        age_gate_status: bool,
+    ) -> TurnResult:
+        """
+        Validate one turn and fold it into the conversation's state.
+        """
+
+        # ------------------------------------------------------------
+        # SINGLE PASS OVER THIS TURN ONLY (NO LOCK HELD)
+        # ------------------------------------------------------------
+        validator = self.validator
+        library = validator.compiled_library
+        text = conversational_output.lower()
+        hits = validator._scan(text, not age_gate_status)
+        result = validator._decide(hits, text, conversational_output, age_gate_status)
+        turn_hits = _category_hits(library, hits)
+
+        # ------------------------------------------------------------
+        # FOLD INTO CUMULATIVE STATE (O(categories))
+        # ------------------------------------------------------------
+        with self._lock:
+            conversation = self._touch(handle)
+            conversation.turns += 1
+            for category, count in turn_hits.items():
+                conversation.category_hits[category] = (
+                    conversation.category_hits.get(category, 0) + count
+                )
+                conversation.category_turns[category] = (
+                    conversation.category_turns.get(category, 0) + 1
+                )
+            if result.decision == Decision.ALLOW:
+                conversation.consecutive_risky_turns = 0
+            else:
+                conversation.risky_turns += 1
+                conversation.consecutive_risky_turns += 1
+
+            return TurnResult(result=result, signals=self._signals(conversation))
+
+    def close(self, handle: str) -> None:
+        with self._lock:
+            self._conversations.pop(handle, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "conversations": len(self._conversations),
+                "max_conversations": self.max_conversations,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    # -------------------------------------------------
+    # INTERNAL
+    # -------------------------------------------------
+
+    def _touch(self, handle: str) -> _Conversation:
+        # Caller holds the lock. Least recently used first, so idle
+        # conversations are always at the front.
+        now = self._clock()
+        conversations = self._conversations
+        while conversations:
+            oldest = next(iter(conversations.values()))
+            if now - oldest.last_seen < self.idle_ttl_seconds:
+                break
+            conversations.popitem(last=False)
+            self.expirations += 1
+
+        conversation = conversations.get(handle)
+        if conversation is None:
+            conversation = _Conversation(now)
+            conversations[handle] = conversation
+            while len(conversations) > self.max_conversations:
+                conversations.popitem(last=False)
+                self.evictions += 1
+        else:
+            conversation.last_seen = now
+            conversations.move_to_end(handle)
+        return conversation
+
+    def _signals(self, conversation: _Conversation) -> ConversationSignals:
+        threshold = self.escalation_threshold
+        escalating = tuple(sorted(
+            category
+            for category, turns in conversation.category_turns.items()
+            if turns >= threshold
+        ))
+        return ConversationSignals(
+            turn=conversation.turns,
+            category_hits=dict(conversation.category_hits),
+            category_turns=dict(conversation.category_turns),
+            risky_turns=conversation.risky_turns,
+            consecutive_risky_turns=conversation.consecutive_risky_turns,
+            escalating_categories=escalating,
+            escalated=bool(escalating) or conversation.consecutive_risky_turns >= threshold,
+        )
+
+
+def _category_hits(library, hits: Set[int]) -> Dict[str, int]:
+    counts = {
+        category.value: len(matches)
+        for _, category, matches in library.category_matches(hits)
+    }
+    if library.underage.index in hits:
+        key = RiskCategory.YOUTH_RISK_BEHAVIOR.value
+        counts[key] = counts.get(key, 0) + 1
+    return counts
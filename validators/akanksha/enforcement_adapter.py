@@ -11,8 +11,9 @@ Purpose:
 - NO policy overrides
 """
 
-from typing import Dict
+from typing import Dict, List, Optional
 
+from utils.deadline import Deadline, DeadlineExceeded
 from validators.akanksha.behavior_validator import (
     BehaviorValidator,
     Decision,
@@ -26,16 +27,19 @@ class EnforcementAdapter:
     Raj consumes only mapped output.
     """
 
-    def __init__(self):
+    def __init__(self, validator: Optional[BehaviorValidator] = None):
         # REAL validator instance (no mocks)
-        self.validator = BehaviorValidator()
+        self.validator = validator or BehaviorValidator()
 
-    def validate(self, input_payload) -> Dict:
+    def validate(self, input_payload, deadline: Optional[Deadline] = None) -> Dict:
         """
         Runs Akanksha validator and maps result to Raj format.
 
         ABSOLUTE RULE:
         If Akanksha throws → enforcement MUST FAIL CLOSED.
+
+        An expired deadline propagates as DeadlineExceeded (the engine
+        fails closed with its own reason code).
         """
 
         try:
@@ -51,14 +55,65 @@ class EnforcementAdapter:
                 region_rule_status={"region": input_payload.region_policy},
                 platform_policy_state={"platform": input_payload.platform_policy},
                 karma_bias_input=input_payload.karma_score,
+                deadline=deadline,
             )
 
             return self._map_akanksha_to_raj(verdict)
 
+        except DeadlineExceeded:
+            raise
+
         except Exception:
             # 🔒 FAIL-CLOSED — Akanksha is mandatory
             raise RuntimeError("AKANKSHA_VALIDATION_FAILED")
 
+    def validate_many(self, input_payloads) -> List[Optional[Dict]]:
+        """
+        Batch form of validate(): ONE BehaviorValidator.validate_many()
+        pass (repeated texts scanned once, no per-item ValidationResult).
+
+        Element i is identical to validate(input_payloads[i]).
+        A failing element is returned as None so the caller can
+        FAIL CLOSED for that element only.
+        """
+
+        input_payloads = list(input_payloads)
+        results: List[Optional[Dict]] = [None] * len(input_payloads)
+        positions, texts, gates = [], [], []
+        for position, input_payload in enumerate(input_payloads):
+            try:
+                texts.append(
+                    self._serialize_emotional_output(
+                        input_payload.intent,
+                        input_payload.emotional_output,
+                    )
+                )
+                gates.append(input_payload.age_gate_status == "ALLOWED")
+                positions.append(position)
+            except Exception:
+                continue        # 🔒 FAIL-CLOSED for this element
+
+        try:
+            batch = self.validator.validate_many(texts, gates)
+        except Exception:
+            # Isolate the failing element(s) through the single path
+            for position in positions:
+                try:
+                    results[position] = self.validate(input_payloads[position])
+                except RuntimeError:
+                    pass
+            return results
+
+        for i, position in enumerate(positions):
+            results[position] = self._map_fields(
+                batch.decisions[i],
+                batch.categories[i],
+                batch.confidences[i],
+                batch.reason_code(i),
+                batch.safe_output(i),
+            )
+        return results
+
     @staticmethod
     def _serialize_emotional_output(intent: str, emotional_output: dict) -> str:
         """
@@ -82,11 +137,21 @@ class EnforcementAdapter:
         Akanksha always wins.
         """
 
-        if verdict.decision == Decision.HARD_DENY:
+        return EnforcementAdapter._map_fields(
+            verdict.decision,
+            verdict.risk_category,
+            verdict.confidence,
+            verdict.reason_code,
+            verdict.safe_output,
+        )
+
+    @staticmethod
+    def _map_fields(ak_decision, risk_category, confidence, reason_code, safe_output) -> Dict:
+        if ak_decision == Decision.HARD_DENY:
             decision = "BLOCK"
-        elif verdict.decision == Decision.SOFT_REWRITE:
+        elif ak_decision == Decision.SOFT_REWRITE:
             decision = "REWRITE"
-        elif verdict.decision == Decision.ALLOW:
+        elif ak_decision == Decision.ALLOW:
             decision = "EXECUTE"
         else:
             decision = "BLOCK"  # FAIL-CLOSED SAFETY NET
@@ -99,8 +164,8 @@ class EnforcementAdapter:
             "enforcement_decision": decision,
 
             # 🧾 Metadata (informational only)
-            "risk_category": verdict.risk_category,
-            "confidence": verdict.confidence,
-            "reason_code": verdict.reason_code,
-            "safe_output": verdict.safe_output,
+            "risk_category": risk_category,
+            "confidence": confidence,
+            "reason_code": reason_code,
+            "safe_output": safe_output,
         }
@@ -0,0 +1,119 @@
+"""
+AKANKSHA VALIDATOR LIFECYCLE
+
+Purpose:
+- Build the Akanksha validator ONCE per process, not once per request
+- Warm it before it serves: every pattern tail compiled, then a fixed
+  self-test (one HARD_DENY probe, one clean probe) must pass
+- Share ONE immutable instance across threads: after warm-up a scan
+  only reads compiled state
+- Replace it atomically when the pattern library changes: the new
+  instance is built and warmed aside, then published with a single
+  reference assignment. In-flight requests finish on the old one
+
+FAIL-CLOSED:
+- A build / warm-up failure keeps the active instance
+- With no active instance, current() raises and the engine returns
+  TERMINATE (AKANKSHA_VALIDATION_FAILED)
+"""
+
+import threading
+from typing import Optional
+
+from validators.akanksha.behavior_validator import (
+    DEFAULT_COMPILED_LIBRARY,
+    BehaviorValidator,
+    CompiledPatternLibrary,
+    Decision,
+    PatternLibrary,
+    PatternTelemetry,
+)
+from validators.akanksha.enforcement_adapter import EnforcementAdapter
+
+# Warm-up probes: (text, age_gate_status, expected decision)
+SELF_TEST = (
+    ("intent: i want to die | tone: neutral | dependency_score: 0.0", True, Decision.HARD_DENY),
+    ("intent: hello | tone: neutral | dependency_score: 0.0", True, Decision.ALLOW),
+)
+
+
+def build_adapter(library=PatternLibrary) -> EnforcementAdapter:
+    """
+    A warmed, self-tested adapter for library, with per-pattern
+    telemetry (self-test scans not counted). Raises on any failure.
+    """
+    compiled = (
+        DEFAULT_COMPILED_LIBRARY
+        if library is PatternLibrary
+        else CompiledPatternLibrary(library)
+    )
+
+    validator = BehaviorValidator(compiled.warm())
+    for text, age_gate_status, expected in SELF_TEST:
+        result = validator.validate_behavior(
+            intent="self-test",
+            conversational_output=text,
+            age_gate_status=age_gate_status,
+            region_rule_status=None,
+            platform_policy_state=None,
+            karma_bias_input=0.0,
+        )
+        if result.decision != expected:
+            raise RuntimeError(
+                f"Akanksha self-test failed: {result.decision.value} != {expected.value}"
+            )
+
+    return EnforcementAdapter(BehaviorValidator(compiled, PatternTelemetry(compiled)))
+
+
+class ValidatorManager:
+    """
+    Owns the process's long-lived EnforcementAdapter.
+    """
+
+    def __init__(self, library=PatternLibrary):
+        self.generation = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        self.adapter: Optional[EnforcementAdapter] = None
+        self._install_lock = threading.Lock()
+        self.install(library)
+
+    # -------------------------------
+    # REQUEST PATH
+    # -------------------------------
+
+    def current(self) -> EnforcementAdapter:
+        adapter = self.adapter        # one reference load
+        if adapter is None:
+            raise RuntimeError("AKANKSHA_VALIDATION_FAILED")
+        return adapter
+
+    # -------------------------------
+    # CONTROL PATH
+    # -------------------------------
+
+    def install(self, library=PatternLibrary) -> bool:
+        """
+        Build, warm and publish a validator for library. On failure
+        the active instance stays. MUST NEVER throw.
+        """
+        with self._install_lock:
+            try:
+                adapter = build_adapter(library)
+            except Exception as exc:
+                self.failures += 1
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                return False
+
+            self.adapter = adapter        # atomic publication
+            self.generation += 1          # after the adapter: verdict cache key
+            self.last_error = None
+            return True
+
+    def ready(self) -> bool:
+        return self.adapter is not None
+
+    def telemetry(self) -> Optional[PatternTelemetry]:
+        adapter = self.adapter
+        return adapter.validator.telemetry if adapter is not None else None